@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Сравнение холодной и прогретой компиляции программ учеников
+
+Холодная - новый процесс frontend_server на каждую программу (загрузка SDK
+каждый раз), прогретая - один долгоживущий процесс, перекомпилирующий
+только файл программы. Запуск: python benchmark_compiler.py [повторов]
+"""
+
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from config import Config
+from execution.compiler import IncrementalCompiler, frontend_server_command
+
+PROGRAMS = [
+    """void main() {
+  print('Привет, CodeAcademy Pro!');
+}
+""",
+    """void main() {
+  var numbers = [5, 3, 8, 1];
+  numbers.sort();
+  for (var n in numbers) {
+    print('Число: $n');
+  }
+}
+""",
+    """class Animal {
+  final String name;
+  Animal(this.name);
+  String speak() => '$name издает звук';
+}
+
+class Dog extends Animal {
+  Dog(String name) : super(name);
+  @override
+  String speak() => '$name лает';
+}
+
+void main() {
+  final animals = <Animal>[Animal('Кот'), Dog('Шарик')];
+  animals.map((a) => a.speak()).forEach(print);
+}
+""",
+    """import 'dart:async';
+
+Future<String> fetch(int id) async {
+  await Future.delayed(Duration(milliseconds: 1));
+  return 'Пользователь $id';
+}
+
+void main() async {
+  final users = await Future.wait([1, 2, 3].map(fetch));
+  print(users.join(', '));
+}
+""",
+]
+
+
+def measure(compiler, source, output_path):
+    started = time.perf_counter()
+    errors, diagnostics = compiler.compile(source, output_path)
+    elapsed = (time.perf_counter() - started) * 1000
+    if errors:
+        raise RuntimeError(f'Ошибка компиляции:\n{diagnostics}')
+    return elapsed
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"{name:<12} n={len(samples):<4} медиана={statistics.median(samples):8.1f} мс  "
+          f"p95={p95:8.1f} мс  мин={samples[0]:8.1f} мс")
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    dart_path = Config.DART_PATH
+    if frontend_server_command(dart_path) is None:
+        print(f"frontend_server не найден: проверьте DART_PATH ({dart_path})")
+        return 1
+
+    workdir = tempfile.mkdtemp(prefix='compile-bench-')
+    output_path = os.path.join(workdir, 'out.dill')
+    try:
+        cold = []
+        for i in range(repeats):
+            for j, source in enumerate(PROGRAMS):
+                compiler = IncrementalCompiler(dart_path, os.path.join(workdir, f'cold-{i}-{j}'))
+                compiler.start()
+                try:
+                    cold.append(measure(compiler, source, output_path))
+                finally:
+                    compiler.stop()
+
+        compiler = IncrementalCompiler(dart_path, os.path.join(workdir, 'warm'))
+        compiler.start()
+        try:
+            compiler.warm_up()
+            warm = [measure(compiler, source, output_path)
+                    for _ in range(repeats) for source in PROGRAMS]
+        finally:
+            compiler.stop()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"Dart: {dart_path}, программ: {len(PROGRAMS)}, повторов: {repeats}")
+    report('холодная', cold)
+    report('прогретая', warm)
+    print(f"Ускорение по медиане: {statistics.median(cold) / statistics.median(warm):.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,7 +5,108 @@ class Config:
     """Базовая конфигурация"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    
+
+    # Выполнение Dart кода
+    DART_PATH = os.environ.get('DART_PATH') or 'dart'
+    # Количество прогретых рабочих процессов Dart (0 - по числу ядер на процесс веб-сервера)
+    DART_WORKERS = int(os.environ.get('DART_WORKERS') or 0)
+    # Запускать рабочие процессы сразу при старте приложения
+    DART_PREWARM = os.environ.get('DART_PREWARM', '1') != '0'
+    # Ограничение времени выполнения одной программы (секунды)
+    DART_EXECUTION_TIMEOUT = float(os.environ.get('DART_EXECUTION_TIMEOUT') or 10)
+    # Сколько ждать свободный рабочий процесс (секунды)
+    DART_ACQUIRE_TIMEOUT = float(os.environ.get('DART_ACQUIRE_TIMEOUT') or 5)
+    # Перезапуск рабочего процесса после N программ (защита от утечек памяти VM)
+    DART_WORKER_MAX_JOBS = int(os.environ.get('DART_WORKER_MAX_JOBS') or 200)
+    # Лимит старого поколения кучи Dart VM (МБ)
+    DART_WORKER_HEAP_MB = int(os.environ.get('DART_WORKER_HEAP_MB') or 256)
+    # Префикс команды для запуска в песочнице (например: "nsjail --config dart.cfg --")
+    DART_SANDBOX_COMMAND = os.environ.get('DART_SANDBOX_COMMAND', '')
+    # Без песочницы код учеников имеет полный доступ к dart:io (файлы, процессы)
+    # от имени веб-приложения, поэтому локальный Dart без нее не включается.
+    # 1 - разрешить без песочницы (только для локальной разработки)
+    DART_ALLOW_UNSANDBOXED = os.environ.get('DART_ALLOW_UNSANDBOXED', '0') != '0'
+    # Долгоживущий инкрементальный компилятор (frontend_server) на каждый
+    # рабочий процесс: SDK загружается один раз, компилируется только программа
+    DART_INCREMENTAL_COMPILER = os.environ.get('DART_INCREMENTAL_COMPILER', '1') != '0'
+    # Каталог kernel-снапшотов шаблонов уроков (пересборка: flask build-snapshots)
+    DART_SNAPSHOT_DIR = os.environ.get('DART_SNAPSHOT_DIR') or \
+        os.path.join(os.path.abspath(os.path.dirname(__file__)), 'instance', 'snapshots')
+    # Жесткие ограничения: процессорное время на программу (секунды), адресное
+    # пространство VM (МБ), число процессов (0 - без ограничения, включайте при
+    # отдельном пользователе), размер записываемого файла (МБ), вывод программы (КБ)
+    DART_CPU_SECONDS = float(os.environ.get('DART_CPU_SECONDS') or 5)
+    DART_MAX_ADDRESS_SPACE_MB = int(os.environ.get('DART_MAX_ADDRESS_SPACE_MB') or 4096)
+    DART_MAX_PROCESSES = int(os.environ.get('DART_MAX_PROCESSES') or 0)
+    DART_MAX_FILE_MB = int(os.environ.get('DART_MAX_FILE_MB') or 16)
+    DART_MAX_OUTPUT_KB = int(os.environ.get('DART_MAX_OUTPUT_KB') or 64)
+
+    # Бэкенд выполнения: auto (Dart, если установлен, иначе имитация), local,
+    # remote или simulator; запасные бэкенды через запятую (например: local,simulator)
+    EXECUTION_BACKEND = os.environ.get('EXECUTION_BACKEND') or 'auto'
+    EXECUTION_FALLBACK_BACKEND = os.environ.get('EXECUTION_FALLBACK_BACKEND', '')
+    # Простые программы (первые уроки) выполнять встроенным интерпретатором без Dart
+    EXECUTION_INTERPRETER = os.environ.get('EXECUTION_INTERPRETER', '1') != '0'
+    # Удаленный сервис выполнения с API в стиле JDoodle
+    REMOTE_EXECUTION_URL = os.environ.get('REMOTE_EXECUTION_URL') or 'https://api.jdoodle.com/v1/execute'
+    REMOTE_EXECUTION_CLIENT_ID = os.environ.get('REMOTE_EXECUTION_CLIENT_ID', '')
+    REMOTE_EXECUTION_CLIENT_SECRET = os.environ.get('REMOTE_EXECUTION_CLIENT_SECRET', '')
+    REMOTE_EXECUTION_VERSION_INDEX = os.environ.get('REMOTE_EXECUTION_VERSION_INDEX', '')
+    REMOTE_EXECUTION_TIMEOUT = float(os.environ.get('REMOTE_EXECUTION_TIMEOUT') or 15)
+    REMOTE_EXECUTION_RETRIES = int(os.environ.get('REMOTE_EXECUTION_RETRIES') or 2)
+    REMOTE_EXECUTION_POOL_SIZE = int(os.environ.get('REMOTE_EXECUTION_POOL_SIZE') or 10)
+    # Размыкатель: сбоев подряд до отключения и пауза перед пробным запросом (секунды)
+    REMOTE_EXECUTION_BREAKER_FAILURES = int(os.environ.get('REMOTE_EXECUTION_BREAKER_FAILURES') or 5)
+    REMOTE_EXECUTION_BREAKER_RESET = float(os.environ.get('REMOTE_EXECUTION_BREAKER_RESET') or 30)
+
+    # Кеш результатов выполнения (ключ - хеш нормализованного кода)
+    EXECUTION_CACHE_MAX_MB = int(os.environ.get('EXECUTION_CACHE_MAX_MB') or 32)
+    EXECUTION_CACHE_TTL = int(os.environ.get('EXECUTION_CACHE_TTL') or 3600)
+    EXECUTION_CACHE_MAX_ENTRIES = int(os.environ.get('EXECUTION_CACHE_MAX_ENTRIES') or 10000)
+
+    # Асинхронные задания: потоки-исполнители (0 - по размеру пула Dart),
+    # размер очереди и время хранения результата (секунды)
+    EXECUTION_JOB_WORKERS = int(os.environ.get('EXECUTION_JOB_WORKERS') or 0)
+    EXECUTION_QUEUE_SIZE = int(os.environ.get('EXECUTION_QUEUE_SIZE') or 64)
+    EXECUTION_JOB_TTL = int(os.environ.get('EXECUTION_JOB_TTL') or 300)
+    # Сколько секунд /api/jobs ждет результат, прежде чем вернуть задание для
+    # опроса: шаблоны, кеш и интерпретатор отвечают сразу, без опроса
+    EXECUTION_JOB_INLINE_WAIT = float(os.environ.get('EXECUTION_JOB_INLINE_WAIT') or 0.2)
+    # Потоковый вывод заданий (SSE): каждый открытый поток держит обработчик
+    # запросов до конца программы, поэтому включайте только с потоковыми или
+    # асинхронными воркерами (gunicorn --threads N, gevent); иначе - опрос
+    EXECUTION_STREAMING = os.environ.get('EXECUTION_STREAMING', '0') != '0'
+
+    # Пакетное выполнение: программ в одном запросе и параллельных потоков
+    # (0 - по размеру пула Dart). Каждая программа списывается из корзины
+    # лимита, поэтому пакет больше RATELIMIT_USER_BURST (для анонимов -
+    # RATELIMIT_IP_BURST) отклоняется целиком
+    EXECUTION_BATCH_MAX_PROGRAMS = int(os.environ.get('EXECUTION_BATCH_MAX_PROGRAMS') or 50)
+    EXECUTION_BATCH_WORKERS = int(os.environ.get('EXECUTION_BATCH_WORKERS') or 0)
+
+    # Каталог с уроками курса и как часто проверять изменения их файлов
+    # (секунды, 0 - прочитать один раз при старте)
+    LESSONS_DIR = os.environ.get('LESSONS_DIR') or \
+        os.path.join(os.path.abspath(os.path.dirname(__file__)), 'lessons')
+    LESSONS_RELOAD_INTERVAL = float(os.environ.get('LESSONS_RELOAD_INTERVAL') or 2)
+
+    # Токен для /metrics (пусто - метрики открыты всем)
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+    # Ограничение частоты запусков кода (token bucket): пополнение в минуту и
+    # размер корзины. Лимит по IP мягче: весь класс может выходить через один NAT
+    RATELIMIT_ENABLED = os.environ.get('RATELIMIT_ENABLED', '1') != '0'
+    # Сколько доверенных прокси (nginx, балансировщик) стоит перед приложением:
+    # адрес клиента для лимитов берется из X-Forwarded-For через столько
+    # звеньев. 0 - заголовок не читается (иначе его может подделать клиент)
+    PROXY_FIX_X_FOR = int(os.environ.get('PROXY_FIX_X_FOR') or 0)
+    RATELIMIT_USER_PER_MINUTE = float(os.environ.get('RATELIMIT_USER_PER_MINUTE') or 30)
+    RATELIMIT_USER_BURST = int(os.environ.get('RATELIMIT_USER_BURST') or 10)
+    RATELIMIT_IP_PER_MINUTE = float(os.environ.get('RATELIMIT_IP_PER_MINUTE') or 300)
+    RATELIMIT_IP_BURST = int(os.environ.get('RATELIMIT_IP_BURST') or 60)
+    # memory:// - отдельно в каждом процессе; redis://host:6379/0 - общее хранилище
+    RATELIMIT_STORAGE_URL = os.environ.get('RATELIMIT_STORAGE_URL') or 'memory://'
+
 class DevelopmentConfig(Config):
     """Конфигурация для разработки"""
     DEBUG = True
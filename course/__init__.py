@@ -0,0 +1,6 @@
+"""Материалы курса и проверка решений учеников"""
+from course.catalog import LessonCatalog
+from course.grading import Grader
+from course.search import SearchIndex
+
+__all__ = ['Grader', 'LessonCatalog', 'SearchIndex']
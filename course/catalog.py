@@ -0,0 +1,293 @@
+"""Каталог уроков: читается из файлов и отдается готовыми байтами.
+
+Каждый урок - отдельный каталог в lessons/ (порядок курса - порядок имен):
+lesson.json с полями урока, theory.md с теорией и template.dart с шаблоном
+кода. Файлы урока перечитываются, только когда меняется их mtime или
+размер, и вместе с уроком пересобираются только его производные: JSON урока
+и его фрагменты в общем списке и в оглавлении. Сериализация и сжатие
+выполняются лениво, при первом запросе.
+
+Готовый JSON хранится вместе со сжатыми вариантами (gzip и, если установлен
+пакет brotli, br); у каждого варианта свой сильный ETag, ведь это разные
+байты. Ответ на запрос - выбор готового варианта или 304 Not Modified.
+"""
+import copy
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from types import MappingProxyType
+
+from course.markdown import render_markdown
+
+try:
+    import brotli
+except ImportError:  # brotli необязателен: без него отдаются gzip и несжатый JSON
+    brotli = None
+
+LESSON_FILE = 'lesson.json'
+# Длинные тексты урока лежат в отдельных файлах, чтобы их было удобно править
+TEXT_FILES = (('theory', 'theory.md'), ('code_template', 'template.dart'))
+
+# Суффиксы ETag сжатых вариантов: "<хеш>-gz" и "<хеш>-br"
+ETAG_SUFFIXES = {'br': '-br', 'gzip': '-gz', 'identity': ''}
+
+# Поля урока, которые попадают в оглавление
+INDEX_FIELDS = ('id', 'title', 'category', 'difficulty')
+
+
+def freeze(value):
+    """Неизменяемая копия: словари -> MappingProxyType, списки -> кортежи"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def dump(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def read_lesson(path):
+    """Урок из каталога path: lesson.json плюс тексты из отдельных файлов"""
+    with open(os.path.join(path, LESSON_FILE), encoding='utf-8') as f:
+        lesson = json.load(f)
+    for field, name in TEXT_FILES:
+        file_path = os.path.join(path, name)
+        if os.path.exists(file_path):
+            # Текст читается как есть: от него зависит хеш шаблона
+            with open(file_path, encoding='utf-8', newline='') as f:
+                lesson[field] = f.read()
+    return lesson
+
+
+def file_signature(path):
+    """mtime и размер файлов урока; изменение любого - повод перечитать урок"""
+    signature = []
+    for name in (LESSON_FILE,) + tuple(name for _, name in TEXT_FILES):
+        try:
+            stat = os.stat(os.path.join(path, name))
+        except FileNotFoundError:
+            signature.append(None)
+        else:
+            signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def lesson_detail(lesson):
+    """Урок для страницы: теория уже отрендерена в безопасный HTML.
+
+    Исходный Markdown в ответ не попадает - клиенту он не нужен.
+    """
+    detail = dict(lesson)
+    theory = detail.pop('theory', None)
+    if theory:
+        detail['theory_html'] = render_markdown(theory)
+    return detail
+
+
+class SerializedJSON:
+    """Готовое тело JSON-ответа и его сжатые варианты, у каждого свой ETag"""
+
+    def __init__(self, body):
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        # Порядок - предпочтение сервера при равном качестве у клиента
+        encodings = {}
+        if brotli is not None:
+            encodings['br'] = brotli.compress(body, quality=11)
+        encodings['gzip'] = gzip.compress(body, compresslevel=9, mtime=0)
+        encodings['identity'] = body
+        self.encodings = MappingProxyType(encodings)
+        self.etags = MappingProxyType({encoding: digest + ETAG_SUFFIXES[encoding] for encoding in encodings})
+
+    @classmethod
+    def of(cls, data):
+        return cls(dump(data))
+
+    @classmethod
+    def of_parts(cls, parts):
+        """JSON-массив из уже сериализованных элементов"""
+        return cls(b'[' + b','.join(parts) + b']')
+
+    @property
+    def body(self):
+        return self.encodings['identity']
+
+
+class LessonEntry:
+    """Один урок и его производные; JSON собирается при первом обращении"""
+
+    def __init__(self, path, signature):
+        self.signature = signature
+        self.source = read_lesson(path)
+        self.id = str(self.source['id'])
+        self.lesson = freeze(self.source)
+        self._detail = None
+        self._full_part = None
+        self._index_part = None
+
+    @property
+    def detail(self):
+        if self._detail is None:
+            self._detail = SerializedJSON.of(lesson_detail(self.source))
+        return self._detail
+
+    @property
+    def full_part(self):
+        if self._full_part is None:
+            self._full_part = dump(self.source)
+        return self._full_part
+
+    @property
+    def index_part(self):
+        if self._index_part is None:
+            self._index_part = dump({field: self.source.get(field) for field in INDEX_FIELDS})
+        return self._index_part
+
+
+class CatalogState:
+    """Уроки в порядке курса и собранные из них списки; не меняется после создания"""
+
+    def __init__(self, entries):
+        self.entries = entries  # имя каталога урока -> LessonEntry
+        self.ordered = tuple(entries[name] for name in sorted(entries))
+        self.by_id = {entry.id: entry for entry in self.ordered}
+        self._full = None
+        self._index = None
+
+    @property
+    def full(self):
+        if self._full is None:
+            self._full = SerializedJSON.of_parts([entry.full_part for entry in self.ordered])
+        return self._full
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = SerializedJSON.of_parts([entry.index_part for entry in self.ordered])
+        return self._index
+
+
+class LessonCatalog:
+    """Уроки курса из каталога directory с перечитыванием измененных файлов.
+
+    refresh() сверяет файлы не чаще раза в reload_interval секунд (0 - уроки
+    читаются один раз при старте). Подписчики получают id измененных, новых
+    и удаленных уроков; on_error(имя каталога, исключение) - о файлах, которые
+    не удалось прочитать при обновлении (при старте ошибка пробрасывается).
+    """
+
+    def __init__(self, directory, reload_interval=0, on_error=None):
+        self.directory = directory
+        self.reload_interval = reload_interval
+        self.version = 0
+        self.on_error = on_error
+        self._failed = {}  # каталог урока -> подпись файлов, которые не удалось прочитать
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._state = CatalogState({})
+        self._checked = time.monotonic()
+        self._scan(initial=True)
+
+    def _scan(self, initial=False):
+        """Перечитывает изменившиеся уроки; возвращает id затронутых уроков.
+
+        Ошибка чтения пробрасывается только при первой загрузке; при
+        обновлении урок с ошибкой пропускается (или остается в прежней
+        версии), а остальной каталог продолжает работать.
+        """
+        previous = self._state.entries
+        entries = {}
+        changed = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if not os.path.isfile(os.path.join(path, LESSON_FILE)):
+                continue
+            signature = file_signature(path)
+            entry = previous.get(name)
+            if entry is not None and entry.signature == signature:
+                entries[name] = entry
+                continue
+            # Эти файлы уже не удалось прочитать: ждем, пока они снова изменятся
+            if self._failed.get(name) == signature:
+                if entry is not None:
+                    entries[name] = entry
+                continue
+            try:
+                fresh = LessonEntry(path, signature)
+            except (OSError, ValueError, KeyError, TypeError) as exc:
+                if initial:
+                    raise
+                # Каталог скопирован наполовину или файл сохранен с ошибкой:
+                # отдается прежняя версия урока, новый урок пока не появляется
+                self._failed[name] = signature
+                if self.on_error is not None:
+                    self.on_error(name, exc)
+                if entry is not None:
+                    entries[name] = entry
+                continue
+            self._failed.pop(name, None)
+            if entry is not None:
+                changed.append(entry.id)
+            changed.append(fresh.id)
+            entries[name] = fresh
+        changed.extend(entry.id for name, entry in previous.items() if name not in entries)
+        if not changed:
+            return []
+        # Состояние подменяется целиком, поэтому чтение идет без блокировки
+        self._state = CatalogState(entries)
+        self.version += 1
+        return list(dict.fromkeys(changed))
+
+    def refresh(self, force=False):
+        """Проверяет файлы уроков; возвращает id изменившихся уроков"""
+        if not force and (not self.reload_interval
+                          or time.monotonic() - self._checked < self.reload_interval):
+            return []
+        with self._lock:
+            self._checked = time.monotonic()
+            try:
+                changed = self._scan()
+            except OSError as exc:
+                # Каталог уроков недоступен (например, его заменяют при выкладке)
+                if self.on_error is not None:
+                    self.on_error(self.directory, exc)
+                return []
+        if changed:
+            for listener in self._listeners:
+                listener(changed)
+        return changed
+
+    def subscribe(self, listener):
+        """listener(changed_ids) вызывается после каждого изменения уроков"""
+        self._listeners.append(listener)
+
+    @property
+    def lessons(self):
+        return tuple(entry.lesson for entry in self._state.ordered)
+
+    def lesson(self, lesson_id):
+        entry = self._state.by_id.get(str(lesson_id))
+        return entry.lesson if entry is not None else None
+
+    def load(self):
+        """Изменяемая копия уроков (например, для передачи в другие процессы)"""
+        return [copy.deepcopy(entry.source) for entry in self._state.ordered]
+
+    def detail(self, lesson_id):
+        entry = self._state.by_id.get(str(lesson_id))
+        return entry.detail if entry is not None else None
+
+    @property
+    def full(self):
+        return self._state.full
+
+    @property
+    def index(self):
+        return self._state.index
+
+    def __len__(self):
+        return len(self._state.ordered)
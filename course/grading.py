@@ -0,0 +1,70 @@
+"""Проверка решений: вывод программы сравнивается с expected_output урока.
+
+Сравнение нечувствительно к концам строк, пробелам по краям и внутри строк
+и пустым строкам. Строки сравниваются по хешам; при несовпадении diff по
+хешам находит первое расхождение, которое показывается ученику.
+"""
+from difflib import SequenceMatcher
+
+
+def normalize_output(text):
+    """Непустые строки вывода с нормализованными пробелами"""
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    lines = (' '.join(line.split()) for line in text.split('\n'))
+    return [line for line in lines if line]
+
+
+def decode_expected(text):
+    """В части уроков переводы строк записаны в expected_output как \\n"""
+    if '\n' not in text and '\\n' in text:
+        text = text.replace('\\n', '\n')
+    return text
+
+
+class Grader:
+    """Ожидаемый вывод уроков, разобранный один раз при старте"""
+
+    def __init__(self, lessons):
+        self._expected = {}  # id урока -> (строки, хеши строк)
+        for lesson in lessons:
+            expected = lesson.get('expected_output')
+            if not expected:
+                continue
+            lines = normalize_output(decode_expected(expected))
+            self._expected[str(lesson['id'])] = (lines, [hash(line) for line in lines])
+
+    def has_expected(self, lesson_id):
+        return lesson_id is not None and str(lesson_id) in self._expected
+
+    def grade(self, lesson_id, output):
+        """Вердикт для вывода программы; None, если у урока нет ожидаемого вывода"""
+        expected = self._expected.get(str(lesson_id)) if lesson_id is not None else None
+        if expected is None:
+            return None
+        expected_lines, expected_hashes = expected
+        actual_lines = normalize_output(output or '')
+        actual_hashes = [hash(line) for line in actual_lines]
+        verdict = {
+            'passed': actual_hashes == expected_hashes,
+            'expected_lines': len(expected_lines),
+            'actual_lines': len(actual_lines),
+        }
+        if verdict['passed']:
+            return verdict
+
+        matcher = SequenceMatcher(None, expected_hashes, actual_hashes, autojunk=False)
+        different = 0
+        mismatch = None
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                continue
+            different += max(i2 - i1, j2 - j1)
+            if mismatch is None:
+                mismatch = {
+                    'line': i1 + 1,
+                    'expected': expected_lines[i1] if i1 < i2 else None,
+                    'actual': actual_lines[j1] if j1 < j2 else None,
+                }
+        verdict['different_lines'] = different
+        verdict['mismatch'] = mismatch
+        return verdict
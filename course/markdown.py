@@ -0,0 +1,144 @@
+"""Рендер теории уроков из Markdown в HTML на сервере.
+
+Поддерживается то подмножество, которым написана теория: заголовки,
+абзацы, маркированные и нумерованные списки, цитаты, горизонтальная линия,
+блоки кода с языком, `код`, **жирный**, *курсив* и [ссылки](url).
+Безопасность обеспечивается построением: весь текст экранируется до
+разметки, сырой HTML не пропускается, а ссылки допускаются только на
+http(s), mailto и относительные адреса.
+"""
+import re
+from functools import lru_cache
+from html import escape, unescape
+
+FENCE_RE = re.compile(r'^\s*(```|~~~)\s*([\w+-]*)\s*$')
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+RULE_RE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+BULLET_RE = re.compile(r'^\s*[-*+]\s+(.*)$')
+ORDERED_RE = re.compile(r'^\s*(\d+)[.)]\s+(.*)$')
+QUOTE_RE = re.compile(r'^\s*>\s?(.*)$')
+
+CODE_SPAN_RE = re.compile(r'(`+)(.+?)\1')
+LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)\s]+)\)')
+BOLD_RE = re.compile(r'(\*\*|__)(?=\S)(.+?)(?<=\S)\1')
+ITALIC_RE = re.compile(r'(?<![\w*])\*(?=[^\s*])(.+?)(?<=[^\s*])\*(?![\w*])|(?<!\w)_(?=\S)(.+?)(?<=\S)_(?!\w)')
+SAFE_URL_RE = re.compile(r'^(https?://|mailto:|/|#|\./|\.\./|[\w.-]+(/|$))', re.IGNORECASE)
+
+# Сколько разных текстов держать в кеше (ключ - сам текст, то есть версия содержимого)
+CACHE_SIZE = 1024
+
+
+def _emphasis(text):
+    text = BOLD_RE.sub(lambda m: f'<strong>{m.group(2)}</strong>', text)
+    return ITALIC_RE.sub(lambda m: f'<em>{m.group(1) or m.group(2)}</em>', text)
+
+
+def render_inline(text):
+    """Строчная разметка; text еще не экранирован"""
+    spans = []
+
+    def stash(html):
+        spans.append(html)
+        return f'\x00{len(spans) - 1}\x00'
+
+    # Код внутри `...` не размечается дальше
+    text = CODE_SPAN_RE.sub(lambda m: stash(f'<code>{escape(m.group(2).strip(), quote=False)}</code>'), text)
+    text = escape(text, quote=False)
+
+    def link(match):
+        label, url = match.group(1), unescape(match.group(2))
+        if not SAFE_URL_RE.match(url):
+            return match.group(0)
+        return stash(f'<a href="{escape(url)}">{_emphasis(label)}</a>')
+
+    text = _emphasis(LINK_RE.sub(link, text))
+    while '\x00' in text:
+        text = re.sub(r'\x00(\d+)\x00', lambda m: spans[int(m.group(1))], text)
+    return text
+
+
+def _is_block_start(line):
+    return bool(FENCE_RE.match(line) or HEADING_RE.match(line) or RULE_RE.match(line)
+                or BULLET_RE.match(line) or ORDERED_RE.match(line) or QUOTE_RE.match(line))
+
+
+def _render_blocks(lines):
+    html = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if not line.strip():
+            i += 1
+            continue
+
+        fence = FENCE_RE.match(line)
+        if fence:
+            marker, language = fence.group(1), fence.group(2)
+            code = []
+            i += 1
+            while i < len(lines) and lines[i].strip() != marker:
+                code.append(lines[i])
+                i += 1
+            i += 1  # закрывающий маркер (или конец текста)
+            attrs = f' class="language-{escape(language)}"' if language else ''
+            html.append(f'<pre><code{attrs}>{escape(chr(10).join(code), quote=False)}</code></pre>')
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            level = len(heading.group(1))
+            html.append(f'<h{level}>{render_inline(heading.group(2))}</h{level}>')
+            i += 1
+            continue
+
+        if RULE_RE.match(line):
+            html.append('<hr>')
+            i += 1
+            continue
+
+        if QUOTE_RE.match(line):
+            quoted = []
+            while i < len(lines) and QUOTE_RE.match(lines[i]):
+                quoted.append(QUOTE_RE.match(lines[i]).group(1))
+                i += 1
+            html.append(f'<blockquote>{_render_blocks(quoted)}</blockquote>')
+            continue
+
+        item_re = BULLET_RE if BULLET_RE.match(line) else ORDERED_RE if ORDERED_RE.match(line) else None
+        if item_re is not None:
+            items = []
+            start = None
+            while i < len(lines):
+                match = item_re.match(lines[i])
+                if match:
+                    if item_re is ORDERED_RE:
+                        start = start or match.group(1)
+                    items.append([match.group(match.lastindex)])
+                elif lines[i].strip() and not _is_block_start(lines[i]):
+                    items[-1].append(lines[i].strip())  # продолжение пункта
+                else:
+                    break
+                i += 1
+            body = ''.join(f'<li>{render_inline(chr(10).join(item))}</li>' for item in items)
+            if item_re is BULLET_RE:
+                html.append(f'<ul>{body}</ul>')
+            else:
+                attrs = f' start="{int(start)}"' if start and int(start) != 1 else ''
+                html.append(f'<ol{attrs}>{body}</ol>')
+            continue
+
+        paragraph = []
+        while i < len(lines) and lines[i].strip() and not (paragraph and _is_block_start(lines[i])):
+            paragraph.append(lines[i].strip())
+            i += 1
+        html.append(f'<p>{render_inline(chr(10).join(paragraph))}</p>')
+    return '\n'.join(html)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def render_markdown(text):
+    """Markdown -> безопасный HTML; повторный вызов с тем же текстом берется из кеша"""
+    if not text:
+        return ''
+    text = text.replace('\x00', '').replace('\r\n', '\n')
+    return _render_blocks(text.expandtabs(4).split('\n'))
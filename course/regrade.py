@@ -0,0 +1,118 @@
+"""Массовая перепроверка сохраненных решений в пуле процессов.
+
+Решения читаются порциями по возрастанию id (без OFFSET и без загрузки всей
+таблицы в память), проверяются параллельно в процессах, а изменившиеся
+вердикты записываются пачками. Одновременно в работе не больше двух порций
+на процесс, так что память не зависит от числа решений.
+"""
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from course.grading import Grader
+from course.storage import unpack
+
+# Состояние процесса-исполнителя: создается один раз в _init_worker
+_grader = None
+_backend = None
+
+
+def _init_worker(lessons, rerun):
+    global _grader, _backend
+    _grader = Grader(lessons)
+    if rerun:
+        # Повторно выполняется только то, что берет интерпретатор: имитация
+        # дала бы другой вывод, чем настоящий Dart, и испортила бы вердикты
+        from execution.backends import InterpreterBackend
+        _backend = InterpreterBackend()
+
+
+def _rerun(code):
+    """Результат повторного запуска или None, если интерпретатор не берет программу"""
+    from execution.backends import ProgramNotSupported
+    if not _backend.accepts(code):
+        return None
+    try:
+        return _backend.run(code)
+    except ProgramNotSupported:
+        return None
+
+
+def _grade_chunk(rows):
+    """rows: [(id, lesson_id, сжатый код, сжатый вывод, passed)] -> (число строк, пропущено, изменения).
+
+    Изменения - [(id, passed, новый вывод или None, если он не менялся,
+    success или None, если не менялся)] только для решений, у которых
+    поменялся вердикт, вывод или успешность. Пропущено - сколько программ
+    при --rerun не удалось выполнить заново (их проверяет сохраненный вывод).
+    """
+    updates = []
+    skipped = 0
+    for submission_id, lesson_id, code_data, output_data, passed in rows:
+        output = unpack(output_data) if output_data is not None else ''
+        new_output = output
+        success = None
+        if _backend is not None and code_data is not None:
+            result = _rerun(unpack(code_data))
+            if result is None:
+                skipped += 1
+            elif result.get('success'):
+                new_output = result.get('output', '')
+            else:
+                new_output = None
+                success = False
+        if new_output is None:
+            new_passed = False
+        else:
+            grade = _grader.grade(lesson_id, new_output)
+            new_passed = grade['passed'] if grade is not None else None
+        output_changed = new_output is not None and new_output != output
+        if new_passed != passed or output_changed or success is not None:
+            updates.append((submission_id, new_passed, new_output if output_changed else None, success))
+    return len(rows), skipped, updates
+
+
+def regrade(fetch_chunk, save, lessons, workers=None, chunk_size=1000, rerun=False, on_progress=None):
+    """Перепроверяет все решения, которые отдает fetch_chunk.
+
+    fetch_chunk(after_id, limit) - следующие строки (id, lesson_id, сжатый код
+    или None, сжатый вывод, passed) с id > after_id по возрастанию id; save(updates) -
+    записывает пачку изменений; on_progress(n) - сколько строк проверено.
+    """
+    workers = workers or os.cpu_count() or 1
+    started = time.monotonic()
+    graded = 0
+    changed = 0
+    skipped = 0
+    last_id = 0
+    exhausted = False
+    pending = set()
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(lessons, rerun)) as pool:
+        while pending or not exhausted:
+            while not exhausted and len(pending) < workers * 2:
+                rows = fetch_chunk(last_id, chunk_size)
+                if not rows:
+                    exhausted = True
+                    break
+                last_id = rows[-1][0]
+                pending.add(pool.submit(_grade_chunk, rows))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                count, chunk_skipped, updates = future.result()
+                if updates:
+                    save(updates)
+                graded += count
+                skipped += chunk_skipped
+                changed += len(updates)
+                if on_progress is not None:
+                    on_progress(count)
+    seconds = time.monotonic() - started
+    return {
+        'graded': graded,
+        'changed': changed,
+        'skipped': skipped,
+        'seconds': round(seconds, 2),
+        'per_second': round(graded / seconds) if seconds > 0 else graded,
+    }
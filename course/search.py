@@ -0,0 +1,280 @@
+"""Полнотекстовый поиск по урокам: инвертированный индекс в памяти.
+
+Индексируются название, теория, подсказки и шаблон кода. Слова
+нормализуются (нижний регистр, ё -> е, упрощенный стеммер Snowball для
+русского и суффиксы для английского, camelCase из кода делится на части),
+результаты ранжируются по BM25 с весами полей. Индекс собирается один раз
+на версию каталога; при сборке новой версии разобранные уроки, которые не
+изменились, берутся из прежнего индекса. Для сниппетов позиции слов в
+тексте урока тоже вычисляются заранее, так что запрос не разбирает тексты.
+"""
+import math
+import re
+from bisect import bisect_left
+from html import escape
+
+WORD_RE = re.compile(r'[^\W_]+', re.UNICODE)
+CAMEL_RE = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+')
+CYRILLIC_RE = re.compile(r'[а-я]')
+
+# Вес совпадения в каждом поле урока
+FIELD_WEIGHTS = (('title', 4.0), ('hints', 1.5), ('theory', 1.0), ('code_template', 0.5))
+# Параметры BM25
+K1 = 1.2
+B = 0.75
+# Последнее слово запроса, которого нет в словаре, считается недописанным и
+# дополняется по префиксу
+PREFIX_MIN_LENGTH = 3
+PREFIX_MAX_TERMS = 20
+PREFIX_WEIGHT = 0.7
+# Длина сниппета в символах и ограничение на длину запроса
+SNIPPET_CHARS = 160
+MAX_QUERY_CHARS = 200
+
+# Стоп-слова; for, in, is, as, on, with и this - ключевые слова Dart, их ищут
+STOP_WORDS = frozenset('''
+и в во не что он на я с со как а то все она так его но да ты к у же вы за бы по
+только ее мне было вот от меня еще нет о из ему теперь когда даже ну ли если уже
+или ни быть был него до вас нибудь опять уж вам ведь там потом себя ничего ей
+может они тут где есть надо ней для мы тебя их чем была сам чтобы без будто чего
+раз тоже себе под будет ж тогда кто этот того потому этого какой совсем ним здесь
+этом один почти мой тем чтобы нее сейчас были куда зачем всех никогда можно при
+наконец два об другой хоть после над больше тот через эти нас про всего них какая
+много разве три эту моя впрочем хорошо свою этой перед иногда лучше чуть том
+нельзя такой им более всегда конечно всю между это
+a an and are at be by from has have it its of or that the to was were will
+'''.split())
+
+# Упрощенный Snowball для русского языка
+_RU_VOWELS = 'аеиоуыэюя'
+_RU_PERFECTIVE_GERUND = re.compile(r'((?<=[ая])(в|вши|вшись)|(ив|ивши|ившись|ыв|ывши|ывшись))$')
+_RU_REFLEXIVE = re.compile(r'(ся|сь)$')
+_RU_ADJECTIVE = re.compile(r'(ее|ие|ые|ое|ими|ыми|ей|ий|ый|ой|ем|им|ым|ом|его|ого|ему|ому|их|ых|ую|юю|ая|яя|ою|ею)$')
+_RU_PARTICIPLE = re.compile(r'((?<=[ая])(ем|нн|вш|ющ|щ)|(ивш|ывш|ующ))$')
+_RU_VERB = re.compile(
+    r'((?<=[ая])(ла|на|ете|йте|ли|й|л|ем|н|ло|но|ет|ют|ны|ть|ешь|нно)'
+    r'|(ила|ыла|ена|ейте|уйте|ите|или|ыли|ей|уй|ил|ыл|им|ым|ен|ило|ыло|ено|ят|ует|уют|ит|ыт|ены|ить|ыть|ишь|ую|ю))$'
+)
+_RU_NOUN = re.compile(
+    r'(а|ев|ов|ие|ье|е|иями|ями|ами|еи|ии|и|ией|ей|ой|ий|й|иям|ям|ием|ем|ам|ом|о|у|ах|иях|ях|ы|ь|ию|ью|ю|ия|ья|я)$'
+)
+_RU_SUPERLATIVE = re.compile(r'(ейше|ейш)$')
+
+
+def _stem_ru(word):
+    # Окончания ищутся только после первой гласной (область RV)
+    for i, char in enumerate(word):
+        if char in _RU_VOWELS:
+            head, rv = word[:i + 1], word[i + 1:]
+            break
+    else:
+        return word
+    stripped = _RU_PERFECTIVE_GERUND.sub('', rv, 1)
+    if stripped == rv:
+        rv = _RU_REFLEXIVE.sub('', rv, 1)
+        stripped = _RU_ADJECTIVE.sub('', rv, 1)
+        if stripped != rv:
+            stripped = _RU_PARTICIPLE.sub('', stripped, 1)
+        else:
+            stripped = _RU_VERB.sub('', rv, 1)
+            if stripped == rv:
+                stripped = _RU_NOUN.sub('', rv, 1)
+    rv = stripped
+    if rv.endswith('и'):
+        rv = rv[:-1]
+    rv = _RU_SUPERLATIVE.sub('', rv, 1)
+    if rv.endswith('нн'):
+        rv = rv[:-1]
+    elif rv.endswith('ь'):
+        rv = rv[:-1]
+    return head + rv
+
+
+def _stem_en(word):
+    if len(word) <= 3:
+        return word
+    if word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith(('sses', 'shes', 'ches', 'xes')):
+        return word[:-2]
+    if word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        word = word[:-1]
+    for suffix in ('ing', 'ed'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            if len(word) > 3 and word[-1] == word[-2] and word[-1] not in 'lsz':
+                word = word[:-1]
+            break
+    return word
+
+
+def normalize(word):
+    """Нормальная форма слова или None для стоп-слов"""
+    word = word.lower().replace('ё', 'е')
+    if word in STOP_WORDS:
+        return None
+    if word.isdigit():
+        return word
+    return _stem_ru(word) if CYRILLIC_RE.search(word) else _stem_en(word)
+
+
+def tokens(text):
+    """(начало, конец, нормальная форма) для каждого слова текста.
+
+    Идентификаторы вроде setState дают и целое слово, и его части.
+    """
+    for match in WORD_RE.finditer(text):
+        word = match.group()
+        term = normalize(word)
+        if term is not None:
+            yield match.start(), match.end(), term
+        parts = CAMEL_RE.findall(word)
+        if len(parts) > 1:
+            for part in parts:
+                term = normalize(part)
+                if term is not None:
+                    yield match.start(), match.end(), term
+
+
+def terms(text):
+    return [term for _, _, term in tokens(text)]
+
+
+def plain_text(markdown):
+    """Теория без разметки Markdown - из нее берутся сниппеты"""
+    text = re.sub(r'^\s*(```|~~~).*?^\s*\1\s*$', ' ', markdown, flags=re.MULTILINE | re.DOTALL)
+    text = re.sub(r'^\s*(#+|>+)', ' ', text, flags=re.MULTILINE)
+    text = re.sub(r'\*+|`+|__', ' ', text)
+    return ' '.join(text.split())
+
+
+class Document:
+    """Разобранный урок: взвешенные частоты слов и позиции слов для сниппета"""
+
+    def __init__(self, lesson):
+        self.lesson = lesson
+        self.id = str(lesson['id'])
+        self.frequencies = {}
+        self.length = 0.0
+        for field, weight in FIELD_WEIGHTS:
+            value = lesson.get(field)
+            if not value:
+                continue
+            text = ' '.join(value) if not isinstance(value, str) else value
+            for term in terms(text):
+                self.frequencies[term] = self.frequencies.get(term, 0.0) + weight
+                self.length += weight
+        self.snippet_text = plain_text(lesson.get('theory') or '') or ' '.join(lesson.get('hints') or ())
+        self.snippet_tokens = tuple(tokens(self.snippet_text))
+
+
+class SearchIndex:
+    """Инвертированный индекс: слово -> {id урока: взвешенная частота}"""
+
+    def __init__(self, lessons, previous=None):
+        reused = previous.documents if previous is not None else {}
+        self.documents = {}
+        for lesson in lessons:
+            document = reused.get(str(lesson['id']))
+            # Неизменившийся урок - тот же самый объект в каталоге
+            if document is None or document.lesson is not lesson:
+                document = Document(lesson)
+            self.documents[document.id] = document
+        self.postings = {}
+        for document in self.documents.values():
+            for term, frequency in document.frequencies.items():
+                self.postings.setdefault(term, {})[document.id] = frequency
+        self.vocabulary = sorted(self.postings)
+        count = len(self.documents)
+        self.average_length = sum(d.length for d in self.documents.values()) / count if count else 0.0
+        self.idf = {
+            term: math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+
+    def _expand(self, term):
+        """Слова словаря, начинающиеся с term (для недописанного слова)"""
+        expanded = []
+        position = bisect_left(self.vocabulary, term)
+        while position < len(self.vocabulary) and len(expanded) < PREFIX_MAX_TERMS:
+            candidate = self.vocabulary[position]
+            if not candidate.startswith(term):
+                break
+            if candidate != term:
+                expanded.append(candidate)
+            position += 1
+        return expanded
+
+    def search(self, query, limit=10):
+        """Уроки по убыванию релевантности: id, название, оценка и сниппет с <mark>"""
+        query_terms = list(dict.fromkeys(terms(query[:MAX_QUERY_CHARS])))
+        if not query_terms:
+            return []
+        # Каждое слово запроса - группа вариантов; урок получает лучший из них
+        groups = [[(term, 1.0)] for term in query_terms]
+        last = query_terms[-1]
+        if last not in self.postings and len(last) >= PREFIX_MIN_LENGTH:
+            groups[-1] = [(term, PREFIX_WEIGHT) for term in self._expand(last)]
+        scores = {}
+        for group in groups:
+            best = {}
+            for term, weight in group:
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                idf = self.idf[term] * weight
+                for lesson_id, frequency in postings.items():
+                    length = self.documents[lesson_id].length
+                    norm = K1 * (1 - B + B * length / self.average_length)
+                    score = idf * frequency * (K1 + 1) / (frequency + norm)
+                    if score > best.get(lesson_id, 0.0):
+                        best[lesson_id] = score
+            for lesson_id, score in best.items():
+                scores[lesson_id] = scores.get(lesson_id, 0.0) + score
+        matched = {term for group in groups for term, _ in group}
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+        results = []
+        for lesson_id, score in ranked:
+            document = self.documents[lesson_id]
+            lesson = document.lesson
+            results.append({
+                'id': lesson['id'],
+                'title': lesson.get('title'),
+                'category': lesson.get('category'),
+                'difficulty': lesson.get('difficulty'),
+                'score': round(score, 3),
+                'snippet': snippet(document, matched),
+            })
+        return results
+
+    def __len__(self):
+        return len(self.documents)
+
+
+def snippet(document, query_terms):
+    """Фрагмент текста урока вокруг первого совпадения; HTML экранирован"""
+    text = document.snippet_text
+    matches = [(start, end) for start, end, term in document.snippet_tokens if term in query_terms]
+    if not matches:
+        cut = text[:SNIPPET_CHARS]
+        return escape(cut) + ('…' if len(text) > SNIPPET_CHARS else '')
+    first = matches[0][0]
+    begin = max(0, first - SNIPPET_CHARS // 3)
+    if begin:
+        space = text.find(' ', begin)
+        begin = space + 1 if 0 <= space < first else begin
+    end = min(len(text), begin + SNIPPET_CHARS)
+    parts = ['…'] if begin else []
+    position = begin
+    for start, stop in matches:
+        if start < position:
+            continue
+        if stop > end:
+            break
+        parts.append(escape(text[position:start]))
+        parts.append(f'<mark>{escape(text[start:stop])}</mark>')
+        position = stop
+    parts.append(escape(text[position:end]))
+    if end < len(text):
+        parts.append('…')
+    return ''.join(parts)
@@ -0,0 +1,49 @@
+"""Хранение кода и вывода запусков: содержимое адресуется хешем и сжимается zlib.
+
+Почти все запуски - одинаковые шаблоны уроков, поэтому одно и то же
+содержимое хранится один раз, а строка запуска ссылается на него по хешу.
+"""
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+
+COMPRESSION_LEVEL = 6
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def pack(text):
+    return zlib.compress(text.encode('utf-8'), COMPRESSION_LEVEL)
+
+
+def unpack(data):
+    return zlib.decompress(data).decode('utf-8')
+
+
+class KnownHashes:
+    """Хеши, которые этот процесс уже записал в таблицу блобов (LRU).
+
+    Для них запись запуска обходится без вставки блоба вовсе.
+    """
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self._hashes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            if key not in self._hashes:
+                return False
+            self._hashes.move_to_end(key)
+            return True
+
+    def add(self, key):
+        with self._lock:
+            self._hashes[key] = None
+            self._hashes.move_to_end(key)
+            while len(self._hashes) > self.max_entries:
+                self._hashes.popitem(last=False)
@@ -0,0 +1,6 @@
+"""Выполнение Dart кода учеников"""
+from execution.cache import ResultCache
+from execution.jobs import JobQueue
+from execution.pool import DartWorkerPool
+
+__all__ = ['DartWorkerPool', 'JobQueue', 'ResultCache']
@@ -0,0 +1,300 @@
+"""Способы выполнения кода: интерпретатор, имитация, локальный Dart и
+удаленный HTTP сервис.
+
+Все бэкенды имеют метод run(code, on_output=None, kernel=None), возвращающий
+словарь результата. BackendChain пробует бэкенды по порядку и переходит к
+следующему, если текущий недоступен или не берется за программу.
+"""
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from execution.interpreter import Unsupported, could_interpret, interpret
+from execution.simulator import simulate
+
+
+class BackendUnavailable(Exception):
+    """Бэкенд не смог выполнить код по своей вине (сеть, перегрузка, сбой)"""
+
+
+class ProgramNotSupported(BackendUnavailable):
+    """Бэкенд выполняет только часть программ, и эта в нее не входит (это не сбой)"""
+
+
+class InterpreterBackend:
+    """Интерпретатор подмножества Dart для простых программ первых уроков.
+
+    Отвечает за миллисекунды без процесса Dart; все, что не поддерживает,
+    сразу передает следующему бэкенду цепочки.
+    """
+
+    name = 'interpreter'
+    available = True
+    selective = True
+
+    def accepts(self, code):
+        return could_interpret(code)
+
+    def run(self, code, on_output=None, kernel=None):
+        started = time.monotonic()
+        try:
+            output = interpret(code)
+        except Unsupported as e:
+            raise ProgramNotSupported(str(e))
+        if on_output is not None:
+            for line in output.split('\n') if output else []:
+                on_output('stdout', line)
+        return {
+            'success': True,
+            'output': output,
+            'error': '',
+            'timings': {'compile_ms': 0, 'run_ms': int((time.monotonic() - started) * 1000)},
+        }
+
+
+class SimulatorBackend:
+    """Упрощенная имитация вывода без Dart"""
+
+    name = 'simulator'
+    available = True
+
+    def run(self, code, on_output=None, kernel=None):
+        return {'success': True, 'output': simulate(code), 'error': ''}
+
+
+class LocalDartBackend:
+    """Пул прогретых процессов Dart на этом хосте"""
+
+    name = 'local'
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    @property
+    def available(self):
+        return self.pool.available
+
+    def run(self, code, on_output=None, kernel=None):
+        result = self.pool.run(code, on_output=on_output, kernel=kernel)
+        if result.get('retry') and not result.get('timed_out'):
+            # Пул перегружен или процесс упал - пусть попробует следующий бэкенд
+            raise BackendUnavailable(result['error'])
+        return result
+
+
+class CircuitBreaker:
+    """Размыкатель: после failure_threshold сбоев подряд бэкенд не вызывается
+    reset_timeout секунд, затем пропускается один пробный вызов."""
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self.opened_at is None:
+                return 'closed'
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                return 'half_open'
+            return 'open'
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout or self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+
+class RemoteBackend:
+    """Удаленный сервис выполнения с API в стиле JDoodle.
+
+    Запрос: POST {clientId, clientSecret, script, language, versionIndex}
+    Ответ:  {output, statusCode, cpuTime, memory[, isExecutionSuccess, isCompiled]}
+    Соединения переиспользуются (keep-alive); сетевые ошибки, 429 и 5xx
+    повторяются с экспоненциальной задержкой и случайным разбросом.
+    """
+
+    name = 'remote'
+
+    def __init__(self, url, client_id='', client_secret='', language='dart', version_index='',
+                 timeout=10, connect_timeout=3, retries=2, backoff=0.2, pool_size=10, breaker=None):
+        self.url = url
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.language = language
+        self.version_index = version_index
+        self.timeout = (connect_timeout, timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = breaker or CircuitBreaker()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    @property
+    def available(self):
+        return bool(self.url) and self.breaker.state != 'open'
+
+    def _delay(self, attempt):
+        return self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    def _post(self, payload):
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self._delay(attempt - 1))
+            try:
+                response = self.session.post(self.url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                error = f'сервис недоступен: {e.__class__.__name__}'
+                continue
+            if response.status_code == 429 or response.status_code >= 500:
+                error = f'сервис ответил {response.status_code}'
+                continue
+            try:
+                return response.status_code, response.json()
+            except ValueError:
+                error = 'сервис вернул некорректный ответ'
+        raise BackendUnavailable(f'Удаленное выполнение: {error}')
+
+    def run(self, code, on_output=None, kernel=None):
+        if not self.breaker.allow():
+            raise BackendUnavailable('Удаленное выполнение временно отключено после серии сбоев')
+        payload = {
+            'clientId': self.client_id,
+            'clientSecret': self.client_secret,
+            'script': code,
+            'language': self.language,
+            'versionIndex': self.version_index,
+        }
+        started = time.monotonic()
+        try:
+            status, data = self._post(payload)
+        except BackendUnavailable:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+
+        if status >= 400 or 'error' in data:
+            # Ошибка запроса (ключи, лимиты тарифа) - повтор не поможет
+            return {'success': False, 'output': '', 'error': f"Ошибка выполнения: {data.get('error', status)}"}
+        output = (data.get('output') or '').rstrip('\n')
+        if on_output is not None:
+            for line in output.split('\n') if output else []:
+                on_output('stdout', line)
+        success = data.get('isExecutionSuccess', True) and data.get('isCompiled', True)
+        return {
+            'success': bool(success),
+            'output': output if success else '',
+            'error': '' if success else output,
+            'timings': {'compile_ms': 0, 'run_ms': int((time.monotonic() - started) * 1000)},
+        }
+
+
+class BackendChain:
+    """Основной бэкенд и запасные; результат запасного помечается fallback.
+
+    Перед основным могут стоять избирательные бэкенды (selective), которые
+    берутся только за часть программ, - их отказ запасным ходом не считается.
+    В результат пишется routing_seconds - сколько занял выбор бэкенда.
+    """
+
+    def __init__(self, backends):
+        self.backends = backends
+
+    @property
+    def primary(self):
+        for backend in self.backends:
+            if not getattr(backend, 'selective', False):
+                return backend
+        return self.backends[0]
+
+    def run(self, code, on_output=None, kernel=None):
+        errors = []
+        primary = self.primary
+        started = time.perf_counter()
+        for backend in self.backends:
+            if not backend.available:
+                continue
+            selective = getattr(backend, 'selective', False)
+            if selective and not backend.accepts(code):
+                continue
+            routed = time.perf_counter()
+            try:
+                result = backend.run(code, on_output=on_output, kernel=kernel)
+            except ProgramNotSupported:
+                continue
+            except BackendUnavailable as e:
+                errors.append(str(e))
+                continue
+            result['backend'] = backend.name
+            result['routing_seconds'] = routed - started
+            if backend is not primary and not selective:
+                result['fallback'] = True
+            return result
+        return {
+            'success': False,
+            'output': '',
+            'error': errors[-1] if errors else 'Нет доступного способа выполнить код',
+            'retry': True,
+        }
+
+
+def create_backend(name, fallback, pool, remote_options=None, interpreter=False, allow_unsandboxed=False):
+    """Цепочка бэкендов по настройкам EXECUTION_BACKEND и EXECUTION_FALLBACK_BACKEND.
+
+    name: auto (локальный Dart, если установлен и настроена песочница, иначе
+    имитация), local, remote или simulator; fallback - список запасных через
+    запятую; interpreter - ставить ли перед ними интерпретатор простых программ.
+    Локальный Dart без песочницы (DART_SANDBOX_COMMAND) включается только с
+    allow_unsandboxed: программа ученика может читать файлы и запускать
+    процессы от имени веб-приложения.
+    """
+    local_allowed = pool.sandboxed or allow_unsandboxed
+
+    def make(kind):
+        if kind == 'local':
+            if not local_allowed:
+                raise ValueError(
+                    'Локальный Dart без песочницы отключен: задайте DART_SANDBOX_COMMAND '
+                    '(или DART_ALLOW_UNSANDBOXED=1 для локальной разработки)'
+                )
+            return LocalDartBackend(pool)
+        if kind == 'remote':
+            return RemoteBackend(**(remote_options or {}))
+        if kind == 'simulator':
+            return SimulatorBackend()
+        raise ValueError(f'Неизвестный бэкенд выполнения: {kind}')
+
+    if name == 'auto':
+        name = 'local' if pool.available and local_allowed else 'simulator'
+    kinds = [name] + [kind.strip() for kind in (fallback or '').split(',') if kind.strip()]
+    backends = [make(kind) for kind in dict.fromkeys(kinds)]
+    if interpreter:
+        backends.insert(0, InterpreterBackend())
+    return BackendChain(backends)
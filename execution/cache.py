@@ -0,0 +1,113 @@
+"""Кеш результатов выполнения, адресуемый по содержимому кода"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+# Программы с такими вызовами дают разный вывод при каждом запуске
+NONDETERMINISTIC_MARKERS = (
+    'Random', 'DateTime.now', 'Stopwatch', 'stdin', 'Platform.',
+    'File(', 'Directory(', 'Process.', 'HttpClient',
+)
+
+# Примерные накладные расходы на одну запись (ключ, словарь, узел OrderedDict)
+ENTRY_OVERHEAD = 400
+
+
+def normalize_source(code):
+    """Приводит код к каноническому виду: переводы строк и пробелы в конце файла.
+
+    Пробелы в концах строк не трогаются: внутри многострочного строкового
+    литерала (в тройных кавычках) они часть значения и меняют вывод программы.
+    """
+    return code.replace('\r\n', '\n').replace('\r', '\n').rstrip()
+
+
+def source_hash(code):
+    """Ключ кеша: SHA-256 нормализованного кода"""
+    return hashlib.sha256(normalize_source(code).encode('utf-8')).hexdigest()
+
+
+def is_deterministic(code):
+    """Дает ли код одинаковый вывод при каждом запуске (по наличию маркеров)"""
+    return not any(marker in code for marker in NONDETERMINISTIC_MARKERS)
+
+
+def is_cacheable(code, result):
+    """Можно ли повторно отдавать этот результат для того же кода"""
+    if result.get('retry') or result.get('timed_out') or result.get('fallback'):
+        return False
+    return is_deterministic(code)
+
+
+def _result_size(result):
+    return ENTRY_OVERHEAD + sum(
+        len(value.encode('utf-8')) for value in result.values() if isinstance(value, str)
+    )
+
+
+class ResultCache:
+    """LRU кеш результатов с TTL и ограничением по памяти"""
+
+    def __init__(self, max_bytes=32 * 1024 * 1024, ttl=3600, max_entries=10000):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # ключ -> (истекает, размер, результат)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, size, result = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(result)
+
+    def put(self, key, result):
+        size = _result_size(result)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (time.monotonic() + self.ttl, size, dict(result))
+            self._bytes += size
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
@@ -0,0 +1,205 @@
+"""Долгоживущий инкрементальный компилятор Dart (frontend_server из SDK).
+
+Компилятор один раз загружает SDK и платформенные библиотеки и дальше
+перекомпилирует только файл программы. Готовый kernel (.dill) рабочий
+процесс запускает через Isolate.spawnUri без повторной компиляции.
+
+Протокол frontend_server (строки через stdin/stdout):
+    compile <uri>                          - первая компиляция
+    recompile <uri> <ключ>\\n<uri>\\n<ключ> - перекомпиляция измененного файла
+    accept / reset                         - принять результат / следующий
+                                             результат выдать целиком
+Ответ: "result <ключ>", диагностика, "<ключ>", "<ключ> <путь к dill> <ошибок>".
+"""
+import os
+import queue
+import shutil
+import signal
+import subprocess
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from execution.limits import MAX_LINE_BYTES
+
+
+class CompilerUnavailable(Exception):
+    """Компилятор не запустился или упал"""
+
+
+class CompileTimeout(CompilerUnavailable):
+    """Компилятор не уложился в отведенное время"""
+
+
+def find_sdk(dart_path):
+    """Каталог Dart SDK по пути к исполняемому файлу dart, или None"""
+    executable = shutil.which(dart_path)
+    if not executable:
+        return None
+    sdk = Path(os.path.realpath(executable)).parent.parent
+    return sdk if (sdk / 'lib' / '_internal').is_dir() else None
+
+
+def frontend_server_command(dart_path):
+    """Команда запуска frontend_server из SDK (без аргументов), или None"""
+    sdk = find_sdk(dart_path)
+    if sdk is None:
+        return None
+    snapshots = sdk / 'bin' / 'snapshots'
+    aot_runtime = sdk / 'bin' / 'dartaotruntime'
+    if (snapshots / 'frontend_server_aot.dart.snapshot').exists() and aot_runtime.exists():
+        return [str(aot_runtime), str(snapshots / 'frontend_server_aot.dart.snapshot')]
+    if (snapshots / 'frontend_server.dart.snapshot').exists():
+        return [dart_path, str(snapshots / 'frontend_server.dart.snapshot')]
+    return None
+
+
+def platform_dill(dart_path):
+    sdk = find_sdk(dart_path)
+    for name in ('vm_platform_strong.dill', 'vm_platform.dill'):
+        path = sdk / 'lib' / '_internal' / name
+        if path.exists():
+            return path
+    return None
+
+
+class IncrementalCompiler:
+    """Процесс frontend_server, компилирующий программы по одной"""
+
+    def __init__(self, dart_path, workdir, command_prefix=None, preexec_fn=None, timeout=30):
+        self.dart_path = dart_path
+        self.workdir = workdir
+        self.command_prefix = command_prefix or []
+        self.preexec_fn = preexec_fn
+        self.timeout = timeout
+        self.compiles = 0
+        self.process = None
+        self._lines = queue.Queue()
+        self._lock = threading.Lock()
+        # Программа всегда пишется в один и тот же файл: компилятор видит
+        # его как измененный и перекомпилирует только его
+        self.source_path = os.path.join(workdir, 'main.dart')
+        self._output_path = os.path.join(workdir, 'main.dill')
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        base = frontend_server_command(self.dart_path)
+        platform = platform_dill(self.dart_path) if base else None
+        if platform is None:
+            raise CompilerUnavailable('frontend_server не найден в Dart SDK')
+        os.makedirs(self.workdir, exist_ok=True)
+        command = list(self.command_prefix) + base + [
+            '--sdk-root', str(platform.parent) + os.sep,
+            '--platform', str(platform),
+            '--target', 'vm',
+            '--incremental',
+            '--no-print-incremental-dependencies',
+            '--output-dill', self._output_path,
+        ]
+        try:
+            self.process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.workdir,
+                env={'PATH': os.environ.get('PATH', ''), 'HOME': self.workdir, 'LANG': 'C.UTF-8'},
+                preexec_fn=self.preexec_fn if os.name == 'posix' else None,
+            )
+        except OSError as e:
+            raise CompilerUnavailable(f'Не удалось запустить frontend_server: {e}')
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+
+    def warm_up(self):
+        """Первая компиляция загружает SDK; делаем ее заранее, в фоне"""
+        try:
+            self.compile('void main() {}', os.path.join(self.workdir, 'warm-up.dill'))
+        except CompilerUnavailable:
+            pass
+
+    def _read_stdout(self):
+        for raw in iter(lambda: self.process.stdout.readline(MAX_LINE_BYTES), b''):
+            self._lines.put(raw.decode('utf-8', 'replace').rstrip('\r\n'))
+        self._lines.put(None)
+
+    def _send(self, *lines):
+        try:
+            self.process.stdin.write(''.join(line + '\n' for line in lines).encode('utf-8'))
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError):
+            raise CompilerUnavailable('frontend_server недоступен')
+
+    def _read_line(self, deadline):
+        try:
+            line = self._lines.get(timeout=max(deadline - time.monotonic(), 0.01))
+        except queue.Empty:
+            raise CompileTimeout('frontend_server не ответил вовремя')
+        if line is None:
+            raise CompilerUnavailable('frontend_server завершился')
+        return line
+
+    def compile(self, source, output_path, timeout=None):
+        """Компилирует программу в output_path.
+
+        Возвращает (ошибок, диагностика); при ошибках компиляции файл
+        output_path не создается.
+        """
+        with self._lock:
+            return self._compile(source, output_path, timeout or self.timeout)
+
+    def _compile(self, source, output_path, timeout):
+        if not self.alive:
+            raise CompilerUnavailable('frontend_server не запущен')
+        with open(self.source_path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        uri = Path(self.source_path).as_uri()
+
+        if self.compiles == 0:
+            self._send(f'compile {uri}')
+        else:
+            key = uuid.uuid4().hex
+            self._send(f'recompile {uri} {key}', uri, key)
+
+        deadline = time.monotonic() + timeout
+        line = self._read_line(deadline)
+        while not line.startswith('result '):
+            line = self._read_line(deadline)
+        key = line[len('result '):]
+
+        diagnostics = []
+        errors = None
+        while errors is None:
+            line = self._read_line(deadline)
+            if line.startswith(key + ' '):
+                errors = int(line.rsplit(' ', 1)[1])
+            elif line != key:
+                diagnostics.append(line)
+
+        # Принимаем результат и просим следующий выдать целиком: дельта
+        # годится только для hot reload, а spawnUri нужен полный kernel
+        self._send('accept', 'reset')
+        self.compiles += 1
+        diagnostics = '\n'.join(diagnostics).strip().replace(uri, 'main.dart').replace(self.source_path, 'main.dart')
+        if errors:
+            return errors, diagnostics
+        try:
+            os.replace(self._output_path, output_path)
+        except OSError:
+            raise CompilerUnavailable('frontend_server не записал результат компиляции')
+        return 0, diagnostics
+
+    def stop(self):
+        if self.process is None or self.process.poll() is not None:
+            return
+        try:
+            if os.name == 'posix' and self.preexec_fn is not None:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
@@ -0,0 +1,2200 @@
+"""Интерпретатор подмножества Dart для первых уроков курса.
+
+Поддерживается то, что нужно урокам 1-10: print и интерполяция строк,
+переменные с типами int/double/num/String/bool/List/Map, арифметика,
+if/for/for-in/while/do, функции (в том числе вложенные и лямбды), основные
+методы строк, чисел, списков и карт. Все остальное (классы, import, async,
+исключения, switch...) и любые сомнительные случаи - ошибки типов, ошибки
+времени выполнения, слишком долгие программы - отклоняются исключением
+Unsupported еще до вывода, и программу выполняет настоящий Dart.
+"""
+import math
+import re
+from collections import namedtuple
+from decimal import Decimal, ROUND_HALF_UP
+from functools import cmp_to_key
+
+# Ограничения, после которых программа уходит в Dart VM
+MAX_STEPS = 50000
+MAX_DEPTH = 100
+MAX_OUTPUT_BYTES = 64 * 1024
+
+
+class Unsupported(Exception):
+    """Программа выходит за поддерживаемое подмножество"""
+
+
+# ---------------------------------------------------------------------------
+# Лексер
+
+Token = namedtuple('Token', ['kind', 'value', 'pos'])  # kind: id, num, str, op, eof
+
+_SKIP = re.compile(r'(?:\s+|//[^\n]*|/\*(?:(?!/\*)[\s\S])*?\*/)+')
+_NUMBER = re.compile(r'0[xX][0-9a-fA-F]+|(?:\d+\.\d+|\d+|\.\d+)(?:[eE][+-]?\d+)?')
+_IDENT = re.compile(r'[A-Za-z_$][A-Za-z0-9_$]*')
+_SIMPLE_INTERPOLATION = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_OPERATORS = re.compile('|'.join(re.escape(op) for op in sorted([
+    '~/=', '??=', '=>', '==', '!=', '<=', '>=', '&&', '||', '++', '--', '+=', '-=', '*=', '/=',
+    '%=', '~/', '??', '?.', '+', '-', '*', '/', '%', '=', '<', '>', '!', '?', ':', ';', ',', '.',
+    '(', ')', '[', ']', '{', '}',
+], key=len, reverse=True)))
+_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t', 'b': '\b', 'f': '\f', 'v': '\v'}
+
+
+def tokenize(source, pos=0, inside_interpolation=False):
+    """Токены с позиции pos; в интерполяции ${...} - до парной '}'"""
+    tokens = []
+    depth = 0
+    n = len(source)
+    while True:
+        skipped = _SKIP.match(source, pos)
+        if skipped:
+            pos = skipped.end()
+        if pos >= n:
+            if inside_interpolation:
+                raise Unsupported('незакрытая интерполяция')
+            tokens.append(Token('eof', None, pos))
+            return tokens, pos
+        c = source[pos]
+        if c in '\'"' or (c in 'rR' and source[pos + 1:pos + 2] in ('"', "'")):
+            token, pos = _string(source, pos)
+            tokens.append(token)
+            continue
+        match = _NUMBER.match(source, pos)
+        if match and not (c == '.' and tokens and tokens[-1].kind in ('id', 'num', 'str')):
+            text = match.group()
+            if text[:2].lower() == '0x':
+                value = int(text, 16)
+                if value >= 1 << 64:
+                    raise Unsupported('целый литерал не помещается в 64 бита')
+                value = _wrap_int(value)
+            elif '.' in text or 'e' in text.lower():
+                value = float(text)
+            else:
+                value = int(text)
+            tokens.append(Token('num', value, pos))
+            pos = match.end()
+            continue
+        match = _IDENT.match(source, pos)
+        if match:
+            tokens.append(Token('id', match.group(), pos))
+            pos = match.end()
+            continue
+        match = _OPERATORS.match(source, pos)
+        if not match:
+            raise Unsupported(f'неизвестный символ {c!r}')
+        op = match.group()
+        if inside_interpolation:
+            if op == '{':
+                depth += 1
+            elif op == '}':
+                if depth == 0:
+                    tokens.append(Token('eof', None, pos))
+                    return tokens, pos + 1
+                depth -= 1
+        tokens.append(Token('op', op, pos))
+        pos = match.end()
+
+
+def _string(source, pos):
+    """Строковый литерал: Token('str', [текст или токены интерполяции, ...])"""
+    start = pos
+    raw = source[pos] in 'rR'
+    if raw:
+        pos += 1
+    quote = source[pos] * 3 if source.startswith(source[pos] * 3, pos) else source[pos]
+    pos += len(quote)
+    if len(quote) == 3:
+        # Первая строка многострочного литерала из одних пробелов не входит в значение
+        blank = re.compile(r'[ \t]*\r?\n').match(source, pos)
+        if blank:
+            pos = blank.end()
+    parts = []
+    chars = []
+    n = len(source)
+    while True:
+        if pos >= n:
+            raise Unsupported('незакрытая строка')
+        if source.startswith(quote, pos):
+            pos += len(quote)
+            break
+        c = source[pos]
+        if c == '\n' and len(quote) == 1:
+            raise Unsupported('незакрытая строка')
+        if c == '\\' and not raw:
+            pos += 1
+            e = source[pos:pos + 1]
+            if e == 'x':
+                chars.append(chr(int(source[pos + 1:pos + 3], 16)))
+                pos += 3
+            elif e == 'u' and source[pos + 1:pos + 2] == '{':
+                end = source.index('}', pos)
+                chars.append(chr(int(source[pos + 2:end], 16)))
+                pos = end + 1
+            elif e == 'u':
+                chars.append(chr(int(source[pos + 1:pos + 5], 16)))
+                pos += 5
+            else:
+                chars.append(_ESCAPES.get(e, e))
+                pos += 1
+            continue
+        if c == '$' and not raw:
+            if chars:
+                parts.append(''.join(chars))
+                chars = []
+            if source.startswith('{', pos + 1):
+                tokens, pos = tokenize(source, pos + 2, inside_interpolation=True)
+                parts.append(tokens)
+            else:
+                match = _SIMPLE_INTERPOLATION.match(source, pos + 1)
+                if not match:
+                    raise Unsupported('одиночный $ в строке')
+                parts.append([Token('id', match.group(), match.start()), Token('eof', None, match.end())])
+                pos = match.end()
+            continue
+        chars.append(c)
+        pos += 1
+    if chars or not parts:
+        parts.append(''.join(chars))
+    return Token('str', parts, start), pos
+
+
+# ---------------------------------------------------------------------------
+# Типы: (имя, аргументы типа, допускает null)
+
+TYPE_NAMES = {'int', 'double', 'num', 'String', 'bool', 'dynamic', 'Object', 'List', 'Map', 'Iterable', 'void'}
+DYNAMIC = ('dynamic', (), True)
+
+RESERVED = {
+    'abstract', 'as', 'assert', 'async', 'await', 'break', 'case', 'catch', 'class', 'const', 'continue',
+    'default', 'do', 'else', 'enum', 'export', 'extends', 'external', 'factory', 'false', 'final',
+    'finally', 'for', 'if', 'implements', 'import', 'in', 'is', 'late', 'library', 'mixin', 'new', 'null',
+    'part', 'required', 'rethrow', 'return', 'super', 'switch', 'this', 'throw', 'true', 'try', 'typedef',
+    'var', 'void', 'while', 'with', 'yield',
+}
+
+ASSIGN_OPS = {'=', '+=', '-=', '*=', '/=', '~/=', '%=', '??='}
+
+
+# ---------------------------------------------------------------------------
+# Парсер: AST из кортежей, первый элемент - вид узла
+
+class Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.i = 0
+
+    def peek(self, k=0):
+        return self.tokens[min(self.i + k, len(self.tokens) - 1)]
+
+    def next(self):
+        token = self.tokens[self.i]
+        if token.kind != 'eof':
+            self.i += 1
+        return token
+
+    def at(self, value, k=0):
+        token = self.peek(k)
+        return token.kind in ('op', 'id') and token.value == value
+
+    def accept(self, value):
+        if self.at(value):
+            return self.next()
+        return None
+
+    def expect(self, value):
+        if not self.at(value):
+            raise Unsupported(f'ожидалось {value!r}')
+        return self.next()
+
+    def ident(self):
+        token = self.next()
+        if token.kind != 'id' or token.value in RESERVED:
+            raise Unsupported('ожидался идентификатор')
+        return token.value
+
+    # --- типы ---
+
+    def try_type(self):
+        """Разбирает тип, если он здесь есть; иначе возвращает None и не двигается"""
+        start = self.i
+        token = self.peek()
+        if token.kind != 'id' or token.value not in TYPE_NAMES:
+            return None
+        self.next()
+        args = ()
+        if self.at('<'):
+            self.next()
+            args = [self.try_type()]
+            while args[-1] is not None and self.accept(','):
+                args.append(self.try_type())
+            if None in args or not self.accept('>'):
+                self.i = start
+                return None
+            args = tuple(args)
+        nullable = bool(self.accept('?'))
+        return (token.value, args, nullable)
+
+    def type(self):
+        parsed = self.try_type()
+        if parsed is None:
+            raise Unsupported('неподдерживаемый тип')
+        return parsed
+
+    def looks_like_declaration(self):
+        """type имя (= ; , in) или type имя ( - объявление переменной или функции"""
+        start = self.i
+        parsed = self.try_type()
+        try:
+            if parsed is None or self.peek().kind != 'id' or self.peek().value in RESERVED:
+                return None
+            follow = self.peek(1)
+            if follow.kind in ('op', 'id') and follow.value in ('=', ';', ',', 'in'):
+                return 'var'
+            if follow.kind == 'op' and follow.value == '(':
+                return 'func'
+            return None
+        finally:
+            self.i = start
+
+    # --- верхний уровень ---
+
+    def program(self):
+        functions = {}
+        variables = []
+        while self.peek().kind != 'eof':
+            token = self.peek()
+            if token.kind == 'id' and token.value in ('var', 'final', 'const'):
+                variables.append(self.var_declaration())
+                continue
+            kind = self.looks_like_declaration()
+            if kind == 'var':
+                variables.append(self.var_declaration())
+                continue
+            if kind == 'func' or (token.kind == 'id' and token.value not in RESERVED and self.at('(', 1)):
+                function = self.function()
+                if function[1] in functions:
+                    raise Unsupported('повторное объявление функции')
+                functions[function[1]] = function
+                continue
+            raise Unsupported(f'неподдерживаемая конструкция верхнего уровня: {token.value}')
+        return functions, variables
+
+    def function(self):
+        return_type = self.try_type() if not self.at('(', 1) else DYNAMIC
+        if return_type is None:
+            raise Unsupported('неподдерживаемый тип результата')
+        name = self.ident()
+        params = self.params()
+        if self.at('async') or self.at('sync') or self.at('async*'):
+            raise Unsupported('async')
+        if self.accept('=>'):
+            body = self.expression()
+            self.expect(';')
+            return ('func', name, return_type, params, body, True)
+        return ('func', name, return_type, params, self.block(), False)
+
+    def params(self):
+        self.expect('(')
+        params = []
+        while not self.at(')'):
+            if self.at('[') or self.at('{') or self.at('required') or self.at('this'):
+                raise Unsupported('необязательные и именованные параметры')
+            self.accept('final')
+            param_type = DYNAMIC
+            if self.peek(1).kind == 'id' or self.at('<', 1) or self.at('?', 1):
+                param_type = self.type()
+            params.append((self.ident(), param_type))
+            if not self.accept(','):
+                break
+        self.expect(')')
+        return params
+
+    # --- операторы ---
+
+    def block(self):
+        self.expect('{')
+        statements = []
+        while not self.accept('}'):
+            if self.peek().kind == 'eof':
+                raise Unsupported('незакрытый блок')
+            statements.append(self.statement())
+        return ('block', statements)
+
+    def var_declaration(self, allow_in=False):
+        final = False
+        declared = None
+        if self.accept('var'):
+            pass
+        elif self.at('final') or self.at('const'):
+            self.next()
+            final = True
+            declared = self.try_type()
+        else:
+            declared = self.type()
+        declarators = []
+        while True:
+            name = self.ident()
+            init = None
+            if self.accept('='):
+                init = self.expression()
+            declarators.append((name, init))
+            if not self.accept(','):
+                break
+        if not allow_in:
+            self.expect(';')
+        return ('vardecl', declared, final, declarators)
+
+    def statement(self):
+        token = self.peek()
+        if token.kind == 'op' and token.value == '{':
+            return self.block()
+        if token.kind == 'op' and token.value == ';':
+            self.next()
+            return ('block', [])
+        if token.kind == 'id':
+            word = token.value
+            if word in ('var', 'final', 'const'):
+                return self.var_declaration()
+            if word == 'if':
+                self.next()
+                self.expect('(')
+                condition = self.expression()
+                self.expect(')')
+                then = self.statement()
+                otherwise = self.statement() if self.accept('else') else None
+                return ('if', condition, then, otherwise)
+            if word == 'while':
+                self.next()
+                self.expect('(')
+                condition = self.expression()
+                self.expect(')')
+                return ('while', condition, self.statement())
+            if word == 'do':
+                self.next()
+                body = self.statement()
+                self.expect('while')
+                self.expect('(')
+                condition = self.expression()
+                self.expect(')')
+                self.expect(';')
+                return ('do', body, condition)
+            if word == 'for':
+                return self.for_statement()
+            if word in ('break', 'continue'):
+                self.next()
+                if self.peek().kind == 'id':
+                    raise Unsupported('метки')
+                self.expect(';')
+                return (word,)
+            if word == 'return':
+                self.next()
+                value = None if self.at(';') else self.expression()
+                self.expect(';')
+                return ('return', value)
+            if word == 'assert':
+                # Dart VM по умолчанию не проверяет assert, но выражение должно быть корректным
+                self.next()
+                self.expect('(')
+                args = self.arguments_after_paren()
+                self.expect(';')
+                return ('assert', args)
+            kind = self.looks_like_declaration()
+            if kind == 'var':
+                return self.var_declaration()
+            if kind == 'func':
+                return self.function()
+            if word in RESERVED and word not in ('true', 'false', 'null'):
+                raise Unsupported(f'неподдерживаемый оператор {word}')
+        expression = self.expression()
+        self.expect(';')
+        return ('expr', expression)
+
+    def for_statement(self):
+        self.next()
+        self.expect('(')
+        start = self.i
+        # for (var x in ...) / for (final String x in ...) / for (x in ...)
+        final = False
+        bare = not (self.at('var') or self.at('final'))
+        if not bare:
+            final = self.next().value == 'final'
+        declared = self.try_type()
+        bare = bare and declared is None
+        if self.peek().kind == 'id' and self.at('in', 1):
+            name = self.ident()
+            self.expect('in')
+            iterable = self.expression()
+            self.expect(')')
+            return ('forin', declared, final, name, iterable, self.statement(), bare)
+        self.i = start
+
+        init = None
+        if not self.at(';'):
+            if self.at('var') or self.at('final') or self.looks_like_declaration() == 'var':
+                init = self.var_declaration(allow_in=True)
+            else:
+                init = ('expr', self.expression())
+        self.expect(';')
+        condition = None if self.at(';') else self.expression()
+        self.expect(';')
+        updates = []
+        while not self.at(')'):
+            updates.append(self.expression())
+            if not self.accept(','):
+                break
+        self.expect(')')
+        return ('for', init, condition, updates, self.statement())
+
+    # --- выражения ---
+
+    def expression(self):
+        left = self.conditional()
+        token = self.peek()
+        if token.kind == 'op' and token.value in ASSIGN_OPS:
+            self.next()
+            if left[0] not in ('name', 'index'):
+                raise Unsupported('присваивание этому выражению')
+            return ('assign', token.value, left, self.expression())
+        return left
+
+    def conditional(self):
+        condition = self.if_null()
+        if self.accept('?'):
+            then = self.expression()
+            self.expect(':')
+            return ('cond', condition, then, self.expression())
+        return condition
+
+    def if_null(self):
+        left = self.logic_or()
+        while self.accept('??'):
+            left = ('ifnull', left, self.logic_or())
+        return left
+
+    def logic_or(self):
+        left = self.logic_and()
+        while self.accept('||'):
+            left = ('or', left, self.logic_and())
+        return left
+
+    def logic_and(self):
+        left = self.equality()
+        while self.accept('&&'):
+            left = ('and', left, self.equality())
+        return left
+
+    def equality(self):
+        left = self.relational()
+        if self.at('==') or self.at('!='):
+            op = self.next().value
+            left = ('binary', op, left, self.relational())
+        return left
+
+    def relational(self):
+        left = self.additive()
+        if self.at('is') or self.at('as'):
+            raise Unsupported('is/as')
+        for op in ('<', '>', '<=', '>='):
+            if self.at(op):
+                self.next()
+                return ('binary', op, left, self.additive())
+        return left
+
+    def additive(self):
+        left = self.multiplicative()
+        while self.at('+') or self.at('-'):
+            op = self.next().value
+            left = ('binary', op, left, self.multiplicative())
+        return left
+
+    def multiplicative(self):
+        left = self.unary()
+        while self.at('*') or self.at('/') or self.at('~/') or self.at('%'):
+            op = self.next().value
+            left = ('binary', op, left, self.unary())
+        return left
+
+    def unary(self):
+        if self.at('-') or self.at('!'):
+            op = self.next().value
+            operand = self.unary()
+            if op == '-' and operand[0] == 'num':
+                return ('num', -operand[1])
+            return ('unary', op, operand)
+        if self.at('++') or self.at('--'):
+            op = self.next().value
+            target = self.unary()
+            if target[0] not in ('name', 'index'):
+                raise Unsupported('инкремент этого выражения')
+            return ('preinc', op, target)
+        return self.postfix()
+
+    def postfix(self):
+        node = self.primary()
+        while True:
+            if self.at('.') or self.at('?.'):
+                nullsafe = self.next().value == '?.'
+                name = self.ident()
+                if self.at('('):
+                    self.next()
+                    node = ('method', node, name, self.arguments_after_paren(), nullsafe)
+                else:
+                    node = ('prop', node, name, nullsafe)
+            elif self.at('['):
+                self.next()
+                index = self.expression()
+                self.expect(']')
+                node = ('index', node, index)
+            elif self.at('('):
+                self.next()
+                node = ('call', node, self.arguments_after_paren())
+            elif self.at('!') and not self.at('=', 1):
+                self.next()
+                node = ('notnull', node)
+            elif self.at('++') or self.at('--'):
+                if node[0] not in ('name', 'index'):
+                    raise Unsupported('инкремент этого выражения')
+                return ('postinc', self.next().value, node)
+            else:
+                return node
+
+    def arguments_after_paren(self):
+        args = []
+        while not self.at(')'):
+            if self.peek().kind == 'id' and self.at(':', 1):
+                raise Unsupported('именованные аргументы')
+            args.append(self.expression())
+            if not self.accept(','):
+                break
+        self.expect(')')
+        return args
+
+    def is_lambda(self):
+        """( ... ) => или ( ... ) { - функциональный литерал"""
+        depth = 0
+        k = 0
+        while True:
+            token = self.peek(k)
+            if token.kind == 'eof':
+                return False
+            if token.kind == 'op' and token.value in '([{':
+                depth += 1
+            elif token.kind == 'op' and token.value in ')]}':
+                depth -= 1
+                if depth == 0:
+                    follow = self.peek(k + 1)
+                    return follow.kind == 'op' and follow.value in ('=>', '{')
+            k += 1
+
+    def primary(self):
+        token = self.peek()
+        if token.kind == 'num':
+            self.next()
+            return ('num', token.value)
+        if token.kind == 'str':
+            parts = []
+            while self.peek().kind == 'str':
+                for part in self.next().value:
+                    parts.append(part if isinstance(part, str) else _parse_interpolation(part))
+            return ('str', parts)
+        if token.kind == 'op':
+            if token.value == '(':
+                if self.is_lambda():
+                    params = self.params()
+                    if self.accept('=>'):
+                        return ('lambda', params, self.expression(), True)
+                    return ('lambda', params, self.block(), False)
+                self.next()
+                inner = self.expression()
+                self.expect(')')
+                return inner
+            if token.value == '[':
+                return self.list_literal(None, False)
+            if token.value == '{':
+                return self.map_literal(None, False)
+            if token.value == '<':
+                self.next()
+                args = [self.type()]
+                while self.accept(','):
+                    args.append(self.type())
+                self.expect('>')
+                if len(args) == 1 and self.at('['):
+                    return self.list_literal(args[0], False)
+                if len(args) == 2 and self.at('{'):
+                    return self.map_literal(tuple(args), False)
+                raise Unsupported('типизированный литерал')
+            raise Unsupported(f'неожиданный символ {token.value}')
+        if token.kind == 'id':
+            word = token.value
+            if word in ('true', 'false', 'null'):
+                self.next()
+                return ('lit', {'true': True, 'false': False, 'null': None}[word])
+            if word == 'const':
+                self.next()
+                node = self.primary()
+                if node[0] not in ('list', 'map'):
+                    raise Unsupported('const')
+                return node[:-1] + (True,)
+            if word in RESERVED:
+                raise Unsupported(f'неподдерживаемое слово {word}')
+            self.next()
+            return ('name', word)
+        raise Unsupported('неожиданный конец программы')
+
+    def list_literal(self, element_type, const):
+        self.expect('[')
+        elements = []
+        while not self.at(']'):
+            if self.at('...') or self.at('if') or self.at('for'):
+                raise Unsupported('элементы коллекций с if/for/...')
+            elements.append(self.expression())
+            if not self.accept(','):
+                break
+        self.expect(']')
+        return ('list', element_type, elements, const)
+
+    def map_literal(self, types, const):
+        self.expect('{')
+        entries = []
+        while not self.at('}'):
+            key = self.expression()
+            if not self.accept(':'):
+                raise Unsupported('множества (Set)')
+            entries.append((key, self.expression()))
+            if not self.accept(','):
+                break
+        self.expect('}')
+        return ('map', types, entries, const)
+
+
+def _parse_interpolation(tokens):
+    parser = Parser(tokens)
+    node = parser.expression()
+    if parser.peek().kind != 'eof':
+        raise Unsupported('сложная интерполяция')
+    return node
+
+
+def parse(source):
+    tokens, _ = tokenize(source)
+    return Parser(tokens).program()
+
+
+# ---------------------------------------------------------------------------
+# Значения
+
+class DartList(list):
+    """Список Dart: тип элементов и признак фиксированной длины/неизменяемости"""
+
+    def __init__(self, items=(), element_type=DYNAMIC, fixed=False, const=False):
+        super().__init__(items)
+        self.element_type = element_type
+        self.fixed = fixed
+        self.const = const
+
+    __hash__ = object.__hash__
+
+
+class DartMap(dict):
+    def __init__(self, items=(), key_type=DYNAMIC, value_type=DYNAMIC, const=False):
+        super().__init__(items)
+        self.key_type = key_type
+        self.value_type = value_type
+        self.const = const
+
+    __hash__ = object.__hash__
+
+
+class DartIterable:
+    """Ленивая последовательность (map, where, keys, reversed...): как в Dart,
+    функция вызывается заново при каждом проходе"""
+
+    def __init__(self, produce, element_type=DYNAMIC):
+        self.produce = produce
+        self.element_type = element_type
+
+    def __iter__(self):
+        return iter(self.produce())
+
+
+class Function:
+    def __init__(self, name, params, return_type, body, is_expression, scope):
+        self.name = name
+        self.params = params
+        self.return_type = return_type
+        self.body = body
+        self.is_expression = is_expression
+        self.scope = scope
+
+
+class Builtin:
+    def __init__(self, name, call):
+        self.name = name
+        self.call = call
+
+
+class TypeRef:
+    """Имя типа в выражении: int.parse, List.filled..."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+_UNASSIGNED = object()
+_LAZY = object()
+
+
+class _Break(Exception):
+    pass
+
+
+class _Continue(Exception):
+    pass
+
+
+class _Return(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+def _is_int(value):
+    return type(value) is int
+
+
+def _is_num(value):
+    return type(value) in (int, float)
+
+
+def _wrap_int(value):
+    """Целые Dart VM - 64-битные с переполнением"""
+    if -(1 << 63) <= value < (1 << 63):
+        return value
+    return ((value + (1 << 63)) % (1 << 64)) - (1 << 63)
+
+
+def format_double(value):
+    """double.toString() как в Dart"""
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return 'Infinity' if value > 0 else '-Infinity'
+    if value == 0:
+        return '-0.0' if math.copysign(1, value) < 0 else '0.0'
+    magnitude = abs(value)
+    if 1e-6 <= magnitude < 1e21:
+        if value == int(value):
+            return f'{int(value)}.0'
+        text = repr(value)
+        if 'e' in text:
+            text = format(Decimal(text), 'f')
+        return text
+    mantissa, exponent = repr(value).split('e') if 'e' in repr(value) else (repr(value), '0')
+    if mantissa.endswith('.0'):
+        mantissa = mantissa[:-2]
+    sign = '-' if exponent.startswith('-') else '+'
+    return f'{mantissa}e{sign}{int(exponent.lstrip("+-"))}'
+
+
+def to_dart_string(value):
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if type(value) is int:
+        return str(value)
+    if type(value) is float:
+        return format_double(value)
+    if type(value) is str:
+        return value
+    if isinstance(value, DartList):
+        return '[' + ', '.join(to_dart_string(item) for item in value) + ']'
+    if isinstance(value, DartMap):
+        return '{' + ', '.join(f'{to_dart_string(k)}: {to_dart_string(v)}' for k, v in value.items()) + '}'
+    if isinstance(value, DartIterable):
+        items = list(value)
+        if len(items) > 100:
+            raise Unsupported('длинный Iterable.toString')
+        return '(' + ', '.join(to_dart_string(item) for item in items) + ')'
+    raise Unsupported('toString для этого значения')
+
+
+def dart_equals(a, b):
+    if isinstance(a, (DartList, DartMap, DartIterable, Function)) or \
+            isinstance(b, (DartList, DartMap, DartIterable, Function)):
+        return a is b
+    if type(a) is bool or type(b) is bool:
+        return type(a) is type(b) and a == b
+    return a == b
+
+
+def _type_of(value):
+    """Статический тип, который Dart вывел бы для значения инициализатора"""
+    if value is None:
+        return DYNAMIC
+    if type(value) is bool:
+        return ('bool', (), False)
+    if type(value) is int:
+        return ('int', (), False)
+    if type(value) is float:
+        return ('double', (), False)
+    if type(value) is str:
+        return ('String', (), False)
+    if isinstance(value, DartList):
+        return ('List', (value.element_type,), False)
+    if isinstance(value, DartMap):
+        return ('Map', (value.key_type, value.value_type), False)
+    if isinstance(value, DartIterable):
+        return ('Iterable', (value.element_type,), False)
+    return DYNAMIC
+
+
+def _common_type(values):
+    """Тип элементов литерала коллекции без явного типа"""
+    if not values:
+        return DYNAMIC
+    types = {_type_of(value)[:2] for value in values if value is not None}
+    nullable = any(value is None for value in values)
+    if not types:
+        return DYNAMIC
+    if len(types) == 1:
+        name, args = types.pop()
+        return (name, args, nullable)
+    if types <= {('int', ()), ('double', ())}:
+        return ('num', (), nullable)
+    return ('Object', (), nullable)
+
+
+def _same_type(a, b):
+    if a[0] == 'dynamic' or b[0] == 'dynamic':
+        return a[0] == b[0] or a[0] == 'dynamic'
+    return a[0] == b[0] and a[2] == b[2] and len(a[1]) == len(b[1]) and \
+        all(_same_type(x, y) for x, y in zip(a[1], b[1]))
+
+
+def _round_half_up(value, places=0):
+    return Decimal(value).quantize(Decimal(1).scaleb(-places), rounding=ROUND_HALF_UP)
+
+
+# ---------------------------------------------------------------------------
+# Выполнение
+
+class Scope:
+    __slots__ = ('vars', 'parent')
+
+    def __init__(self, parent=None):
+        self.vars = {}
+        self.parent = parent
+
+    def find(self, name):
+        scope = self
+        while scope is not None:
+            entry = scope.vars.get(name)
+            if entry is not None:
+                return entry
+            scope = scope.parent
+        return None
+
+
+class Interpreter:
+    def __init__(self, max_steps=MAX_STEPS, max_output_bytes=MAX_OUTPUT_BYTES):
+        self.max_steps = max_steps
+        self.max_output_bytes = max_output_bytes
+        self.steps = 0
+        self.depth = 0
+        self.lines = []
+        self.output_bytes = 0
+        self.globals = Scope()
+        self.globals.vars['print'] = [Builtin('print', self._print), DYNAMIC, True]
+
+    # --- вспомогательное ---
+
+    def _tick(self):
+        self.steps += 1
+        if self.steps > self.max_steps:
+            raise Unsupported('слишком долгое выполнение')
+
+    def _print(self, args):
+        if len(args) != 1:
+            raise Unsupported('print с несколькими аргументами')
+        text = to_dart_string(args[0])
+        self.output_bytes += len(text.encode('utf-8')) + 1
+        if self.output_bytes > self.max_output_bytes:
+            raise Unsupported('слишком большой вывод')
+        self.lines.append(text)
+        return None
+
+    def conform(self, declared, value, node=None):
+        """Проверяет, что значение подходит к объявленному типу (как проверил бы
+        компилятор Dart); int-литерал в контексте double становится double"""
+        name, args, nullable = declared
+        if value is None:
+            if nullable or name == 'dynamic':
+                return None
+            raise Unsupported('null в ненулевом типе')
+        if name in ('dynamic', 'Object'):
+            return value
+        if name == 'int':
+            ok = type(value) is int
+        elif name == 'double':
+            if type(value) is int and node is not None and node[0] == 'num':
+                return float(value)
+            ok = type(value) is float
+        elif name == 'num':
+            ok = _is_num(value)
+        elif name == 'String':
+            ok = type(value) is str
+        elif name == 'bool':
+            ok = type(value) is bool
+        elif name == 'List':
+            ok = isinstance(value, DartList) and (not args or _same_type(args[0], value.element_type))
+        elif name == 'Map':
+            ok = isinstance(value, DartMap) and (
+                not args or (_same_type(args[0], value.key_type) and _same_type(args[1], value.value_type)))
+        elif name == 'Iterable':
+            ok = isinstance(value, (DartList, DartIterable)) and (
+                not args or _same_type(args[0], value.element_type))
+        else:
+            ok = False
+        if not ok:
+            raise Unsupported('несовпадение типов')
+        return value
+
+    # --- запуск ---
+
+    def run(self, source):
+        functions, variables = parse(source)
+        for name, function in functions.items():
+            self.globals.vars[name] = [self._make_function(function, self.globals), DYNAMIC, True]
+        for declaration in variables:
+            declared, final, declarators = declaration[1:]
+            for name, init in declarators:
+                if name in self.globals.vars:
+                    raise Unsupported('повторное объявление')
+                # Переменные верхнего уровня в Dart инициализируются при первом обращении
+                self.globals.vars[name] = [_LAZY, (declared, init), final]
+        if 'main' not in functions:
+            raise Unsupported('нет функции main')
+        _Resolver(functions, variables).check()
+        main = self.globals.vars['main'][0]
+        if len(main.params) > 1:
+            raise Unsupported('main с несколькими параметрами')
+        self.call_function(main, [DartList(element_type=('String', (), False))] if main.params else [], [])
+        return '\n'.join(self.lines)
+
+    def _make_function(self, node, scope):
+        _, name, return_type, params, body, is_expression = node
+        return Function(name, params, return_type, body, is_expression, scope)
+
+    def call_function(self, function, args, arg_nodes):
+        if isinstance(function, Builtin):
+            return function.call(args)
+        if not isinstance(function, Function):
+            raise Unsupported('вызов не функции')
+        if len(args) != len(function.params):
+            raise Unsupported('неверное число аргументов')
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise Unsupported('слишком глубокая рекурсия')
+        scope = Scope(function.scope)
+        for i, ((name, declared), value) in enumerate(zip(function.params, args)):
+            node = arg_nodes[i] if i < len(arg_nodes) else None
+            scope.vars[name] = [self.conform(declared, value, node), declared, False]
+        try:
+            if function.is_expression:
+                result = self.eval(function.body, scope)
+                result_node = function.body
+            else:
+                try:
+                    self.exec_block(function.body[1], scope)
+                    result, result_node = None, None
+                    if function.return_type[0] not in ('void', 'dynamic') and not function.return_type[2]:
+                        raise Unsupported('функция может завершиться без return')
+                except _Return as r:
+                    result, result_node = r.value
+        finally:
+            self.depth -= 1
+        if function.return_type[0] == 'void':
+            return None
+        return self.conform(function.return_type, result, result_node)
+
+    # --- операторы ---
+
+    def exec_block(self, statements, scope):
+        for statement in statements:
+            self.execute(statement, scope)
+
+    def execute(self, node, scope):
+        self._tick()
+        kind = node[0]
+        if kind == 'expr':
+            self.eval(node[1], scope)
+        elif kind == 'vardecl':
+            self.declare(node, scope)
+        elif kind == 'block':
+            self.exec_block(node[1], Scope(scope))
+        elif kind == 'if':
+            if self.condition(node[1], scope):
+                self.execute(node[2], Scope(scope))
+            elif node[3] is not None:
+                self.execute(node[3], Scope(scope))
+        elif kind == 'for':
+            self.exec_for(node, scope)
+        elif kind == 'forin':
+            self.exec_forin(node, scope)
+        elif kind == 'while':
+            while self.condition(node[1], scope):
+                self._tick()
+                try:
+                    self.execute(node[2], Scope(scope))
+                except _Break:
+                    break
+                except _Continue:
+                    continue
+        elif kind == 'do':
+            while True:
+                self._tick()
+                try:
+                    self.execute(node[1], Scope(scope))
+                except _Break:
+                    break
+                except _Continue:
+                    pass
+                if not self.condition(node[2], scope):
+                    break
+        elif kind == 'break':
+            raise _Break()
+        elif kind == 'continue':
+            raise _Continue()
+        elif kind == 'return':
+            value = self.eval(node[1], scope) if node[1] is not None else None
+            raise _Return((value, node[1]))
+        elif kind == 'func':
+            function = self._make_function(node, scope)
+            scope.vars[node[1]] = [function, DYNAMIC, True]
+        elif kind == 'assert':
+            pass
+        else:
+            raise Unsupported(f'оператор {kind}')
+
+    def declare(self, node, scope):
+        _, declared, final, declarators = node
+        for name, init in declarators:
+            if name in scope.vars:
+                raise Unsupported('повторное объявление')
+            if init is None:
+                if declared is None:
+                    scope.vars[name] = [None, DYNAMIC, final]
+                elif declared[2] or declared[0] == 'dynamic':
+                    scope.vars[name] = [None, declared, final]
+                else:
+                    scope.vars[name] = [_UNASSIGNED, declared, final]
+                continue
+            value = self.eval(init, scope, declared)
+            if declared is None:
+                declared = _type_of(value)
+            else:
+                value = self.conform(declared, value, init)
+            scope.vars[name] = [value, declared, final]
+
+    def condition(self, node, scope):
+        value = self.eval(node, scope)
+        if type(value) is not bool:
+            raise Unsupported('условие не bool')
+        return value
+
+    def exec_for(self, node, scope):
+        _, init, condition, updates, body = node
+        loop_scope = Scope(scope)
+        if init is not None:
+            self.execute(init, loop_scope)
+        while condition is None or self.condition(condition, loop_scope):
+            self._tick()
+            try:
+                self.execute(body, Scope(loop_scope))
+            except _Break:
+                break
+            except _Continue:
+                pass
+            for update in updates:
+                self.eval(update, loop_scope)
+
+    def exec_forin(self, node, scope):
+        _, declared, final, name, iterable_node, body, bare = node
+        iterable = self.eval(iterable_node, scope)
+        if not isinstance(iterable, (DartList, DartIterable)):
+            raise Unsupported('for-in не по списку')
+        # Изменение списка во время обхода в Dart - ошибка; проверяем длину
+        length = len(iterable) if isinstance(iterable, DartList) else None
+        for item in iterable:
+            self._tick()
+            if length is not None and len(iterable) != length:
+                raise Unsupported('изменение списка во время обхода')
+            loop_scope = Scope(scope)
+            if bare:
+                self.assign_name(name, item, scope, None)
+            else:
+                element_type = declared or iterable.element_type
+                loop_scope.vars[name] = [self.conform(element_type, item), element_type, final]
+            try:
+                self.execute(body, loop_scope)
+            except _Break:
+                break
+            except _Continue:
+                continue
+
+    # --- выражения ---
+
+    def eval(self, node, scope, context=None):
+        kind = node[0]
+        if kind == 'num' or kind == 'lit':
+            return node[1]
+        if kind == 'str':
+            return ''.join(part if isinstance(part, str) else to_dart_string(self.eval(part, scope))
+                           for part in node[1])
+        if kind == 'name':
+            return self.lookup(node[1], scope)
+        if kind == 'binary':
+            return self.binary(node[1], self.eval(node[2], scope), self.eval(node[3], scope))
+        if kind == 'and' or kind == 'or':
+            left = self.eval(node[1], scope)
+            if type(left) is not bool:
+                raise Unsupported('логический оператор не для bool')
+            if (kind == 'and') != left:
+                return left
+            right = self.eval(node[2], scope)
+            if type(right) is not bool:
+                raise Unsupported('логический оператор не для bool')
+            return right
+        if kind == 'ifnull':
+            left = self.eval(node[1], scope)
+            return left if left is not None else self.eval(node[2], scope)
+        if kind == 'cond':
+            return self.eval(node[2] if self.condition(node[1], scope) else node[3], scope, context)
+        if kind == 'unary':
+            value = self.eval(node[2], scope)
+            if node[1] == '!':
+                if type(value) is not bool:
+                    raise Unsupported('! не для bool')
+                return not value
+            if not _is_num(value):
+                raise Unsupported('унарный минус не для числа')
+            return _wrap_int(-value) if type(value) is int else -value
+        if kind == 'assign':
+            return self.assign(node, scope)
+        if kind == 'preinc' or kind == 'postinc':
+            old = self.eval(node[2], scope)
+            if not _is_num(old):
+                raise Unsupported('инкремент не числа')
+            new = self.binary('+' if node[1] == '++' else '-', old, 1)
+            self.store(node[2], new, scope, None)
+            return new if kind == 'preinc' else old
+        if kind == 'index':
+            return self.index(self.eval(node[1], scope), self.eval(node[2], scope))
+        if kind == 'prop':
+            target = self.eval(node[1], scope)
+            if target is None and node[3]:
+                return None
+            return self.property(target, node[2])
+        if kind == 'method':
+            target = self.eval(node[1], scope)
+            if target is None and node[4]:
+                return None
+            args = [self.eval(arg, scope) for arg in node[3]]
+            return self.method(target, node[2], args, node[3])
+        if kind == 'call':
+            function = self.eval(node[1], scope)
+            args = [self.eval(arg, scope) for arg in node[2]]
+            return self.call_function(function, args, node[2])
+        if kind == 'notnull':
+            value = self.eval(node[1], scope)
+            if value is None:
+                raise Unsupported('null check')
+            return value
+        if kind == 'list':
+            return self.list_literal(node, scope, context)
+        if kind == 'map':
+            return self.map_literal(node, scope, context)
+        if kind == 'lambda':
+            return Function('<lambda>', node[1], DYNAMIC, node[2], node[3], scope)
+        raise Unsupported(f'выражение {kind}')
+
+    def list_literal(self, node, scope, context):
+        _, element_type, element_nodes, const = node
+        if element_type is None and context is not None and context[0] in ('List', 'Iterable') and context[1]:
+            element_type = context[1][0]
+        values = [self.eval(element, scope, element_type) for element in element_nodes]
+        if element_type is None:
+            element_type = _common_type(values)
+        else:
+            values = [self.conform(element_type, value, element)
+                      for value, element in zip(values, element_nodes)]
+        return DartList(values, element_type, fixed=const, const=const)
+
+    def map_literal(self, node, scope, context):
+        _, types, entry_nodes, const = node
+        if types is None and context is not None and context[0] == 'Map' and context[1]:
+            types = context[1]
+        keys = [self.eval(key, scope) for key, _ in entry_nodes]
+        values = [self.eval(value, scope, types[1] if types else None) for _, value in entry_nodes]
+        if types is None:
+            types = (_common_type(keys), _common_type(values))
+        else:
+            keys = [self.conform(types[0], key, n) for key, (n, _) in zip(keys, entry_nodes)]
+            values = [self.conform(types[1], value, n) for value, (_, n) in zip(values, entry_nodes)]
+        result = DartMap(key_type=types[0], value_type=types[1], const=const)
+        for key, value in zip(keys, values):
+            if any(type(key) is bool and type(k) is not bool and k == key for k in result):
+                raise Unsupported('ключи bool и int')
+            result[key] = value
+        return result
+
+    def lookup(self, name, scope):
+        entry = scope.find(name)
+        if entry is None:
+            if name in TYPE_NAMES:
+                return TypeRef(name)
+            raise Unsupported(f'неизвестное имя {name}')
+        value = entry[0]
+        if value is _LAZY:
+            declared, init = entry[1]
+            entry[0] = _UNASSIGNED  # цикл инициализации - ошибка Dart
+            value = self.eval(init, self.globals, declared) if init is not None else None
+            if declared is None:
+                declared = _type_of(value) if init is not None else DYNAMIC
+            else:
+                value = self.conform(declared, value, init)
+            entry[0], entry[1] = value, declared
+        if value is _UNASSIGNED:
+            raise Unsupported('переменная без значения')
+        return value
+
+    def assign(self, node, scope):
+        _, op, target, value_node = node
+        if op == '=':
+            value = self.eval(value_node, scope, self._static_type(target, scope))
+        elif op == '??=':
+            current = self.eval(target, scope)
+            if current is not None:
+                return current
+            value = self.eval(value_node, scope)
+        else:
+            current = self.eval(target, scope)
+            value = self.binary(op[:-1], current, self.eval(value_node, scope))
+            value_node = None
+        self.store(target, value, scope, value_node)
+        return value
+
+    def _static_type(self, target, scope):
+        if target[0] == 'name':
+            entry = scope.find(target[1])
+            return entry[1] if entry is not None and entry[0] is not _LAZY else None
+        return None
+
+    def store(self, target, value, scope, value_node):
+        if target[0] == 'name':
+            self.assign_name(target[1], value, scope, value_node)
+            return
+        container = self.eval(target[1], scope)
+        key = self.eval(target[2], scope)
+        if isinstance(container, DartList):
+            if container.const or type(key) is not int or not 0 <= key < len(container):
+                raise Unsupported('запись по индексу')
+            container[key] = self.conform(container.element_type, value, value_node)
+        elif isinstance(container, DartMap):
+            if container.const:
+                raise Unsupported('изменение const карты')
+            key = self.conform(container.key_type, key)
+            container[key] = self.conform(container.value_type, value, value_node)
+        else:
+            raise Unsupported('запись по индексу')
+
+    def assign_name(self, name, value, scope, value_node):
+        entry = scope.find(name)
+        if entry is None or isinstance(entry[0], (Function, Builtin)):
+            raise Unsupported(f'присваивание неизвестной переменной {name}')
+        if entry[0] is _LAZY:
+            self.lookup(name, scope)
+        if entry[2] and entry[0] is not _UNASSIGNED:
+            raise Unsupported('присваивание final переменной')
+        entry[0] = self.conform(entry[1], value, value_node)
+
+    def binary(self, op, a, b):
+        if op == '==':
+            return dart_equals(a, b)
+        if op == '!=':
+            return not dart_equals(a, b)
+        if op == '+' and type(a) is str:
+            if type(b) is not str:
+                raise Unsupported('String + не String')
+            return a + b
+        if op == '+' and isinstance(a, DartList):
+            if not isinstance(b, DartList):
+                raise Unsupported('List + не List')
+            return DartList(list(a) + list(b), a.element_type)
+        if op == '*' and type(a) is str:
+            if type(b) is not int or b < 0:
+                raise Unsupported('String * не int')
+            if len(a) * b > self.max_output_bytes:
+                raise Unsupported('слишком длинная строка')
+            return a * b
+        if not (_is_num(a) and _is_num(b)):
+            raise Unsupported(f'оператор {op} не для чисел')
+        both_int = type(a) is int and type(b) is int
+        if op == '+':
+            return _wrap_int(a + b) if both_int else float(a) + float(b)
+        if op == '-':
+            return _wrap_int(a - b) if both_int else float(a) - float(b)
+        if op == '*':
+            return _wrap_int(a * b) if both_int else float(a) * float(b)
+        if op == '/':
+            if b == 0:
+                if a == 0 or (type(a) is float and math.isnan(a)):
+                    return math.nan
+                return math.copysign(math.inf, a) * math.copysign(1, b)
+            return a / b
+        if op == '~/':
+            if both_int:
+                if b == 0:
+                    raise Unsupported('целочисленное деление на ноль')
+                quotient = abs(a) // abs(b)
+                return _wrap_int(quotient if (a < 0) == (b < 0) else -quotient)
+            if b == 0:
+                raise Unsupported('деление на ноль')
+            result = a / b
+            if math.isinf(result) or math.isnan(result):
+                raise Unsupported('~/ бесконечности')
+            return int(result)
+        if op == '%':
+            if b == 0:
+                if both_int:
+                    raise Unsupported('остаток от деления на ноль')
+                return math.nan
+            result = a % abs(b)
+            return result if both_int else float(result)
+        if op in ('<', '>', '<=', '>='):
+            if op == '<':
+                return a < b
+            if op == '>':
+                return a > b
+            if op == '<=':
+                return a <= b
+            return a >= b
+        raise Unsupported(f'оператор {op}')
+
+    def index(self, target, key):
+        if type(target) is str:
+            if type(key) is not int or not 0 <= key < len(target) or _has_astral(target):
+                raise Unsupported('индекс строки')
+            return target[key]
+        if isinstance(target, DartList):
+            if type(key) is not int or not 0 <= key < len(target):
+                raise Unsupported('индекс вне списка')
+            return target[key]
+        if isinstance(target, DartMap):
+            if type(key) is bool and any(type(k) is not bool and k == key for k in target):
+                raise Unsupported('ключи bool и int')
+            return target.get(key)
+        raise Unsupported('индексирование')
+
+    # --- свойства и методы встроенных типов ---
+
+    def property(self, target, name):
+        if type(target) is str:
+            if name == 'length':
+                if _has_astral(target):
+                    raise Unsupported('длина строки с суррогатами')
+                return len(target)
+            if name == 'isEmpty':
+                return not target
+            if name == 'isNotEmpty':
+                return bool(target)
+        elif _is_num(target):
+            if name == 'isNegative':
+                return target < 0 or (type(target) is float and math.copysign(1, target) < 0)
+            if type(target) is int:
+                if name == 'isEven':
+                    return target % 2 == 0
+                if name == 'isOdd':
+                    return target % 2 == 1
+                if name == 'sign':
+                    return (target > 0) - (target < 0)
+        elif isinstance(target, (DartList, DartIterable)):
+            items = target if isinstance(target, DartList) else list(target)
+            if name == 'length':
+                return len(items)
+            if name == 'isEmpty':
+                return not items
+            if name == 'isNotEmpty':
+                return bool(items)
+            if name in ('first', 'last'):
+                if not items:
+                    raise Unsupported('first/last пустого списка')
+                return items[0] if name == 'first' else items[-1]
+            if name == 'reversed' and isinstance(target, DartList):
+                return DartIterable(lambda: reversed(list(target)), target.element_type)
+        elif isinstance(target, DartMap):
+            if name == 'length':
+                return len(target)
+            if name == 'isEmpty':
+                return not target
+            if name == 'isNotEmpty':
+                return bool(target)
+            if name == 'keys':
+                return DartIterable(lambda: list(target.keys()), target.key_type)
+            if name == 'values':
+                return DartIterable(lambda: list(target.values()), target.value_type)
+        raise Unsupported(f'свойство {name}')
+
+    def method(self, target, name, args, arg_nodes):
+        if isinstance(target, TypeRef):
+            return self.static_method(target.name, name, args, arg_nodes)
+        if name == 'toString' and not args:
+            return to_dart_string(target)
+        if type(target) is str:
+            return self.string_method(target, name, args)
+        if _is_num(target):
+            return self.number_method(target, name, args)
+        if isinstance(target, DartList):
+            return self.list_method(target, name, args, arg_nodes)
+        if isinstance(target, DartIterable):
+            return self.iterable_method(target, name, args)
+        if isinstance(target, DartMap):
+            return self.map_method(target, name, args, arg_nodes)
+        raise Unsupported(f'метод {name}')
+
+    def _callback(self, function, arity):
+        if not isinstance(function, (Function, Builtin)):
+            raise Unsupported('ожидалась функция')
+        if isinstance(function, Function) and len(function.params) != arity:
+            raise Unsupported('неверная арность функции')
+        return lambda *args: self.call_function(function, list(args), [])
+
+    def static_method(self, type_name, name, args, arg_nodes):
+        if type_name in ('int', 'double', 'num') and name in ('parse', 'tryParse') and len(args) == 1:
+            text = args[0]
+            if type(text) is not str:
+                raise Unsupported('parse не строки')
+            value = _parse_number(text, type_name)
+            if value is None and name == 'parse':
+                raise Unsupported('FormatException')
+            return value
+        if type_name == 'List' and name == 'filled' and len(args) == 2:
+            if type(args[0]) is not int or args[0] < 0 or args[0] > 100000:
+                raise Unsupported('List.filled')
+            return DartList([args[1]] * args[0], _type_of(args[1]), fixed=True)
+        if type_name == 'List' and name == 'generate' and len(args) == 2:
+            if type(args[0]) is not int or args[0] < 0 or args[0] > 100000:
+                raise Unsupported('List.generate')
+            generate = self._callback(args[1], 1)
+            values = [generate(i) for i in range(args[0])]
+            return DartList(values, _common_type(values))
+        raise Unsupported(f'{type_name}.{name}')
+
+    def string_method(self, s, name, args):
+        if _has_astral(s) and name not in ('toUpperCase', 'toLowerCase', 'contains', 'trim', 'replaceAll'):
+            raise Unsupported('строка с суррогатами')
+        for arg in args:
+            if name not in ('substring', 'padLeft', 'padRight', 'codeUnitAt', 'split') and type(arg) is not str:
+                raise Unsupported(f'аргумент {name}')
+        n = len(args)
+        if name == 'toUpperCase' and n == 0:
+            return s.upper()
+        if name == 'toLowerCase' and n == 0:
+            return s.lower()
+        if name == 'trim' and n == 0:
+            return s.strip()
+        if name == 'trimLeft' and n == 0:
+            return s.lstrip()
+        if name == 'trimRight' and n == 0:
+            return s.rstrip()
+        if name == 'contains' and n == 1:
+            return args[0] in s
+        if name == 'startsWith' and n == 1:
+            return s.startswith(args[0])
+        if name == 'endsWith' and n == 1:
+            return s.endswith(args[0])
+        if name == 'indexOf' and n == 1:
+            return s.find(args[0])
+        if name == 'lastIndexOf' and n == 1:
+            return s.rfind(args[0])
+        if name == 'replaceAll' and n == 2:
+            if not args[0]:
+                raise Unsupported('replaceAll с пустым образцом')
+            return s.replace(args[0], args[1])
+        if name == 'replaceFirst' and n == 2:
+            if not args[0]:
+                raise Unsupported('replaceFirst с пустым образцом')
+            return s.replace(args[0], args[1], 1)
+        if name == 'compareTo' and n == 1:
+            return (s > args[0]) - (s < args[0])
+        if name == 'split' and n == 1 and type(args[0]) is str:
+            parts = list(s) if args[0] == '' else s.split(args[0])
+            return DartList(parts, ('String', (), False))
+        if name == 'substring' and n in (1, 2) and all(type(a) is int for a in args):
+            start = args[0]
+            end = args[1] if n == 2 else len(s)
+            if not 0 <= start <= end <= len(s):
+                raise Unsupported('RangeError')
+            return s[start:end]
+        if name in ('padLeft', 'padRight') and n in (1, 2) and type(args[0]) is int:
+            pad = args[1] if n == 2 else ' '
+            if type(pad) is not str:
+                raise Unsupported('padLeft')
+            missing = max(0, args[0] - len(s))
+            return pad * missing + s if name == 'padLeft' else s + pad * missing
+        if name == 'codeUnitAt' and n == 1 and type(args[0]) is int:
+            if not 0 <= args[0] < len(s):
+                raise Unsupported('RangeError')
+            return ord(s[args[0]])
+        raise Unsupported(f'String.{name}')
+
+    def number_method(self, x, name, args):
+        n = len(args)
+        if name == 'abs' and n == 0:
+            return _wrap_int(abs(x)) if type(x) is int else abs(x)
+        if name in ('round', 'floor', 'ceil', 'truncate', 'toInt') and n == 0:
+            if type(x) is int:
+                return x
+            if math.isnan(x) or math.isinf(x):
+                raise Unsupported('UnsupportedError')
+            if name == 'round':
+                result = int(_round_half_up(x))
+            elif name == 'floor':
+                result = math.floor(x)
+            elif name == 'ceil':
+                result = math.ceil(x)
+            else:
+                result = int(x)
+            if not -(1 << 63) <= result < (1 << 63):
+                raise Unsupported('переполнение')
+            return result
+        if name == 'toDouble' and n == 0:
+            return float(x)
+        if name == 'toStringAsFixed' and n == 1 and type(args[0]) is int:
+            digits = args[0]
+            if not 0 <= digits <= 20:
+                raise Unsupported('RangeError')
+            value = float(x)
+            if math.isnan(value) or math.isinf(value) or abs(value) >= 1e21:
+                return format_double(value)
+            return format(_round_half_up(value, digits), 'f')
+        if name == 'compareTo' and n == 1 and _is_num(args[0]):
+            return (x > args[0]) - (x < args[0])
+        if name == 'clamp' and n == 2 and all(_is_num(a) for a in args):
+            low, high = args
+            if low > high:
+                raise Unsupported('ArgumentError')
+            result = min(max(x, low), high)
+            return result
+        if name == 'remainder' and n == 1 and _is_num(args[0]):
+            if args[0] == 0:
+                raise Unsupported('деление на ноль')
+            return math.fmod(x, args[0]) if (type(x) is float or type(args[0]) is float) else \
+                int(math.copysign(abs(x) % abs(args[0]), x))
+        raise Unsupported(f'num.{name}')
+
+    def list_method(self, items, name, args, arg_nodes):
+        n = len(args)
+        mutating = name in ('add', 'addAll', 'insert', 'remove', 'removeAt', 'removeLast', 'clear', 'sort')
+        if mutating and (items.const or (items.fixed and name != 'sort')):
+            raise Unsupported('изменение неизменяемого списка')
+        if name == 'add' and n == 1:
+            items.append(self.conform(items.element_type, args[0], arg_nodes[0]))
+            return None
+        if name == 'addAll' and n == 1:
+            if not isinstance(args[0], (DartList, DartIterable)):
+                raise Unsupported('addAll')
+            items.extend(self.conform(items.element_type, value) for value in list(args[0]))
+            return None
+        if name == 'insert' and n == 2:
+            if type(args[0]) is not int or not 0 <= args[0] <= len(items):
+                raise Unsupported('RangeError')
+            items.insert(args[0], self.conform(items.element_type, args[1], arg_nodes[1]))
+            return None
+        if name == 'remove' and n == 1:
+            for i, value in enumerate(items):
+                if dart_equals(value, args[0]):
+                    del items[i]
+                    return True
+            return False
+        if name == 'removeAt' and n == 1:
+            if type(args[0]) is not int or not 0 <= args[0] < len(items):
+                raise Unsupported('RangeError')
+            return items.pop(args[0])
+        if name == 'removeLast' and n == 0:
+            if not items:
+                raise Unsupported('RangeError')
+            return items.pop()
+        if name == 'clear' and n == 0:
+            items.clear()
+            return None
+        if name == 'indexOf' and n == 1:
+            for i, value in enumerate(items):
+                if dart_equals(value, args[0]):
+                    return i
+            return -1
+        if name == 'sublist' and n in (1, 2) and all(type(a) is int for a in args):
+            end = args[1] if n == 2 else len(items)
+            if not 0 <= args[0] <= end <= len(items):
+                raise Unsupported('RangeError')
+            return DartList(items[args[0]:end], items.element_type)
+        if name == 'sort' and n <= 1:
+            if n == 0:
+                kinds = {type(value) for value in items}
+                if not (kinds <= {int, float} or kinds == {str}) and items:
+                    raise Unsupported('sort без компаратора')
+                if kinds == {str} and any(_has_astral(value) for value in items):
+                    raise Unsupported('sort строк с суррогатами')
+                items.sort()
+                return None
+            if len(items) > 32:
+                # Dart сортирует длинные списки неустойчиво - порядок равных может отличаться
+                raise Unsupported('sort длинного списка с компаратором')
+            compare = self._callback(args[0], 2)
+
+            def key_compare(a, b):
+                result = compare(a, b)
+                if type(result) is not int:
+                    raise Unsupported('компаратор вернул не int')
+                return result
+            items.sort(key=cmp_to_key(key_compare))
+            return None
+        return self.iterable_method(items, name, args)
+
+    def iterable_method(self, target, name, args):
+        n = len(args)
+        element_type = target.element_type
+        if name == 'toList' and n == 0:
+            return DartList(list(target), element_type)
+        if name == 'contains' and n == 1:
+            return any(dart_equals(value, args[0]) for value in target)
+        if name == 'join' and n <= 1:
+            separator = args[0] if n else ''
+            if type(separator) is not str:
+                raise Unsupported('join')
+            return separator.join(to_dart_string(value) for value in target)
+        if name == 'forEach' and n == 1:
+            action = self._callback(args[0], 1)
+            for value in list(target) if isinstance(target, DartIterable) else target:
+                action(value)
+            return None
+        if name == 'map' and n == 1:
+            transform = self._callback(args[0], 1)
+            return DartIterable(lambda: [transform(value) for value in target])
+        if name == 'where' and n == 1:
+            test = self._callback(args[0], 1)
+            return DartIterable(lambda: [value for value in target if self._bool(test(value))], element_type)
+        if name in ('any', 'every') and n == 1:
+            test = self._callback(args[0], 1)
+            check = any if name == 'any' else all
+            return check(self._bool(test(value)) for value in target)
+        if name == 'fold' and n == 2:
+            combine = self._callback(args[1], 2)
+            result = args[0]
+            for value in target:
+                result = combine(result, value)
+            return result
+        if name == 'reduce' and n == 1:
+            combine = self._callback(args[0], 2)
+            values = list(target)
+            if not values:
+                raise Unsupported('reduce пустого списка')
+            result = values[0]
+            for value in values[1:]:
+                result = combine(result, value)
+            return result
+        if name in ('take', 'skip') and n == 1 and type(args[0]) is int and args[0] >= 0:
+            count = args[0]
+            if name == 'take':
+                return DartIterable(lambda: list(target)[:count], element_type)
+            return DartIterable(lambda: list(target)[count:], element_type)
+        raise Unsupported(f'Iterable.{name}')
+
+    def map_method(self, target, name, args, arg_nodes):
+        n = len(args)
+        if name in ('remove', 'putIfAbsent', 'addAll', 'clear') and target.const:
+            raise Unsupported('изменение const карты')
+        if name == 'containsKey' and n == 1:
+            return args[0] in target and not (
+                type(args[0]) is bool and any(type(k) is not bool and k == args[0] for k in target))
+        if name == 'containsValue' and n == 1:
+            return any(dart_equals(value, args[0]) for value in target.values())
+        if name == 'remove' and n == 1:
+            return target.pop(args[0], None)
+        if name == 'putIfAbsent' and n == 2:
+            if args[0] not in target:
+                target[self.conform(target.key_type, args[0])] = self.conform(
+                    target.value_type, self._callback(args[1], 0)())
+            return target[args[0]]
+        if name == 'addAll' and n == 1 and isinstance(args[0], DartMap):
+            for key, value in args[0].items():
+                target[self.conform(target.key_type, key)] = self.conform(target.value_type, value)
+            return None
+        if name == 'clear' and n == 0:
+            target.clear()
+            return None
+        if name == 'forEach' and n == 1:
+            action = self._callback(args[0], 2)
+            for key, value in list(target.items()):
+                action(key, value)
+            return None
+        raise Unsupported(f'Map.{name}')
+
+    def _bool(self, value):
+        if type(value) is not bool:
+            raise Unsupported('ожидался bool')
+        return value
+
+
+def _has_astral(text):
+    """Есть ли символы вне BMP: в Dart это две кодовые единицы UTF-16"""
+    return any(ord(c) > 0xFFFF for c in text)
+
+
+_INT_TEXT = re.compile(r'[+-]?\d+|[+-]?0[xX][0-9a-fA-F]+')
+_DOUBLE_TEXT = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+
+def _parse_number(text, type_name):
+    """int.parse/double.parse; None - строка не число; сомнительное - Unsupported"""
+    if text != text.strip():
+        raise Unsupported('parse с пробелами')
+    if type_name in ('int', 'num') and _INT_TEXT.fullmatch(text):
+        value = int(text, 0) if 'x' in text.lower() else int(text)
+        if not -(1 << 63) <= value < (1 << 63):
+            raise Unsupported('переполнение')
+        return value
+    if type_name in ('double', 'num') and _DOUBLE_TEXT.fullmatch(text):
+        return float(text)
+    if text in ('NaN', 'Infinity', '-Infinity') or any(c.isdigit() for c in text):
+        raise Unsupported('нестандартная запись числа')
+    return None
+
+
+# Статические типы для _Resolver; None - тип не выведен (проверяется при выполнении)
+INT = ('int', (), False)
+DOUBLE = ('double', (), False)
+NUM = ('num', (), False)
+STRING = ('String', (), False)
+BOOL = ('bool', (), False)
+VOID = ('void', (), False)
+NULL = ('Null', (), True)
+NUMERIC = ('int', 'double', 'num')
+
+
+def _function_type(return_type, param_types):
+    """Тип функции: param_types - None, если число и типы аргументов не проверяются"""
+    return ('Function', (return_type, param_types), False)
+
+
+def _assignable(target, source, node=None):
+    """Можно ли присвоить значение типа source в target без неявного приведения"""
+    if target is None or source is None or target[0] == 'dynamic':
+        return True
+    if source[0] == 'void':
+        return False
+    if source[0] == 'dynamic':
+        return True
+    if source[0] == 'Null':
+        return target[2]
+    if source[2] and not target[2]:
+        return False
+    if target[0] in ('Object', source[0]):
+        return True
+    if target[0] == 'num':
+        return source[0] in ('int', 'double')
+    if target[0] == 'double' and source[0] == 'int':
+        # Целый литерал в контексте double - это double
+        return node is not None and node[0] == 'num'
+    if target[0] == 'Iterable':
+        return source[0] == 'List'
+    return False
+
+
+def _binary_type(op, left, right):
+    if op in ('==', '!=', '<', '>', '<=', '>='):
+        return BOOL
+    if left is None or right is None or left[2] or right[2]:
+        return None
+    if left[0] == 'String' and op in ('+', '*'):
+        return STRING
+    if left[0] == 'List' and op == '+':
+        return left
+    if left[0] in NUMERIC and right[0] in NUMERIC:
+        if op == '/':
+            return DOUBLE
+        if op == '~/':
+            return INT
+        if left[0] == right[0] == 'int':
+            return INT
+        if left[0] == 'double' or (left[0] == 'int' and right[0] == 'double'):
+            return DOUBLE
+        return NUM
+    return None
+
+
+_PROPERTY_TYPES = {
+    'String': {'length': INT, 'isEmpty': BOOL, 'isNotEmpty': BOOL},
+    'int': {'isEven': BOOL, 'isOdd': BOOL, 'isNegative': BOOL, 'sign': INT},
+    'double': {'isNegative': BOOL},
+    'num': {'isNegative': BOOL},
+    'List': {'length': INT, 'isEmpty': BOOL, 'isNotEmpty': BOOL},
+    'Iterable': {'length': INT, 'isEmpty': BOOL, 'isNotEmpty': BOOL},
+    'Map': {'length': INT, 'isEmpty': BOOL, 'isNotEmpty': BOOL},
+}
+
+_METHOD_TYPES = {
+    'String': dict(
+        {name: STRING for name in ('toUpperCase', 'toLowerCase', 'trim', 'trimLeft', 'trimRight', 'replaceAll',
+                                   'replaceFirst', 'substring', 'padLeft', 'padRight')},
+        contains=BOOL, startsWith=BOOL, endsWith=BOOL, indexOf=INT, lastIndexOf=INT, compareTo=INT,
+        codeUnitAt=INT, split=('List', (STRING,), False)),
+    'num': dict({name: INT for name in ('round', 'floor', 'ceil', 'truncate', 'toInt', 'compareTo')},
+                toDouble=DOUBLE, toStringAsFixed=STRING),
+    'List': dict({name: VOID for name in ('add', 'addAll', 'insert', 'clear', 'sort', 'forEach')},
+                 contains=BOOL, any=BOOL, every=BOOL, indexOf=INT, join=STRING),
+    'Iterable': dict(forEach=VOID, contains=BOOL, any=BOOL, every=BOOL, join=STRING),
+    'Map': dict(forEach=VOID, clear=VOID, addAll=VOID, containsKey=BOOL, containsValue=BOOL),
+}
+
+
+def _member_type(target, name, method):
+    """Тип свойства или результата метода встроенного типа; None - не выведен"""
+    if method and name == 'toString':
+        return STRING
+    if target is None or target[2]:
+        return None
+    kind = target[0]
+    if method:
+        if kind in NUMERIC and name == 'abs':
+            return target
+        return _METHOD_TYPES.get('num' if kind in NUMERIC else kind, {}).get(name)
+    if kind in ('List', 'Iterable') and target[1] and name in ('first', 'last'):
+        return target[1][0]
+    return _PROPERTY_TYPES.get(kind, {}).get(name)
+
+
+def _non_null(value_type):
+    return value_type[:2] + (False,) if value_type is not None else None
+
+
+def _loop_exits(node, jump):
+    """Есть ли в теле цикла break/continue (jump), относящийся к этому циклу"""
+    kind = node[0]
+    if kind == jump:
+        return True
+    if kind == 'block':
+        return any(_loop_exits(statement, jump) for statement in node[1])
+    if kind == 'if':
+        return _loop_exits(node[2], jump) or (node[3] is not None and _loop_exits(node[3], jump))
+    return False
+
+
+def _completes(node):
+    """Может ли оператор завершиться обычным образом, то есть без return"""
+    kind = node[0]
+    if kind in ('return', 'break', 'continue'):
+        return False
+    if kind == 'block':
+        return all(_completes(statement) for statement in node[1])
+    if kind == 'if':
+        return node[3] is None or _completes(node[2]) or _completes(node[3])
+    if kind == 'while':
+        return node[1] != ('lit', True) or _loop_exits(node[2], 'break')
+    if kind == 'for':
+        return node[2] not in (None, ('lit', True)) or _loop_exits(node[4], 'break')
+    if kind == 'do':
+        if _loop_exits(node[1], 'break'):
+            return True
+        return node[2] != ('lit', True) and (_completes(node[1]) or _loop_exits(node[1], 'continue'))
+    return True
+
+
+class _Resolver:
+    """Проверяет программу до запуска, как компилятор Dart: все имена
+    объявлены, значения присваиваются без неявного приведения типов, функция
+    с ненулевым типом результата всегда возвращает значение, результат void
+    не используется, целые литералы укладываются в 64 бита. Иначе ошибка в
+    невыполненной ветке осталась бы незамеченной. Где тип не выведен (None),
+    остаются проверки при выполнении."""
+
+    def __init__(self, functions, variables):
+        self.globals = {name: None for name in TYPE_NAMES}
+        self.globals['print'] = _function_type(VOID, None)
+        for name, node in functions.items():
+            self.globals[name] = _function_type(node[2], [declared for _, declared in node[3]])
+        self.functions = functions
+        self.variables = variables
+        # Типы результата объемлющих функций; None - у лямбды, он выводится
+        self.returns = []
+
+    def check(self):
+        scopes = [self.globals]
+        for declaration in self.variables:
+            for name, _ in declaration[3]:
+                self.globals[name] = None
+        for declaration in self.variables:
+            self.statement(declaration, scopes)
+        for function in self.functions.values():
+            self.function(function, scopes)
+
+    def function(self, node, scopes):
+        _, _, return_type, params, body, is_expression = node
+        scopes = scopes + [dict(params)]
+        if is_expression:
+            result = self.expression(body, scopes, void_ok=True)
+            if return_type[0] != 'void':
+                self.check_return(return_type, result, body)
+            return
+        self.returns.append(return_type)
+        try:
+            self.block(body[1], scopes)
+        finally:
+            self.returns.pop()
+        if return_type[0] not in ('void', 'dynamic') and not return_type[2] and _completes(body):
+            raise Unsupported('функция может завершиться без return')
+
+    def check_return(self, expected, result, node):
+        if expected[0] == 'void':
+            if result is None or result[0] not in ('void', 'dynamic', 'Null'):
+                raise Unsupported('return со значением в void функции')
+        elif not (expected[0] == 'dynamic' or _assignable(expected, result, node)):
+            raise Unsupported('несовпадение типов')
+
+    def lookup(self, name, scopes):
+        for scope in reversed(scopes):
+            if name in scope:
+                return scope[name]
+        raise Unsupported(f'неизвестное имя {name}')
+
+    def check_assignable(self, target, source, node):
+        if not _assignable(target, source, node):
+            raise Unsupported('несовпадение типов')
+
+    def condition(self, node, scopes):
+        value_type = self.expression(node, scopes)
+        if value_type is not None and value_type[0] != 'dynamic' and value_type != BOOL:
+            raise Unsupported('условие не bool')
+
+    def block(self, statements, scopes):
+        scopes = scopes + [{}]
+        for statement in statements:
+            self.statement(statement, scopes)
+
+    def statement(self, node, scopes):
+        kind = node[0]
+        if kind == 'expr':
+            self.expression(node[1], scopes, void_ok=True)
+        elif kind == 'vardecl':
+            declared = node[1]
+            for name, init in node[3]:
+                value_type = None if declared is None else declared
+                if init is not None:
+                    init_type = self.expression(init, scopes)
+                    if declared is None:
+                        value_type = init_type if init_type != NULL else DYNAMIC
+                    else:
+                        self.check_assignable(declared, init_type, init)
+                elif declared is None:
+                    value_type = DYNAMIC
+                scopes[-1][name] = value_type
+        elif kind == 'block':
+            self.block(node[1], scopes)
+        elif kind == 'if':
+            self.condition(node[1], scopes)
+            self.block([node[2]], scopes)
+            if node[3] is not None:
+                self.block([node[3]], scopes)
+        elif kind == 'for':
+            inner = scopes + [{}]
+            if node[1] is not None:
+                self.statement(node[1], inner)
+            if node[2] is not None:
+                self.condition(node[2], inner)
+            for update in node[3]:
+                self.expression(update, inner, void_ok=True)
+            self.block([node[4]], inner)
+        elif kind == 'forin':
+            iterable = self.expression(node[4], scopes)
+            if node[6]:
+                self.lookup(node[3], scopes)
+            element = node[1]
+            if element is None and iterable is not None and iterable[0] in ('List', 'Iterable') and iterable[1]:
+                element = iterable[1][0]
+            self.block([node[5]], scopes + [{node[3]: element}])
+        elif kind in ('while', 'do'):
+            condition, body = (node[1], node[2]) if kind == 'while' else (node[2], node[1])
+            self.condition(condition, scopes)
+            self.block([body], scopes)
+        elif kind == 'return':
+            expected = self.returns[-1] if self.returns else None
+            if node[1] is None:
+                if expected is not None and expected[0] not in ('void', 'dynamic'):
+                    raise Unsupported('return без значения')
+            else:
+                result = self.expression(node[1], scopes, void_ok=True)
+                if expected is not None:
+                    self.check_return(expected, result, node[1])
+        elif kind == 'func':
+            scopes[-1][node[1]] = _function_type(node[2], [declared for _, declared in node[3]])
+            self.function(node, scopes)
+        elif kind == 'assert':
+            for expression in node[1]:
+                self.expression(expression, scopes)
+
+    def expression(self, node, scopes, void_ok=False):
+        """Проверяет выражение и возвращает его статический тип (или None)"""
+        result = self._expression(node, scopes, void_ok)
+        if result == VOID and not void_ok:
+            raise Unsupported('значение void используется в выражении')
+        return result
+
+    def _expression(self, node, scopes, void_ok):
+        kind = node[0]
+        if kind == 'num':
+            if type(node[1]) is not int:
+                return DOUBLE
+            if not -(1 << 63) <= node[1] < (1 << 63):
+                raise Unsupported('целый литерал не помещается в 64 бита')
+            return INT
+        if kind == 'lit':
+            return NULL if node[1] is None else BOOL
+        if kind == 'name':
+            return self.lookup(node[1], scopes)
+        if kind == 'str':
+            for part in node[1]:
+                if not isinstance(part, str):
+                    self.expression(part, scopes)
+            return STRING
+        if kind == 'binary':
+            return _binary_type(node[1], self.expression(node[2], scopes), self.expression(node[3], scopes))
+        if kind in ('and', 'or'):
+            self.condition(node[1], scopes)
+            self.condition(node[2], scopes)
+            return BOOL
+        if kind == 'ifnull':
+            left = _non_null(self.expression(node[1], scopes))
+            right = self.expression(node[2], scopes)
+            if left is not None and right is not None and right != NULL and \
+                    _assignable(left, _non_null(right), node[2]):
+                return left[:2] + (right[2],)
+            return None
+        if kind == 'cond':
+            self.condition(node[1], scopes)
+            then = self.expression(node[2], scopes, void_ok)
+            otherwise = self.expression(node[3], scopes, void_ok)
+            return then if then == otherwise else None
+        if kind == 'unary':
+            if node[1] == '!':
+                self.condition(node[2], scopes)
+                return BOOL
+            operand = self.expression(node[2], scopes)
+            return operand if operand is not None and operand[0] in NUMERIC else None
+        if kind == 'assign':
+            _, op, target, value_node = node
+            target_type = self.expression(target, scopes)
+            value_type = self.expression(value_node, scopes)
+            if op == '=':
+                self.check_assignable(target_type, value_type, value_node)
+                return value_type
+            if op == '??=':
+                return None
+            self.check_assignable(target_type, _binary_type(op[:-1], target_type, value_type), None)
+            return target_type
+        if kind in ('preinc', 'postinc'):
+            return self.expression(node[2], scopes)
+        if kind == 'index':
+            target = self.expression(node[1], scopes)
+            self.expression(node[2], scopes)
+            if target is None or target[2]:
+                return None
+            if target[0] == 'String':
+                return STRING
+            if target[0] == 'List' and target[1]:
+                return target[1][0]
+            if target[0] == 'Map' and target[1]:
+                return target[1][1][:2] + (True,)
+            return None
+        if kind == 'prop':
+            result = _member_type(self.expression(node[1], scopes), node[2], False)
+            return result[:2] + (True,) if result is not None and node[3] else result
+        if kind == 'method':
+            _, target, name, args, nullsafe = node
+            target_type = self.expression(target, scopes)
+            for arg in args:
+                self.expression(arg, scopes)
+            if target[0] == 'name' and target[1] in TYPE_NAMES and target_type is None and \
+                    target[1] in NUMERIC and name in ('parse', 'tryParse'):
+                return (target[1], (), name == 'tryParse')
+            result = _member_type(target_type, name, True)
+            return result[:2] + (True,) if result is not None and result != VOID and nullsafe else result
+        if kind == 'call':
+            callee = self.expression(node[1], scopes)
+            arg_types = [self.expression(arg, scopes) for arg in node[2]]
+            if callee is None or callee[0] != 'Function':
+                return None
+            return_type, param_types = callee[1]
+            if param_types is not None:
+                if len(param_types) != len(arg_types):
+                    raise Unsupported('неверное число аргументов')
+                for declared, arg_type, arg in zip(param_types, arg_types, node[2]):
+                    self.check_assignable(declared, arg_type, arg)
+            return return_type
+        if kind == 'notnull':
+            return _non_null(self.expression(node[1], scopes))
+        if kind == 'list':
+            _, element_type, elements, _ = node
+            for element in elements:
+                value_type = self.expression(element, scopes)
+                if element_type is not None:
+                    self.check_assignable(element_type, value_type, element)
+            return ('List', (element_type,) if element_type is not None else (), False)
+        if kind == 'map':
+            _, types, entries, _ = node
+            for key, value in entries:
+                key_type = self.expression(key, scopes)
+                value_type = self.expression(value, scopes)
+                if types is not None:
+                    self.check_assignable(types[0], key_type, key)
+                    self.check_assignable(types[1], value_type, value)
+            return ('Map', types or (), False)
+        if kind == 'lambda':
+            _, params, body, is_expression = node
+            inner = scopes + [dict(params)]
+            self.returns.append(None)
+            try:
+                if is_expression:
+                    self.expression(body, inner, void_ok=True)
+                else:
+                    self.block(body[1], inner)
+            finally:
+                self.returns.pop()
+            return _function_type(None, None)
+        raise Unsupported(f'выражение {kind}')
+
+
+# Конструкции, которые интерпретатор точно не поддерживает: по ним программа
+# отсеивается одним поиском, без разбора
+_CLEARLY_UNSUPPORTED = re.compile(
+    r'\b(?:import|class|enum|extension|mixin|typedef|async|await|try|throw|switch|late|Future|Stream)\b|@|\.\.')
+MAX_SOURCE_CHARS = 20000
+
+
+def could_interpret(source):
+    """Быстрая (микросекунды) проверка перед разбором: False - точно в Dart VM"""
+    return len(source) <= MAX_SOURCE_CHARS and not _CLEARLY_UNSUPPORTED.search(source)
+
+
+def interpret(source, max_steps=MAX_STEPS, max_output_bytes=MAX_OUTPUT_BYTES):
+    """Выполняет программу; возвращает вывод или бросает Unsupported"""
+    try:
+        return Interpreter(max_steps, max_output_bytes).run(source)
+    except Unsupported:
+        raise
+    except (_Break, _Continue, _Return):
+        raise Unsupported('break/continue/return вне цикла или функции')
+    except (RecursionError, ValueError, IndexError, KeyError, TypeError, OverflowError) as e:
+        raise Unsupported(f'{e.__class__.__name__}: {e}')
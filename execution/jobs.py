@@ -0,0 +1,147 @@
+"""Асинхронные задания на выполнение кода"""
+import math
+import queue
+import threading
+import time
+import uuid
+
+
+class QueueFull(Exception):
+    """Очередь заданий заполнена"""
+
+    def __init__(self, retry_after):
+        super().__init__('Очередь выполнения заполнена')
+        self.retry_after = retry_after
+
+
+class Job:
+    """Задание на выполнение одной программы"""
+
+    def __init__(self, code, labels=None):
+        self.id = uuid.uuid4().hex
+        self.code = code
+        # Произвольные метки вызывающего кода (например, урок для метрик)
+        self.labels = labels or {}
+        self.status = 'queued'
+        self.result = None
+        self.created_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        # Строки вывода по мере появления: (поток, строка)
+        self.events = []
+        self._changed = threading.Condition()
+
+    def add_output(self, stream, line):
+        with self._changed:
+            self.events.append((stream, line))
+            self._changed.notify_all()
+
+    def finish(self, result):
+        with self._changed:
+            self.result = result
+            self.finished_at = time.monotonic()
+            self.code = None
+            self.status = 'done'
+            self._changed.notify_all()
+
+    def wait(self, timeout):
+        """Ждет завершения задания не дольше timeout секунд; True - задание выполнено"""
+        with self._changed:
+            return self._changed.wait_for(lambda: self.status == 'done', timeout)
+
+    def wait_events(self, since, timeout):
+        """Ждет новые строки вывода после позиции since или завершения задания"""
+        with self._changed:
+            self._changed.wait_for(lambda: len(self.events) > since or self.status == 'done', timeout)
+            return self.events[since:], self.status == 'done'
+
+    def to_dict(self):
+        data = {'job_id': self.id, 'status': self.status}
+        if self.result is not None:
+            data.update(self.result)
+        return data
+
+
+class JobQueue:
+    """Ограниченная очередь заданий с пулом потоков-исполнителей.
+
+    execute(code, on_output) - функция, выполняющая код и возвращающая словарь
+    результата; on_output(stream, line) получает вывод по мере появления.
+    Потоки запускаются при первом задании, а не при импорте, чтобы не
+    мешать форку процессов веб-сервера. finalize(job, result) может дополнить
+    результат до того, как его увидит клиент (например, проверкой решения);
+    on_finish(job) вызывается после завершения каждого задания.
+    """
+
+    def __init__(self, execute, workers=2, max_queued=64, result_ttl=300, on_finish=None, finalize=None):
+        self.execute = execute
+        self.on_finish = on_finish
+        self.finalize = finalize
+        self.workers = workers
+        self.result_ttl = result_ttl
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._started = False
+        # Скользящее среднее длительности задания для оценки Retry-After
+        self._avg_duration = 1.0
+
+    def _start(self):
+        with self._lock:
+            if self._started:
+                return
+            for i in range(self.workers):
+                threading.Thread(target=self._work, name=f'dart-job-{i}', daemon=True).start()
+            self._started = True
+
+    def submit(self, code, labels=None):
+        """Ставит код в очередь; при переполнении бросает QueueFull"""
+        self._start()
+        self._purge()
+        job = Job(code, labels)
+        with self._lock:
+            self._jobs[job.id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job.id]
+            raise QueueFull(self.retry_after())
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def retry_after(self):
+        """Через сколько секунд в очереди, вероятно, появится место"""
+        waiting = self._queue.qsize()
+        return max(1, math.ceil(self._avg_duration * waiting / max(1, self.workers)))
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            job.status = 'running'
+            job.started_at = time.monotonic()
+            try:
+                result = self.execute(job.code, job.add_output)
+                if self.finalize is not None:
+                    result = self.finalize(job, result)
+            except Exception as e:
+                result = {'success': False, 'output': '', 'error': f'Ошибка выполнения: {e}'}
+            job.finish(result)
+            self._avg_duration = 0.8 * self._avg_duration + 0.2 * (job.finished_at - job.started_at)
+            if self.on_finish is not None:
+                try:
+                    self.on_finish(job)
+                except Exception:
+                    pass
+
+    def _purge(self):
+        """Удаляет завершенные задания, результат которых давно никто не забрал"""
+        deadline = time.monotonic() - self.result_ttl
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.finished_at is not None and job.finished_at < deadline]
+            for job_id in expired:
+                del self._jobs[job_id]
@@ -0,0 +1,104 @@
+"""Быстрая проверка скобок в Dart коде до выполнения.
+
+Один проход по коду с учетом строк (в том числе raw и тройных), интерполяции
+${...}, однострочных и вложенных блочных комментариев. Скобки внутри строк и
+комментариев не считаются; первая ошибка сообщается со строкой и столбцом.
+"""
+import re
+from collections import namedtuple
+
+SyntaxProblem = namedtuple('SyntaxProblem', ['message', 'line', 'column'])
+
+CLOSING = {'(': ')', '[': ']', '{': '}', '${': '}'}
+
+# Следующий значимый символ в коде и в строке: остальное пропускается целиком
+_CODE_TOKEN = re.compile(r'//|/\*|[\'"(){}\[\]]')
+_STRING_TOKEN = {
+    (quote, raw): re.compile(
+        ('' if raw else r'\\[\s\S]|\$\{|') + re.escape(quote) + ('' if len(quote) == 3 else r'|\n')
+    )
+    for quote in ("'", '"', "'''", '"""')
+    for raw in (False, True)
+}
+_COMMENT_TOKEN = re.compile(r'/\*|\*/')
+
+
+def _position(code, index):
+    """Строка и столбец (с единицы) символа code[index]"""
+    line = code.count('\n', 0, index) + 1
+    return line, index - code.rfind('\n', 0, index)
+
+
+def _problem(code, index, message):
+    line, column = _position(code, index)
+    return SyntaxProblem(message, line, column)
+
+
+def _is_raw_prefix(code, index):
+    """Стоит ли перед кавычкой в позиции index префикс raw-строки r"""
+    if index == 0 or code[index - 1] not in 'rR':
+        return False
+    return index == 1 or not (code[index - 2].isalnum() or code[index - 2] in '_$')
+
+
+def find_bracket_problem(code):
+    """Первая ошибка со скобками, строками или комментариями, или None"""
+    # Стек: ('bracket', скобка, позиция) или ('string', кавычка, raw, позиция)
+    stack = []
+    i = 0
+    n = len(code)
+    while i < n:
+        top = stack[-1] if stack else None
+        if top is not None and top[0] == 'string':
+            _, quote, raw, start = top
+            match = _STRING_TOKEN[quote, raw].search(code, i)
+            if match is None:
+                return _problem(code, start, 'незакрытая строка')
+            token = match.group()
+            i = match.end()
+            if token == quote:
+                stack.pop()
+            elif token == '\n':
+                return _problem(code, start, 'незакрытая строка')
+            elif token == '${':
+                stack.append(('bracket', '${', match.start()))
+            continue
+
+        match = _CODE_TOKEN.search(code, i)
+        if match is None:
+            break
+        token = match.group()
+        start = match.start()
+        i = match.end()
+        if token == '//':
+            end = code.find('\n', i)
+            i = n if end == -1 else end + 1
+        elif token == '/*':
+            # Блочные комментарии в Dart вкладываются друг в друга
+            depth = 1
+            while depth:
+                comment = _COMMENT_TOKEN.search(code, i)
+                if comment is None:
+                    return _problem(code, start, 'незакрытый комментарий /*')
+                depth += 1 if comment.group() == '/*' else -1
+                i = comment.end()
+        elif token in '\'"':
+            quote = code[start:start + 3] if code.startswith(token * 3, start) else token
+            stack.append(('string', quote, _is_raw_prefix(code, start), start))
+            i = start + len(quote)
+        elif token in '([{':
+            stack.append(('bracket', token, start))
+        else:
+            if top is None:
+                return _problem(code, start, f'лишняя закрывающая скобка {token}')
+            expected = CLOSING[top[1]]
+            if token != expected:
+                return _problem(code, start, f'ожидалась {expected}, а встретилась {token}')
+            stack.pop()
+
+    if stack:
+        top = stack[-1]
+        if top[0] == 'string':
+            return _problem(code, top[3], 'незакрытая строка')
+        return _problem(code, top[2], f'незакрытая скобка {top[1]}')
+    return None
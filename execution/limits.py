@@ -0,0 +1,125 @@
+"""Жесткие ограничения ресурсов для выполнения кода учеников"""
+import os
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TRUNCATION_MARKER = '... [вывод обрезан: превышен лимит {limit}]'
+
+# Самая длинная строка вывода, которую читаем за раз: бесконечная строка без
+# перевода строки не должна целиком оказаться в памяти
+MAX_LINE_BYTES = 64 * 1024
+
+
+def format_bytes(size):
+    if size >= 1024 * 1024:
+        return f'{size / (1024 * 1024):g} МБ'
+    if size >= 1024:
+        return f'{size / 1024:g} КБ'
+    return f'{size} Б'
+
+
+def process_cpu_seconds(pid):
+    """Процессорное время (user + system) процесса по данным /proc, или None"""
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # Имя процесса в скобках может содержать пробелы - считаем поля после ')'
+    fields = stat[stat.rindex(b')') + 2:].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+class ResourceLimits:
+    """Ограничения для рабочего процесса Dart и каждой программы в нем.
+
+    cpu_seconds       - процессорное время на одну программу
+    wall_seconds      - время выполнения на одну программу
+    address_space_mb  - адресное пространство процесса VM (0 - без ограничения)
+    max_processes     - RLIMIT_NPROC (0 - без ограничения). В Linux лимит
+                        считается по всем процессам и потокам пользователя,
+                        поэтому включайте его, только если рабочие процессы
+                        запускаются от отдельного пользователя
+    max_file_mb       - максимальный размер файла, который может записать программа
+    max_output_bytes  - stdout + stderr одной программы; остальное отбрасывается
+    """
+
+    def __init__(self, cpu_seconds=5, wall_seconds=10, address_space_mb=4096,
+                 max_processes=0, max_file_mb=16, max_output_bytes=64 * 1024):
+        self.cpu_seconds = cpu_seconds
+        self.wall_seconds = wall_seconds
+        self.address_space_mb = address_space_mb
+        self.max_processes = max_processes
+        self.max_file_mb = max_file_mb
+        self.max_output_bytes = max_output_bytes
+
+    def apply_to_current_process(self):
+        """Вызывается в дочернем процессе перед exec (preexec_fn)"""
+        if resource is None:
+            return
+        resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+        if self.address_space_mb:
+            size = self.address_space_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (size, size))
+        if self.max_processes:
+            resource.setrlimit(resource.RLIMIT_NPROC, (self.max_processes, self.max_processes))
+        if self.max_file_mb:
+            size = self.max_file_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_FSIZE, (size, size))
+
+    def arm_cpu_limit(self, pid):
+        """Разрешает процессу еще cpu_seconds процессорного времени.
+
+        Рабочий процесс живет долго, поэтому мягкий RLIMIT_CPU переставляется
+        перед каждой программой: уже израсходованное время + cpu_seconds. При
+        его превышении ядро шлет процессу SIGXCPU и тот завершается. Жесткий
+        лимит не трогаем: без привилегий его нельзя будет поднять обратно.
+        Возвращает True, если лимит установлен.
+        """
+        if not self.cpu_seconds or resource is None or not hasattr(resource, 'prlimit'):
+            return False
+        used = process_cpu_seconds(pid)
+        if used is None:
+            return False
+        soft = int(used + self.cpu_seconds) + 1
+        try:
+            _, hard = resource.prlimit(pid, resource.RLIMIT_CPU)
+            if hard != resource.RLIM_INFINITY:
+                soft = min(soft, hard)
+            resource.prlimit(pid, resource.RLIMIT_CPU, (soft, hard))
+        except (OSError, ValueError):
+            return False
+        return True
+
+
+class OutputCollector:
+    """Копит вывод программы, пока не исчерпан лимит в байтах"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.truncated = False
+        self.stdout = []
+        self.stderr = []
+
+    def add(self, stream, line):
+        """Добавляет строку; возвращает False, если лимит уже превышен"""
+        if self.truncated:
+            return False
+        size = len(line.encode('utf-8')) + 1
+        if self.max_bytes and self.size + size > self.max_bytes:
+            self.truncated = True
+            return False
+        self.size += size
+        (self.stdout if stream == 'stdout' else self.stderr).append(line)
+        return True
+
+    def output(self):
+        text = '\n'.join(self.stdout)
+        if self.truncated:
+            marker = TRUNCATION_MARKER.format(limit=format_bytes(self.max_bytes))
+            text = f'{text}\n{marker}' if text else marker
+        return text
@@ -0,0 +1,67 @@
+"""Гистограммы задержек выполнения кода по этапам, бэкендам и урокам.
+
+Отдаются в текстовом формате Prometheus. Каждый процесс веб-сервера
+считает свои значения; сервер метрик складывает их по меткам instance.
+"""
+import bisect
+import threading
+
+# Верхние границы корзин (секунды): от быстрых проверок до таймаута программы
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+STAGES = ('validation', 'queue_wait', 'compile', 'run', 'serialization', 'total')
+
+
+class Histogram:
+    """Счетчики наблюдений по корзинам, сумма и количество"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # последняя - +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class LatencyMetrics:
+    """Набор гистограмм с метками stage, backend и lesson"""
+
+    def __init__(self, name='dart_execution_stage_seconds', buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.buckets = tuple(buckets)
+        self._histograms = {}  # (stage, backend, lesson) -> Histogram
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds, backend='none', lesson='other'):
+        key = (stage, backend, str(lesson))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(max(0.0, seconds))
+
+    def render(self):
+        """Текст в формате Prometheus exposition 0.0.4"""
+        lines = [
+            f'# HELP {self.name} Длительность этапов выполнения Dart кода',
+            f'# TYPE {self.name} histogram',
+        ]
+        with self._lock:
+            items = sorted(self._histograms.items())
+            for (stage, backend, lesson), histogram in items:
+                labels = f'stage="{_escape(stage)}",backend="{_escape(backend)}",lesson="{_escape(lesson)}"'
+                cumulative = 0
+                for bound, count in zip(self.buckets + ('+Inf',), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{self.name}_sum{{{labels}}} {histogram.sum:.6f}')
+                lines.append(f'{self.name}_count{{{labels}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,417 @@
+"""Пул прогретых рабочих процессов Dart"""
+import json
+import os
+import queue
+import secrets
+import shlex
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from execution.compiler import CompilerUnavailable, CompileTimeout, IncrementalCompiler, frontend_server_command
+from execution.limits import MAX_LINE_BYTES, OutputCollector, ResourceLimits, format_bytes
+
+RUNNER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runner.dart')
+
+# Сколько ждать ответа рабочего процесса на команду kill, прежде чем убить его целиком
+KILL_GRACE_PERIOD = 1.0
+
+
+def default_pool_size():
+    """Размер пула по умолчанию: ядра хоста делятся между процессами веб-сервера"""
+    web_workers = int(os.environ.get('WEB_CONCURRENCY') or 1)
+    return max(1, (os.cpu_count() or 1) // max(1, web_workers))
+
+
+class WorkerCrashed(Exception):
+    """Рабочий процесс завершился или перестал отвечать"""
+
+
+class DartWorker:
+    """Один долгоживущий процесс Dart VM, выполняющий программы в изолятах"""
+
+    def __init__(self, dart_path, workdir, limits, heap_mb=256, command_prefix=None, startup_timeout=30,
+                 compiler=None):
+        self.dart_path = dart_path
+        self.workdir = workdir
+        self.limits = limits
+        # IncrementalCompiler или None - тогда программу компилирует сама VM
+        self.compiler = compiler
+        self.heap_mb = heap_mb
+        self.command_prefix = command_prefix or []
+        self.startup_timeout = startup_timeout
+        self.jobs_done = 0
+        self.process = None
+        self._token = secrets.token_hex(16)
+        self._events = queue.Queue()
+        self._ready = threading.Event()
+        self._alive = False
+
+    @property
+    def alive(self):
+        return self._alive and self.process is not None and self.process.poll() is None
+
+    def _command(self):
+        command = list(self.command_prefix) + [self.dart_path]
+        if self.heap_mb:
+            command.append(f'--old_gen_heap_size={self.heap_mb}')
+        command.append(RUNNER_PATH)
+        return command
+
+    def _preexec(self):
+        # Отдельная группа процессов, чтобы убивать программу вместе с потомками
+        os.setsid()
+        self.limits.apply_to_current_process()
+
+    def start(self):
+        """Запускает процесс; прогрев VM идет параллельно с работой приложения"""
+        env = {
+            'PATH': os.environ.get('PATH', ''),
+            'HOME': self.workdir,
+            'LANG': 'C.UTF-8',
+        }
+        self.process = subprocess.Popen(
+            self._command(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.workdir,
+            env=env,
+            preexec_fn=self._preexec if os.name == 'posix' else None,
+        )
+        self._alive = True
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+        self._send(self._token)
+
+    def _send(self, line):
+        try:
+            self.process.stdin.write(line.encode('utf-8') + b'\n')
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError):
+            self._alive = False
+            raise WorkerCrashed('Рабочий процесс Dart недоступен')
+
+    def _read_stdout(self):
+        prefix = (self._token + ' ').encode('ascii')
+        # Перед каждым кадром runner.dart пишет перевод строки. Если вывод
+        # программы кончался переводом строки, перед кадром окажется пустая
+        # строка - она не принадлежит программе и придерживается до следующей
+        blank = False
+        for raw in iter(lambda: self.process.stdout.readline(MAX_LINE_BYTES), b''):
+            if raw.startswith(prefix):
+                blank = False
+                kind, _, payload = raw[len(prefix):].decode('utf-8', 'replace').strip().partition(' ')
+                if kind == 'READY':
+                    self._ready.set()
+                elif kind == 'END':
+                    self._events.put(('end', json.loads(payload)))
+                continue
+            if blank:
+                self._events.put(('stdout', ''))
+            blank = raw in (b'\n', b'\r\n')
+            if not blank:
+                self._events.put(('stdout', raw.decode('utf-8', 'replace').rstrip('\r\n')))
+        if blank:
+            self._events.put(('stdout', ''))
+        self._alive = False
+        self._ready.set()
+        self._events.put(('eof', None))
+
+    def _read_stderr(self):
+        for raw in iter(lambda: self.process.stderr.readline(MAX_LINE_BYTES), b''):
+            self._events.put(('stderr', raw.decode('utf-8', 'replace').rstrip('\r\n')))
+
+    def execute(self, source, timeout=None, on_output=None, kernel=None):
+        """Выполняет программу и возвращает словарь с результатом.
+
+        on_output(stream, line) вызывается для каждой строки вывода по мере
+        ее появления (stream - 'stdout' или 'stderr'), пока не исчерпан лимит
+        вывода. kernel - путь к заранее скомпилированной программе (.dill):
+        тогда компиляция пропускается.
+        """
+        if not self._ready.wait(self.startup_timeout) or not self.alive:
+            raise WorkerCrashed('Рабочий процесс Dart не запустился')
+        timeout = timeout or self.limits.wall_seconds
+
+        # Хвосты вывода предыдущей программы нам не нужны
+        while True:
+            try:
+                self._events.get_nowait()
+            except queue.Empty:
+                break
+
+        job_id = uuid.uuid4().hex
+        started = time.monotonic()
+        path = kernel
+        compile_ms = 0
+        hidden_paths = []
+        if path is None and self.compiler is not None and self.compiler.alive:
+            path = os.path.join(self.workdir, f'{job_id}.dill')
+            hidden_paths.append(self.compiler.source_path)
+            try:
+                errors, diagnostics = self.compiler.compile(source, path, timeout)
+            except CompileTimeout:
+                self.compiler.stop()
+                self.jobs_done += 1
+                return {
+                    'success': False,
+                    'output': '',
+                    'error': f'Превышено время выполнения ({timeout:g} с)',
+                    'timings': {'compile_ms': int(timeout * 1000), 'run_ms': 0},
+                    'timed_out': True,
+                }
+            except CompilerUnavailable:
+                # Без компилятора программа скомпилируется внутри VM, как раньше
+                self.compiler.stop()
+                path = None
+            else:
+                compile_ms = int((time.monotonic() - started) * 1000)
+                if errors:
+                    self.jobs_done += 1
+                    return {
+                        'success': False,
+                        'output': '',
+                        'error': f'Ошибка компиляции:\n{diagnostics}',
+                        'timings': {'compile_ms': compile_ms, 'run_ms': 0},
+                    }
+        if path is None:
+            path = os.path.join(self.workdir, f'{job_id}.dart')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(source)
+        hidden_paths.append(path)
+
+        collector = OutputCollector(self.limits.max_output_bytes)
+        cpu_limited = self.limits.arm_cpu_limit(self.process.pid)
+        frame = None
+        stop_reason = None  # 'timeout' или 'output': программу остановили мы
+        try:
+            self._send(json.dumps({'op': 'run', 'id': job_id, 'uri': Path(path).as_uri()}))
+            deadline = started + timeout
+            while frame is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 and stop_reason is None:
+                    stop_reason = 'timeout'
+                    self._kill_program()
+                    deadline = time.monotonic() + KILL_GRACE_PERIOD
+                    continue
+                try:
+                    kind, payload = self._events.get(timeout=max(remaining, 0.01))
+                except queue.Empty:
+                    if stop_reason is not None:
+                        # Изолят не реагирует на kill - перезапускаем процесс целиком
+                        self.stop()
+                        frame = {'id': job_id, 'status': 'killed', 'error': ''}
+                    continue
+                if kind == 'end':
+                    if payload.get('id') == job_id:
+                        frame = payload
+                elif kind == 'eof':
+                    if cpu_limited and self._exit_signal() == signal.SIGXCPU:
+                        frame = {'id': job_id, 'status': 'cpu_limit', 'error': ''}
+                    else:
+                        raise WorkerCrashed('Рабочий процесс Dart завершился аварийно')
+                elif collector.add(kind, payload):
+                    if on_output is not None:
+                        on_output(kind, payload)
+                elif stop_reason is None:
+                    # Лимит вывода исчерпан - дальше программа только тратит ресурсы
+                    stop_reason = 'output'
+                    self._kill_program()
+                    deadline = time.monotonic() + KILL_GRACE_PERIOD
+        finally:
+            if path != kernel:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self.jobs_done += 1
+
+        error = frame.get('error', '')
+        for hidden in hidden_paths:
+            error = error.replace(Path(hidden).as_uri(), 'main.dart').replace(hidden, 'main.dart')
+        if stop_reason == 'timeout':
+            error = f'Превышено время выполнения ({timeout:g} с)'
+        elif stop_reason == 'output':
+            error = (f'Программа вывела больше {format_bytes(self.limits.max_output_bytes)} '
+                     f'и была остановлена')
+        elif frame['status'] == 'cpu_limit':
+            error = f'Превышен лимит процессорного времени ({self.limits.cpu_seconds:g} с)'
+        elif frame['status'] == 'compile_error':
+            error = f'Ошибка компиляции:\n{error}'
+        if collector.stderr:
+            error = '\n'.join(collector.stderr + ([error] if error else []))
+        result = {
+            'success': frame['status'] == 'ok' and stop_reason is None,
+            'output': collector.output(),
+            'error': error,
+            'timings': {
+                'compile_ms': compile_ms + frame.get('compile_ms', 0),
+                'run_ms': frame.get('run_ms', 0),
+            },
+        }
+        if stop_reason == 'timeout':
+            result['timed_out'] = True
+        return result
+
+    def _kill_program(self):
+        """Просит рабочий процесс немедленно остановить изолят с программой"""
+        try:
+            self._send(json.dumps({'op': 'kill'}))
+        except WorkerCrashed:
+            pass
+
+    def _exit_signal(self):
+        """Сигнал, которым был завершен процесс, или None"""
+        try:
+            code = self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            return None
+        return -code if code < 0 else None
+
+    def stop(self):
+        self._alive = False
+        if self.process is None or self.process.poll() is not None:
+            return
+        try:
+            if os.name == 'posix':
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+
+
+class DartWorkerPool:
+    """Пул рабочих процессов Dart, переиспользуемых между запросами.
+
+    Процессы запускаются заранее (start) и возвращаются в пул после каждой
+    программы; упавшие или отработавшие max_jobs программ процессы заменяются
+    свежими. При incremental_compiler у каждого процесса есть свой прогретый
+    frontend_server, который переживает перезапуски VM.
+    """
+
+    def __init__(self, dart_path='dart', size=None, limits=None, acquire_timeout=5,
+                 max_jobs=200, heap_mb=256, sandbox_command='', incremental_compiler=True):
+        self.dart_path = dart_path
+        self.size = size or default_pool_size()
+        self.limits = limits or ResourceLimits()
+        self.acquire_timeout = acquire_timeout
+        self.max_jobs = max_jobs
+        self.heap_mb = heap_mb
+        self.command_prefix = shlex.split(sandbox_command) if sandbox_command else []
+        # Код учеников получает полный dart:io; без обертки-песочницы он работает
+        # с правами веб-приложения (см. create_backend)
+        self.sandboxed = bool(self.command_prefix)
+        self.incremental_compiler = incremental_compiler
+        self.workdir = None
+        self._compilers_started = 0
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+
+    @property
+    def available(self):
+        """Установлен ли Dart SDK на этом хосте"""
+        return shutil.which(self.dart_path) is not None and os.path.exists(RUNNER_PATH)
+
+    def start(self):
+        with self._lock:
+            if self._started:
+                return
+            self.workdir = tempfile.mkdtemp(prefix='dart-pool-')
+            if self.incremental_compiler and frontend_server_command(self.dart_path) is None:
+                self.incremental_compiler = False
+            for _ in range(self.size):
+                self._idle.put(self._spawn())
+            self._started = True
+
+    def _preexec(self):
+        os.setsid()
+        self.limits.apply_to_current_process()
+
+    def _start_compiler(self):
+        """Запускает и в фоне прогревает frontend_server; None, если не вышло"""
+        if not self.incremental_compiler:
+            return None
+        self._compilers_started += 1
+        workdir = os.path.join(self.workdir, f'compiler-{self._compilers_started}')
+        compiler = IncrementalCompiler(self.dart_path, workdir, command_prefix=self.command_prefix,
+                                       preexec_fn=self._preexec)
+        try:
+            compiler.start()
+        except CompilerUnavailable:
+            return None
+        threading.Thread(target=compiler.warm_up, daemon=True).start()
+        return compiler
+
+    def _spawn(self, compiler=None):
+        if compiler is None:
+            compiler = self._start_compiler()
+        worker = DartWorker(self.dart_path, self.workdir, self.limits, heap_mb=self.heap_mb,
+                            command_prefix=self.command_prefix, compiler=compiler)
+        worker.start()
+        return worker
+
+    def _release(self, worker):
+        if worker.compiler is not None and not worker.compiler.alive:
+            # Компилятор упал или был остановлен по таймауту - нужен новый
+            worker.compiler.stop()
+            worker.compiler = self._start_compiler()
+        if not worker.alive or worker.jobs_done >= self.max_jobs:
+            worker.stop()
+            try:
+                worker = self._spawn(worker.compiler)
+            except OSError:
+                if worker.compiler is not None:
+                    worker.compiler.stop()
+                # Не удалось запустить замену - пул временно работает в уменьшенном составе
+                return
+        self._idle.put(worker)
+
+    def run(self, code, timeout=None, on_output=None, kernel=None):
+        """Выполняет код (или готовый kernel этого кода) на свободном рабочем процессе"""
+        self.start()
+        waiting_since = time.monotonic()
+        try:
+            worker = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            return {
+                'success': False,
+                'output': '',
+                'error': 'Сервер выполнения перегружен, попробуйте еще раз через несколько секунд',
+                'retry': True,
+            }
+        queue_ms = int((time.monotonic() - waiting_since) * 1000)
+        try:
+            result = worker.execute(code, timeout, on_output=on_output, kernel=kernel)
+            result['timings']['queue_ms'] = queue_ms
+            return result
+        except WorkerCrashed as e:
+            worker.stop()
+            return {'success': False, 'output': '', 'error': f'Ошибка выполнения: {e}', 'retry': True}
+        finally:
+            self._release(worker)
+
+    def shutdown(self):
+        with self._lock:
+            while True:
+                try:
+                    worker = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                worker.stop()
+                if worker.compiler is not None:
+                    worker.compiler.stop()
+            if self.workdir:
+                shutil.rmtree(self.workdir, ignore_errors=True)
+            self._started = False
@@ -0,0 +1,100 @@
+"""Ограничение частоты запусков кода по алгоритму token bucket"""
+import math
+import threading
+import time
+from collections import namedtuple
+
+RateLimitResult = namedtuple('RateLimitResult', ['allowed', 'limit', 'remaining', 'reset', 'retry_after'])
+
+
+class MemoryStore:
+    """Состояние корзин в памяти процесса (у каждого процесса веб-сервера свое)"""
+
+    # Как часто (в вызовах take) удалять давно полные корзины
+    PURGE_EVERY = 1000
+
+    def __init__(self):
+        self._buckets = {}  # ключ -> (токены, время обновления, когда корзина снова полна)
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def take(self, key, rate, capacity, cost, now):
+        """Списывает cost токенов, если они есть; возвращает (успех, остаток токенов)"""
+        with self._lock:
+            tokens, updated, _ = self._buckets.get(key, (capacity, now, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+
+            self._calls += 1
+            if self._calls % self.PURGE_EVERY == 0:
+                full = [k for k, (_, _, full_at) in self._buckets.items() if full_at <= now]
+                for k in full:
+                    del self._buckets[k]
+            return allowed, tokens
+
+
+class RedisStore:
+    """Общее для всех процессов и хостов состояние корзин в Redis"""
+
+    SCRIPT = """
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+    def __init__(self, url, prefix='ratelimit:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError('Для RATELIMIT_STORAGE_URL=redis://... установите пакет redis')
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    def take(self, key, rate, capacity, cost, now):
+        allowed, tokens = self._script(keys=[self.prefix + key], args=[rate, capacity, cost, now])
+        return bool(allowed), float(tokens)
+
+
+def create_store(url):
+    """Хранилище по адресу из конфигурации: memory:// или redis://..."""
+    if not url or url.startswith('memory://'):
+        return MemoryStore()
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisStore(url)
+    raise ValueError(f'Неизвестное хранилище для ограничения частоты: {url}')
+
+
+class RateLimiter:
+    """Token bucket: capacity токенов, пополнение per_minute токенов в минуту"""
+
+    def __init__(self, per_minute, capacity, store=None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity
+        self.store = store or MemoryStore()
+
+    def hit(self, key, cost=1):
+        allowed, tokens = self.store.take(key, self.rate, self.capacity, cost, time.time())
+        return RateLimitResult(
+            allowed=allowed,
+            limit=self.capacity,
+            remaining=max(0, math.floor(tokens)),
+            reset=math.ceil((self.capacity - tokens) / self.rate),
+            retry_after=0 if allowed else max(1, math.ceil((cost - tokens) / self.rate)),
+        )
@@ -0,0 +1,96 @@
+// Рабочий процесс пула исполнения.
+//
+// Держит Dart VM (и встроенный компилятор) прогретыми и выполняет каждую
+// присланную программу в отдельном изоляте, поэтому запуск программы не
+// платит за старт виртуальной машины.
+//
+// Протокол (по одной JSON-строке):
+//   stdin:  первая строка - секретный маркер кадров;
+//           {"op": "run", "id": "...", "uri": "file:///.../main.dart"}
+//           (uri может указывать и на готовый kernel .dill от frontend_server)
+//           {"op": "kill"}
+//   stdout: вывод программы как есть и служебные кадры вида
+//           "<маркер> READY" и "<маркер> END {...}". Перед кадром всегда
+//           пишется перевод строки: вывод программы может не заканчиваться
+//           им, а кадр должен начинать строку. Читатель отбрасывает
+//           пустую строку прямо перед кадром.
+import 'dart:async';
+import 'dart:convert';
+import 'dart:io';
+import 'dart:isolate';
+
+String token = '';
+Isolate? current;
+bool killRequested = false;
+
+void main() {
+  var handshake = true;
+  stdin
+      .transform(utf8.decoder)
+      .transform(const LineSplitter())
+      .listen((line) {
+    if (handshake) {
+      token = line.trim();
+      handshake = false;
+      sendFrame('READY');
+      return;
+    }
+    final message = jsonDecode(line) as Map<String, dynamic>;
+    switch (message['op']) {
+      case 'run':
+        run(message['id'] as String, message['uri'] as String);
+        break;
+      case 'kill':
+        killRequested = true;
+        current?.kill(priority: Isolate.immediate);
+        break;
+    }
+  }, onDone: () => exit(0));
+}
+
+Future<void> run(String id, String uri) async {
+  // Ошибки и завершение изолята приходят в один порт, чтобы сохранить порядок
+  final port = ReceivePort();
+  final errors = <String>[];
+  final watch = Stopwatch()..start();
+  var status = 'ok';
+  var compileMs = 0;
+  killRequested = false;
+
+  try {
+    current = await Isolate.spawnUri(Uri.parse(uri), const <String>[], null,
+        onExit: port.sendPort, onError: port.sendPort, errorsAreFatal: true);
+    compileMs = watch.elapsedMilliseconds;
+    // Команда kill могла прийти, пока программа компилировалась
+    if (killRequested) current!.kill(priority: Isolate.immediate);
+    await for (final message in port) {
+      if (message == null) break;
+      final pair = message as List;
+      errors.add('${pair[0]}');
+      status = 'error';
+    }
+  } on IsolateSpawnException catch (e) {
+    status = 'compile_error';
+    errors.add(e.message);
+  } catch (e) {
+    status = 'error';
+    errors.add('$e');
+  } finally {
+    port.close();
+    current = null;
+  }
+
+  if (killRequested) status = 'killed';
+  final frame = jsonEncode({
+    'id': id,
+    'status': status,
+    'error': errors.join('\n'),
+    'compile_ms': compileMs,
+    'run_ms': watch.elapsedMilliseconds - compileMs,
+  });
+  sendFrame('END $frame');
+}
+
+void sendFrame(String frame) {
+  stdout.write('\n$token $frame\n');
+}
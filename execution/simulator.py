@@ -0,0 +1,335 @@
+"""Имитация выполнения Dart кода для серверов без Dart SDK.
+
+Правила имитации описаны декларативно в RULES и компилируются при импорте в
+одно регулярное выражение, которое находит все ключевые слова правил за один
+проход по коду, сколько бы правил ни было.
+"""
+import re
+from collections import defaultdict, namedtuple
+
+# Правило срабатывает, если в коде есть все ключевые слова. Из правил одной
+# группы срабатывает только первое подходящее (аналог цепочки if/elif).
+Rule = namedtuple('Rule', ['keywords', 'output', 'group'], defaults=(None,))
+
+
+class IgnoreCase(str):
+    """Ключевое слово, которое ищется без учета регистра"""
+
+
+PRINT_PATTERN = re.compile(r"print\s*\(\s*['\"]([^'\"]*)['\"]?\s*\)")
+
+# Подстановки для print с интерполяцией
+INTERPOLATION_VALUES = (
+    ('$name', 'Dart'),
+    ('$age', '25'),
+    ('$height', '175.5'),
+    ('$isStudent', 'true'),
+)
+
+NO_OUTPUT_MESSAGE = 'Код выполнен успешно (без вывода)'
+
+RULES = (
+    # Специальные случаи для уроков
+    Rule(('add(5, 3)',), ('Сумма: 8',)),
+    Rule(('square(5)',), ('Квадрат числа 5 равен: 25',)),
+    Rule(('length * width',), ('Площадь прямоугольника: 50',)),
+    Rule(('for (int i = 1; i <= 10; i++)',), tuple(f'Число: {i}' for i in range(1, 11))),
+    Rule(('while (number <= 100)',), ('Сумма чисел от 1 до 100: 5050',)),
+    Rule(('fruits[i]',), ('Фрукт 1: яблоко', 'Фрукт 2: банан', 'Фрукт 3: апельсин')),
+    Rule(('phoneBook.containsKey', 'Мама'), ('Номер Мама: +7-123-456-78-90',)),
+    Rule(('safeDivide(10, 2)',), ('10 / 2 = 5.0',)),
+    Rule(('safeDivide(10, 0)',), ('Ошибка: Exception: Деление на ноль!', '10 / 0 = 0.0')),
+    Rule(('Car(', 'Toyota'), ('Автомобиль: Toyota Camry (2020 год)',)),
+    Rule(('loadUserData(', 'Анна'), ('Загрузка данных для Анна...', 'Данные пользователя Анна загружены!')),
+    Rule(('jsonEncode(',), (
+        'JSON: {"name":"Иван Петров","email":"ivan@example.com","age":28,"isActive":true}',
+        'Имя: Иван Петров',
+        'Email: ivan@example.com',
+    )),
+    Rule(('Calculator(',), (
+        '=== Калькулятор ===',
+        'Доступные операции: +, -, *, /',
+        '10 + 5 = 15.0',
+        '20 / 4 = 5.0',
+        'Ошибка: Exception: Деление на ноль невозможно!',
+    )),
+
+    # Проверки условий
+    Rule(('number > 0', 'number = -5'), ('Число отрицательное',), group='sign'),
+    Rule(('number > 0', 'number = 5'), ('Число положительное',), group='sign'),
+    Rule(('number > 0', 'number = 0'), ('Число равно нулю',), group='sign'),
+
+    # Dart специфика - уроки 16-20
+    Rule(('getUserName()', 'null'), ('Имя: Неизвестно', 'Длина имени: 0', 'Возраст: 25')),
+    Rule(('extension', 'ListExtensions'), (
+        'Сумма: 15',
+        'Среднее: 3.0',
+        'Капитализированный: Hello world',
+        'Палиндром: true',
+    )),
+    Rule(('mixin', 'Character'), (
+        'Мерлин (HP: 80)',
+        'Применяю заклинание: Огненный шар (Мана: 80)',
+        'Конан (HP: 120)',
+        'Атакую с помощью: Меч (Сила: 50)',
+        'Тень (HP: 100)',
+        'Скрываюсь в тенях...',
+        'Атакую с помощью: Кинжал (Сила: 50)',
+        'Выхожу из укрытия',
+        'Артур (HP: 110)',
+        'Атакую с помощью: Священный меч (Сила: 50)',
+        'Применяю заклинание: Исцеление (Мана: 80)',
+    )),
+    Rule(('Cache<', IgnoreCase('generics')), (
+        'Сохранено: greeting => Привет',
+        'Сохранено: farewell => Пока',
+        'Найдено в кеше: greeting => Привет',
+        'Сохранено: 1 => 3.14',
+        'Сохранено: 2 => 2.71',
+        'Найдено в кеше: 1 => 3.14',
+        'Сумма int: 8',
+        '5 положительное: true',
+        'Произведение double: 10.0',
+        'Размер кеша строк: 2',
+    )),
+    Rule(('Vector(', 'operator'), (
+        'v1: Vector(3.0, 4.0)',
+        'v2: Vector(1.0, 2.0)',
+        'Длина v1: 5.0',
+        'v1 + v2 = Vector(4.0, 6.0)',
+        'v1 - v2 = Vector(2.0, 2.0)',
+        'v1 * 2 = Vector(6.0, 8.0)',
+        'v1 / 2 = Vector(1.5, 2.0)',
+        '-v1 = Vector(-3.0, -4.0)',
+        'Нормализованный v1: Vector(0.6, 0.8)',
+        'Скалярное произведение v1 · v2 = 11.0',
+        'v1 == v2: false',
+        'v1 == Vector(3, 4): true',
+    )),
+
+    # Реальные проекты - уроки 21-25
+    Rule(('NumberGuessingGame',), (
+        '=== ИГРА "УГАДАЙ ЧИСЛО" ===',
+        'Выберите уровень сложности:',
+        '1. Легкий (1-50, 10 попыток)',
+        '2. Средний (1-100, 8 попыток)',
+        '3. Сложный (1-200, 6 попыток)',
+        'Выбран уровень: Средний',
+        'Диапазон: 1-100, Попыток: 8',
+        'Я загадал число от 1 до 100. Попробуй угадать!',
+        '',
+        'Попытка 1: 50',
+        'Слишком мало! Попробуй больше.',
+        '🌡️ Тепло!',
+        'Осталось попыток: 7',
+        '',
+        'Попытка 7: 66',
+        '',
+        '🎉 ПОЗДРАВЛЯЮ! Ты угадал число 66!',
+        'Количество попыток: 7',
+        'Результат: Неплохо! 👌',
+        '',
+        '📊 СТАТИСТИКА ИГР:',
+        'Сыграно игр: 1',
+        'Побед: 1',
+        'Спасибо за игру!',
+    )),
+    Rule(('WeatherApiClient',), (
+        '=== HTTP КЛИЕНТ ДЛЯ API ПОГОДЫ ===',
+        '',
+        '🌐 Запрос погоды для города: Москва',
+        '✅ Ответ получен',
+        '🌤️ Погода в Москва: 20.0°C, Солнечно',
+        '🌐 Запрос прогноза для Новосибирск на 3 дней',
+        '✅ Прогноз получен на 3 дней',
+        '',
+        '📅 Прогноз погоды:',
+        'День 1: Погода в Новосибирск: 22.0°C, Дождь',
+        '',
+        '📋 История запросов:',
+        '1. Погода в Москва: 20.0°C, Солнечно',
+        '',
+        '✨ Программа завершена',
+    )),
+    Rule(('TextUtilCLI',), (
+        '=== TEXT UTILITY CLI ===',
+        '',
+        '📚 СПРАВКА:',
+        'textutil <команда> [аргументы]',
+        '',
+        'Доступные команды:',
+        '  stats - Показать статистику текстового файла',
+        '  replace - Найти и заменить текст в файле',
+        '',
+        '📊 Анализ файла: document.txt',
+        '📈 СТАТИСТИКА:',
+        'Файл: document.txt',
+        'Строк: 4',
+        'Слов: 16',
+        'Символов: 137',
+    )),
+    Rule(('FileManager', 'listDirectory'), (
+        '=== ФАЙЛОВЫЙ МЕНЕДЖЕР ===',
+        '',
+        '📂 Содержимое папки: .',
+        '',
+        '📋 Найденные файлы:',
+        '  📁 documents (папка)',
+        '  📄 README.md (2.0 KB)',
+        '  📄 app.dart (15.0 KB)',
+        '',
+        '📖 Чтение файла: README.md',
+        '✅ Файл прочитан',
+        '📊 Размер: 138 символов',
+        '',
+        '✨ Программа завершена',
+    )),
+    Rule(('TestFramework', 'Calculator'), (
+        '=== UNIT ТЕСТИРОВАНИЕ КАЛЬКУЛЯТОРА ===',
+        '',
+        '📂 Базовые арифметические операции',
+        '  ✅ сложение положительных чисел',
+        '  ✅ вычитание',
+        '  ✅ умножение',
+        '  ✅ деление',
+        '',
+        '📂 Обработка ошибок',
+        '  ✅ деление на ноль',
+        '',
+        '📂 Продвинутые операции',
+        '  ✅ возведение в степень',
+        '  ✅ последовательность Фибоначчи',
+        '',
+        '📊 РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ:',
+        'Всего тестов: 15',
+        '✅ Прошли: 15',
+        '❌ Провалились: 0',
+        'Успешность: 100.0%',
+        '',
+        '🎉 Все тесты прошли успешно!',
+    )),
+)
+
+
+class _TrieNode:
+    __slots__ = ('children', 'chars', 'nocase', 'terminal')
+
+    def __init__(self):
+        self.children = {}  # символ в нижнем регистре -> узел
+        self.chars = set()  # символы ключевых слов в исходном регистре
+        self.nocase = False
+        self.terminal = False
+
+
+def _trie_pattern(node, root=False):
+    """Регулярное выражение по префиксному дереву: одна ветка на каждый символ"""
+    branches = []
+    for char, child in sorted(node.children.items()):
+        variants = sorted({char, char.upper()} | child.chars) if child.nocase else sorted(child.chars)
+        rest = _trie_pattern(child)
+        if root:
+            # Первые символы - только литералы: тогда движок re быстро пропускает
+            # позиции, с которых не начинается ни одно слово
+            branches.extend(re.escape(variant) + rest for variant in variants)
+        elif len(variants) > 1:
+            branches.append('[' + ''.join(re.escape(v) for v in variants) + ']' + rest)
+        else:
+            branches.append(re.escape(variants[0]) + rest)
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    # Жадная необязательная часть дает самое длинное слово в данной позиции
+    return f'(?:{body})?' if node.terminal else body
+
+
+class KeywordMatcher:
+    """Находит все ключевые слова набора за один проход по тексту.
+
+    Слова собираются в префиксное дерево (по нижнему регистру), которое
+    компилируется в одно регулярное выражение: в каждой позиции движок идет
+    только по ветке текущего символа и находит самое длинное подходящее слово.
+    Более короткие слова, вложенные в найденное, восстанавливаются из заранее
+    посчитанной таблицы, а регистр слов без IgnoreCase сверяется с найденным
+    фрагментом.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = frozenset(keywords)
+        self._by_folded = defaultdict(list)
+        root = _TrieNode()
+        for keyword in self.keywords:
+            folded = keyword.lower()
+            self._by_folded[folded].append(keyword)
+            node = root
+            for char, original in zip(folded, keyword):
+                node = node.children.setdefault(char, _TrieNode())
+                node.chars.add(original)
+                node.nocase = node.nocase or isinstance(keyword, IgnoreCase)
+            node.terminal = True
+        self._regex = re.compile(_trie_pattern(root, root=True))
+
+        self._implied = {
+            folded: tuple(other for other in self._by_folded if other in folded)
+            for folded in self._by_folded
+        }
+
+    def find(self, text):
+        """Множество ключевых слов, встречающихся в тексте"""
+        found = set()
+        search = self._regex.search
+        match = search(text)
+        while match is not None:
+            fragment = match.group()
+            for folded in self._implied[fragment.lower()]:
+                for keyword in self._by_folded[folded]:
+                    if keyword not in found and (
+                            isinstance(keyword, IgnoreCase) or keyword in fragment):
+                        found.add(keyword)
+            match = search(text, match.start() + 1)
+        return found
+
+
+def _compile_rules(rules):
+    by_keyword = defaultdict(list)
+    for index, rule in enumerate(rules):
+        for keyword in rule.keywords:
+            by_keyword[keyword].append(index)
+    return KeywordMatcher(list(by_keyword) + ['void main()']), dict(by_keyword)
+
+
+MATCHER, RULES_BY_KEYWORD = _compile_rules(RULES)
+
+
+def simulate(code):
+    """Возвращает имитированный вывод программы"""
+    output_lines = []
+
+    # print() с простым текстом идут первыми, затем print() с интерполяцией
+    interpolated = []
+    for match in PRINT_PATTERN.finditer(code):
+        text = match.group(1)
+        if '$' in text:
+            interpolated.append(text)
+        else:
+            output_lines.append(text)
+    for text in interpolated:
+        for name, value in INTERPOLATION_VALUES:
+            text = text.replace(name, value)
+        output_lines.append(text)
+
+    found = MATCHER.find(code)
+    candidates = sorted({index for keyword in found for index in RULES_BY_KEYWORD.get(keyword, ())})
+    fired_groups = set()
+    for index in candidates:
+        rule = RULES[index]
+        if rule.group in fired_groups:
+            continue
+        if all(keyword in found for keyword in rule.keywords):
+            output_lines.extend(rule.output)
+            if rule.group:
+                fired_groups.add(rule.group)
+
+    if not output_lines and 'void main()' in found:
+        output_lines.append(NO_OUTPUT_MESSAGE)
+
+    return '\n'.join(output_lines)
@@ -0,0 +1,79 @@
+"""Объединение одновременных одинаковых запусков (single flight)"""
+import threading
+
+
+class _Call:
+    """Выполняющийся вызов: результат и вывод, который видят все ожидающие"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.lines = []
+        self.listeners = []
+
+
+class SingleFlight:
+    """Одновременные вызовы с одним ключом ждут одно выполнение.
+
+    Первый вызов (ведущий) выполняет функцию, остальные получают его результат.
+    Строки вывода ведущего пересылаются всем ожидающим, в том числе
+    присоединившимся позже: им сначала повторяется уже накопленный вывод.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.followers = 0
+
+    def do(self, key, fn, on_output=None):
+        """Возвращает (результат fn(on_output), был ли он получен от другого вызова)"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+                self.leaders += 1
+            else:
+                leader = False
+                self.followers += 1
+                if on_output is not None:
+                    for stream, line in call.lines:
+                        on_output(stream, line)
+                    call.listeners.append(on_output)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        if on_output is not None:
+            call.listeners.append(on_output)
+
+        def broadcast(stream, line):
+            with self._lock:
+                call.lines.append((stream, line))
+                listeners = list(call.listeners)
+            for listener in listeners:
+                listener(stream, line)
+
+        try:
+            call.result = fn(broadcast)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self):
+        with self._lock:
+            return {
+                'leaders': self.leaders,
+                'followers': self.followers,
+                'in_flight': len(self._calls),
+            }
@@ -0,0 +1,150 @@
+"""Заранее скомпилированные шаблоны уроков и их вывод.
+
+Первый запуск урока почти всегда - неизмененный code_template. Команда
+flask build-snapshots компилирует каждый шаблон в kernel (.dill) и
+выполняет его; манифест хранит путь к kernel и результат по хешу кода.
+Kernel привязан к версии SDK, поэтому после обновления Dart снапшоты
+игнорируются до пересборки.
+"""
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from execution.cache import is_cacheable, source_hash
+from execution.compiler import IncrementalCompiler, find_sdk
+
+MANIFEST = 'manifest.json'
+
+# Как часто (секунды) проверять, не пересобран ли манифест
+RELOAD_INTERVAL = 5
+
+
+def sdk_version(dart_path):
+    """Версия Dart SDK из файла version, или None"""
+    sdk = find_sdk(dart_path)
+    if sdk is None:
+        return None
+    try:
+        return (sdk / 'version').read_text().strip()
+    except OSError:
+        return None
+
+
+class LessonSnapshots:
+    """Манифест снапшотов шаблонов: хеш кода -> kernel и результат"""
+
+    def __init__(self, directory, dart_path='dart'):
+        self.directory = directory
+        self.dart_path = dart_path
+        self._entries = {}
+        self._mtime = None
+        self._checked_at = float('-inf')
+        self._sdk = None
+        self._lock = threading.Lock()
+
+    def _reload_if_changed(self):
+        now = time.monotonic()
+        if now - self._checked_at < RELOAD_INTERVAL:
+            return
+        self._checked_at = now
+        path = os.path.join(self.directory, MANIFEST)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            self._entries, self._mtime = {}, None
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        if self._sdk is None:
+            self._sdk = sdk_version(self.dart_path) or ''
+        entries = manifest.get('lessons', {})
+        if manifest.get('sdk') != self._sdk:
+            # Kernel от другой версии SDK VM не загрузит, да и вывод мог измениться
+            entries = {}
+        self._entries, self._mtime = entries, mtime
+
+    def get(self, key):
+        """Запись для кода с хешем key: {'kernel': путь или None, 'result': ...} или None"""
+        with self._lock:
+            self._reload_if_changed()
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        kernel = entry.get('kernel')
+        if kernel:
+            kernel = os.path.join(self.directory, kernel)
+            if not os.path.exists(kernel):
+                kernel = None
+        return {'kernel': kernel, 'result': entry.get('result')}
+
+    def __len__(self):
+        with self._lock:
+            self._reload_if_changed()
+            return len(self._entries)
+
+
+def build_snapshots(lessons, directory, dart_path, execute, log=print):
+    """Компилирует и выполняет шаблоны всех уроков, пишет манифест.
+
+    execute(code, kernel) - выполняет готовый kernel и возвращает словарь
+    результата. Kernel и вывод прежней сборки, которых нет в новой, удаляются.
+    """
+    os.makedirs(directory, exist_ok=True)
+    entries = {}
+    workdir = tempfile.mkdtemp(prefix='snapshots-')
+    compiler = IncrementalCompiler(dart_path, workdir)
+    compiler.start()
+    try:
+        for lesson in lessons:
+            template = lesson.get('code_template')
+            if not template:
+                continue
+            key = source_hash(template)
+            if key in entries:
+                continue
+            kernel = f'{key[:16]}.dill'
+            kernel_path = os.path.join(directory, kernel)
+            errors, diagnostics = compiler.compile(template, kernel_path + '.tmp')
+            if errors:
+                log(f"Урок {lesson['id']}: ошибка компиляции шаблона, сохраняем только вывод")
+                kernel = None
+                result = {'success': False, 'output': '', 'error': f'Ошибка компиляции:\n{diagnostics}'}
+            else:
+                os.replace(kernel_path + '.tmp', kernel_path)
+                result = execute(template, kernel_path)
+                result.pop('timings', None)
+                if not is_cacheable(template, result):
+                    # Вывод меняется от запуска к запуску - храним только kernel
+                    result = None
+            entries[key] = {'lesson_id': lesson['id'], 'kernel': kernel, 'result': result}
+            log(f"Урок {lesson['id']}: {'kernel' if kernel else 'без kernel'}"
+                f"{', вывод сохранен' if result is not None else ''}")
+    finally:
+        compiler.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    manifest = {
+        'sdk': sdk_version(dart_path) or '',
+        'built_at': datetime.utcnow().isoformat(),
+        'lessons': entries,
+    }
+    # Манифест заменяется атомарно: работающие процессы видят старый или новый
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.json')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, os.path.join(directory, MANIFEST))
+
+    kept = {entry['kernel'] for entry in entries.values() if entry['kernel']}
+    for name in os.listdir(directory):
+        if name.endswith('.dill') and name not in kept:
+            os.remove(os.path.join(directory, name))
+    return entries
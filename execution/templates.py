@@ -0,0 +1,42 @@
+"""Индекс шаблонов уроков: неизмененный шаблон узнается по хешу кода"""
+from execution.cache import source_hash
+
+
+class TemplateIndex:
+    """Хеш нормализованного шаблона -> урок и готовый результат его запуска.
+
+    Результат берется не из expected_output урока (это вывод решенного
+    задания, а не шаблона), а из настоящего запуска шаблона: снапшота,
+    интерпретатора или имитации, смотря какой бэкенд выполняет код.
+    """
+
+    def __init__(self, lessons):
+        self.lesson_ids = {str(lesson['id']) for lesson in lessons}
+        self._lessons = {}    # хеш -> id урока
+        self._templates = {}  # хеш -> код шаблона
+        self._results = {}    # хеш -> результат запуска шаблона
+        for lesson in lessons:
+            template = lesson.get('code_template')
+            if not template:
+                continue
+            key = source_hash(template)
+            self._lessons.setdefault(key, str(lesson['id']))
+            self._templates.setdefault(key, template)
+
+    def lesson_for(self, key):
+        return self._lessons.get(key)
+
+    def result_for(self, key):
+        result = self._results.get(key)
+        return dict(result) if result is not None else None
+
+    def fill_results(self, produce):
+        """produce(key, template) -> результат или None; вызывается для каждого шаблона"""
+        for key, template in self._templates.items():
+            result = produce(key, template)
+            if result is not None:
+                self._results[key] = result
+        return len(self._results)
+
+    def __len__(self):
+        return len(self._lessons)
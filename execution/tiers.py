@@ -0,0 +1,69 @@
+"""Уровни выполнения кода: от готовых ответов до настоящего Dart.
+
+run_dart_code идет по уровням от дешевого к дорогому: неизмененный шаблон
+урока, кеш результатов, снапшот, затем цепочка бэкендов (интерпретатор,
+пул Dart, удаленный сервис, имитация). TierStats считает, какой уровень
+обслужил каждый запрос и сколько занял выбор уровня, - по долям видно,
+сколько мощности Dart VM действительно нужно.
+"""
+import threading
+
+from execution.metrics import Histogram
+
+TIERS = ('template', 'cache', 'snapshot', 'coalesced', 'interpreter', 'local', 'remote', 'simulator')
+
+# Верхние границы корзин времени выбора уровня (секунды)
+ROUTING_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.01, 0.1)
+
+
+class TierStats:
+    """Счетчики запросов по уровням и гистограмма времени выбора уровня"""
+
+    def __init__(self):
+        self._hits = dict.fromkeys(TIERS, 0)
+        self._routing = Histogram(ROUTING_BUCKETS)
+        self._routing_max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, tier, routing_seconds):
+        routing_seconds = max(0.0, routing_seconds)
+        with self._lock:
+            self._hits[tier] = self._hits.get(tier, 0) + 1
+            self._routing.observe(routing_seconds)
+            self._routing_max = max(self._routing_max, routing_seconds)
+
+    def stats(self):
+        with self._lock:
+            total = sum(self._hits.values())
+            routing = self._routing
+            return {
+                'total': total,
+                'tiers': {
+                    tier: {'hits': hits, 'ratio': round(hits / total, 4) if total else 0.0}
+                    for tier, hits in self._hits.items()
+                },
+                'routing_ms': {
+                    'avg': round(routing.sum / routing.count * 1000, 3) if routing.count else 0.0,
+                    'max': round(self._routing_max * 1000, 3),
+                },
+            }
+
+    def render(self, prefix='dart_execution'):
+        """Счетчики и гистограмма в формате Prometheus"""
+        lines = [
+            f'# HELP {prefix}_tier_requests_total Запросы, обслуженные каждым уровнем выполнения',
+            f'# TYPE {prefix}_tier_requests_total counter',
+        ]
+        with self._lock:
+            for tier, hits in self._hits.items():
+                lines.append(f'{prefix}_tier_requests_total{{tier="{tier}"}} {hits}')
+            name = f'{prefix}_routing_seconds'
+            lines.append(f'# HELP {name} Время выбора уровня выполнения')
+            lines.append(f'# TYPE {name} histogram')
+            cumulative = 0
+            for bound, count in zip(self._routing.buckets + ('+Inf',), self._routing.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_sum {self._routing.sum:.6f}')
+            lines.append(f'{name}_count {self._routing.count}')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,3 @@
+void main() {
+  print('Hello, World!');
+}
\ No newline at end of file
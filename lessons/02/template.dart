@@ -0,0 +1,4 @@
+void main() {
+  // TODO: Добавьте комментарий здесь
+  print('Меня зовут: ');
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+void main() {
+  // Создайте переменные здесь
+  String name = '';
+  int age = 0;
+  String city = '';
+  
+  print('Имя: $name');
+  print('Возраст: $age');
+  print('Город: $city');
+}
\ No newline at end of file
@@ -0,0 +1,9 @@
+void main() {
+  int length = 10;
+  int width = 5;
+  
+  // Вычислите площадь
+  int area = 0;
+  
+  print('Площадь прямоугольника: $area');
+}
\ No newline at end of file
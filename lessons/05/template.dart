@@ -0,0 +1,9 @@
+void main() {
+  int number = -5;
+  
+  // Добавьте условие здесь
+  if (number > 0) {
+    print('Число положительное');
+  }
+  // Добавьте else if и else
+}
\ No newline at end of file
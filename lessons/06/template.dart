@@ -0,0 +1,6 @@
+void main() {
+  // Создайте цикл for здесь
+  for (int i = 1; i <= 10; i++) {
+    print('Число: $i');
+  }
+}
\ No newline at end of file
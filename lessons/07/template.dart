@@ -0,0 +1,9 @@
+// Создайте функцию square здесь
+int square(int number) {
+  return number * number;
+}
+
+void main() {
+  int result = square(5);
+  print('Квадрат числа 5 равен: $result');
+}
\ No newline at end of file
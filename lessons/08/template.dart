@@ -0,0 +1,8 @@
+void main() {
+  List<String> fruits = ['яблоко', 'банан', 'апельсин'];
+  
+  // Выведите каждый фрукт используя цикл
+  for (int i = 0; i < fruits.length; i++) {
+    print('Фрукт \${i + 1}: \${fruits[i]}');
+  }
+}
\ No newline at end of file
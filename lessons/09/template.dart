@@ -0,0 +1,12 @@
+void main() {
+  int sum = 0;
+  int number = 1;
+  
+  // Создайте цикл while здесь
+  while (number <= 100) {
+    sum += number;
+    number++;
+  }
+  
+  print('Сумма чисел от 1 до 100: $sum');
+}
\ No newline at end of file
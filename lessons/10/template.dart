@@ -0,0 +1,15 @@
+void main() {
+  Map<String, String> phoneBook = {
+    'Мама': '+7-123-456-78-90',
+    'Папа': '+7-098-765-43-21',
+    'Друг': '+7-555-123-45-67'
+  };
+  
+  String contact = 'Мама';
+  
+  if (phoneBook.containsKey(contact)) {
+    print('Номер $contact: ${phoneBook[contact]}');
+  } else {
+    print('Контакт $contact не найден');
+  }
+}
\ No newline at end of file
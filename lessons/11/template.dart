@@ -0,0 +1,16 @@
+double safeDivide(double a, double b) {
+  try {
+    if (b == 0) {
+      throw Exception('Деление на ноль!');
+    }
+    return a / b;
+  } catch (e) {
+    print('Ошибка: $e');
+    return 0.0;
+  }
+}
+
+void main() {
+  print('10 / 2 = ${safeDivide(10, 2)}');
+  print('10 / 0 = ${safeDivide(10, 0)}');
+}
\ No newline at end of file
@@ -0,0 +1,16 @@
+class Car {
+  String brand;
+  String model;
+  int year;
+  
+  Car(this.brand, this.model, this.year);
+  
+  void displayInfo() {
+    print('Автомобиль: $brand $model ($year год)');
+  }
+}
+
+void main() {
+  Car myCar = Car('Toyota', 'Camry', 2020);
+  myCar.displayInfo();
+}
\ No newline at end of file
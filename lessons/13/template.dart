@@ -0,0 +1,13 @@
+Future<String> loadUserData(String username) async {
+  print('Загрузка данных для $username...');
+  
+  // Имитация задержки сети
+  await Future.delayed(Duration(seconds: 1));
+  
+  return 'Данные пользователя $username загружены!';
+}
+
+void main() async {
+  String result = await loadUserData('Анна');
+  print(result);
+}
\ No newline at end of file
@@ -0,0 +1,20 @@
+import 'dart:convert';
+
+void main() {
+  // Исходные данные
+  Map<String, dynamic> userData = {
+    'name': 'Иван Петров',
+    'email': 'ivan@example.com',
+    'age': 28,
+    'isActive': true
+  };
+  
+  // Преобразование в JSON
+  String jsonString = jsonEncode(userData);
+  print('JSON: $jsonString');
+  
+  // Обратное преобразование
+  Map<String, dynamic> decodedData = jsonDecode(jsonString);
+  print('Имя: ${decodedData['name']}');
+  print('Email: ${decodedData['email']}');
+}
\ No newline at end of file
@@ -0,0 +1,36 @@
+import 'dart:io';
+
+class Calculator {
+  double add(double a, double b) => a + b;
+  double subtract(double a, double b) => a - b;
+  double multiply(double a, double b) => a * b;
+  
+  double divide(double a, double b) {
+    if (b == 0) {
+      throw Exception('Деление на ноль невозможно!');
+    }
+    return a / b;
+  }
+}
+
+void main() {
+  Calculator calc = Calculator();
+  
+  print('=== Калькулятор ===');
+  print('Доступные операции: +, -, *, /');
+  
+  // Пример использования (в реальном проекте здесь был бы пользовательский ввод)
+  try {
+    double result1 = calc.add(10, 5);
+    print('10 + 5 = $result1');
+    
+    double result2 = calc.divide(20, 4);
+    print('20 / 4 = $result2');
+    
+    // Тест обработки ошибки
+    double result3 = calc.divide(10, 0);
+    print('10 / 0 = $result3');
+  } catch (e) {
+    print('Ошибка: $e');
+  }
+}
\ No newline at end of file
@@ -0,0 +1,23 @@
+String? getUserName() {
+  // Может вернуть null
+  return null;
+}
+
+int? getAge() {
+  return 25;
+}
+
+void main() {
+  String? name = getUserName();
+  int? age = getAge();
+  
+  // Используйте безопасные операторы
+  print('Имя: ${name ?? "Неизвестно"}');
+  print('Длина имени: ${name?.length ?? 0}');
+  print('Возраст: ${age ?? 0}');
+  
+  // Проверка на null
+  if (name != null) {
+    print('Имя точно есть: ${name.toUpperCase()}');
+  }
+}
\ No newline at end of file
@@ -0,0 +1,37 @@
+// Создайте extension для List
+extension ListExtensions on List<int> {
+  int get sum {
+    int total = 0;
+    for (int item in this) {
+      total += item;
+    }
+    return total;
+  }
+  
+  double get average => isEmpty ? 0 : sum / length;
+}
+
+// Создайте extension для String
+extension StringExtensions on String {
+  String get capitalized {
+    if (isEmpty) return this;
+    return this[0].toUpperCase() + substring(1).toLowerCase();
+  }
+  
+  bool get isPalindrome {
+    String clean = toLowerCase().replaceAll(' ', '');
+    return clean == clean.split('').reversed.join('');
+  }
+}
+
+void main() {
+  List<int> numbers = [1, 2, 3, 4, 5];
+  print('Сумма: ${numbers.sum}');
+  print('Среднее: ${numbers.average}');
+  
+  String text = 'hello world';
+  print('Капитализированный: ${text.capitalized}');
+  
+  String palindrome = 'level';
+  print('Палиндром: ${palindrome.isPalindrome}');
+}
\ No newline at end of file
@@ -0,0 +1,87 @@
+// Базовый класс персонажа
+class Character {
+  String name;
+  int health;
+  
+  Character(this.name, this.health);
+  
+  void info() {
+    print('$name (HP: $health)');
+  }
+}
+
+// Миксин для магических способностей
+mixin Magical {
+  int mana = 100;
+  
+  void castSpell(String spell) {
+    if (mana >= 20) {
+      mana -= 20;
+      print('Применяю заклинание: $spell (Мана: $mana)');
+    } else {
+      print('Недостаточно маны!');
+    }
+  }
+}
+
+// Миксин для боевых навыков
+mixin Fighter {
+  int strength = 50;
+  
+  void attack(String weapon) {
+    print('Атакую с помощью: $weapon (Сила: $strength)');
+  }
+}
+
+// Миксин для скрытности
+mixin Stealthy {
+  bool isHidden = false;
+  
+  void hide() {
+    isHidden = true;
+    print('Скрываюсь в тенях...');
+  }
+  
+  void reveal() {
+    isHidden = false;
+    print('Выхожу из укрытия');
+  }
+}
+
+// Классы персонажей с разными способностями
+class Wizard extends Character with Magical {
+  Wizard(String name) : super(name, 80);
+}
+
+class Warrior extends Character with Fighter {
+  Warrior(String name) : super(name, 120);
+}
+
+class Rogue extends Character with Fighter, Stealthy {
+  Rogue(String name) : super(name, 100);
+}
+
+class Paladin extends Character with Fighter, Magical {
+  Paladin(String name) : super(name, 110);
+}
+
+void main() {
+  var wizard = Wizard('Мерлин');
+  wizard.info();
+  wizard.castSpell('Огненный шар');
+  
+  var warrior = Warrior('Конан');
+  warrior.info();
+  warrior.attack('Меч');
+  
+  var rogue = Rogue('Тень');
+  rogue.info();
+  rogue.hide();
+  rogue.attack('Кинжал');
+  rogue.reveal();
+  
+  var paladin = Paladin('Артур');
+  paladin.info();
+  paladin.attack('Священный меч');
+  paladin.castSpell('Исцеление');
+}
\ No newline at end of file
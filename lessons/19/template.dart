@@ -0,0 +1,69 @@
+// Универсальный кеш для любых типов данных
+class Cache<K, V> {
+  final Map<K, V> _storage = {};
+  final int maxSize;
+  
+  Cache({this.maxSize = 100});
+  
+  // Сохранить значение
+  void put(K key, V value) {
+    if (_storage.length >= maxSize) {
+      // Удаляем первый элемент если кеш полон
+      var firstKey = _storage.keys.first;
+      _storage.remove(firstKey);
+    }
+    _storage[key] = value;
+    print('Сохранено: $key => $value');
+  }
+  
+  // Получить значение
+  V? get(K key) {
+    if (_storage.containsKey(key)) {
+      print('Найдено в кеше: $key => ${_storage[key]}');
+      return _storage[key];
+    } else {
+      print('Не найдено в кеше: $key');
+      return null;
+    }
+  }
+  
+  // Размер кеша
+  int get size => _storage.length;
+  
+  // Очистить кеш
+  void clear() {
+    _storage.clear();
+    print('Кеш очищен');
+  }
+}
+
+// Специализированный класс для работы с числами
+class Calculator<T extends num> {
+  T add(T a, T b) => (a + b) as T;
+  T multiply(T a, T b) => (a * b) as T;
+  
+  bool isPositive(T value) => value > 0;
+}
+
+void main() {
+  // Кеш строк
+  var stringCache = Cache<String, String>(maxSize: 3);
+  stringCache.put('greeting', 'Привет');
+  stringCache.put('farewell', 'Пока');
+  var greeting = stringCache.get('greeting');
+  
+  // Кеш чисел
+  var numberCache = Cache<int, double>();
+  numberCache.put(1, 3.14);
+  numberCache.put(2, 2.71);
+  var pi = numberCache.get(1);
+  
+  // Калькулятор для разных типов чисел
+  var intCalc = Calculator<int>();
+  print('Сумма int: ${intCalc.add(5, 3)}');
+  print('5 положительное: ${intCalc.isPositive(5)}');
+  
+  var doubleCalc = Calculator<double>();
+  print('Произведение double: ${doubleCalc.multiply(2.5, 4.0)}');
+  print('Размер кеша строк: ${stringCache.size}');
+}
\ No newline at end of file
@@ -0,0 +1,96 @@
+import 'dart:math';
+
+class Vector {
+  final double x;
+  final double y;
+  
+  Vector(this.x, this.y);
+  
+  // Сложение векторов
+  Vector operator +(Vector other) {
+    return Vector(x + other.x, y + other.y);
+  }
+  
+  // Вычитание векторов
+  Vector operator -(Vector other) {
+    return Vector(x - other.x, y - other.y);
+  }
+  
+  // Умножение на скаляр
+  Vector operator *(double scalar) {
+    return Vector(x * scalar, y * scalar);
+  }
+  
+  // Деление на скаляр
+  Vector operator /(double scalar) {
+    if (scalar == 0) throw ArgumentError('Деление на ноль!');
+    return Vector(x / scalar, y / scalar);
+  }
+  
+  // Унарный минус (обращение вектора)
+  Vector operator -() {
+    return Vector(-x, -y);
+  }
+  
+  // Сравнение векторов
+  @override
+  bool operator ==(Object other) {
+    return other is Vector && 
+           (x - other.x).abs() < 0.001 && 
+           (y - other.y).abs() < 0.001;
+  }
+  
+  @override
+  int get hashCode => x.hashCode ^ y.hashCode;
+  
+  // Длина вектора
+  double get length => sqrt(x * x + y * y);
+  
+  // Нормализация вектора
+  Vector get normalized {
+    double len = length;
+    if (len == 0) return Vector(0, 0);
+    return Vector(x / len, y / len);
+  }
+  
+  // Скалярное произведение
+  double dot(Vector other) {
+    return x * other.x + y * other.y;
+  }
+  
+  @override
+  String toString() => 'Vector($x, $y)';
+}
+
+void main() {
+  var v1 = Vector(3, 4);
+  var v2 = Vector(1, 2);
+  
+  print('v1: $v1');
+  print('v2: $v2');
+  print('Длина v1: ${v1.length}');
+  
+  var sum = v1 + v2;
+  print('v1 + v2 = $sum');
+  
+  var diff = v1 - v2;
+  print('v1 - v2 = $diff');
+  
+  var scaled = v1 * 2;
+  print('v1 * 2 = $scaled');
+  
+  var divided = v1 / 2;
+  print('v1 / 2 = $divided');
+  
+  var negated = -v1;
+  print('-v1 = $negated');
+  
+  var normalized = v1.normalized;
+  print('Нормализованный v1: $normalized');
+  
+  var dotProduct = v1.dot(v2);
+  print('Скалярное произведение v1 · v2 = $dotProduct');
+  
+  print('v1 == v2: ${v1 == v2}');
+  print('v1 == Vector(3, 4): ${v1 == Vector(3, 4)}');
+}
\ No newline at end of file
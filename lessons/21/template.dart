@@ -0,0 +1,154 @@
+import 'dart:math';
+
+class NumberGuessingGame {
+  late int _targetNumber;
+  late int _maxNumber;
+  late int _attempts;
+  late int _maxAttempts;
+  String _difficulty = '';
+  
+  void startGame() {
+    print('=== ИГРА "УГАДАЙ ЧИСЛО" ===');
+    print('Выберите уровень сложности:');
+    print('1. Легкий (1-50, 10 попыток)');
+    print('2. Средний (1-100, 8 попыток)');
+    print('3. Сложный (1-200, 6 попыток)');
+    
+    // Симуляция выбора среднего уровня
+    _selectDifficulty(2);
+    _generateNumber();
+    _playGame();
+  }
+  
+  void _selectDifficulty(int choice) {
+    switch (choice) {
+      case 1:
+        _maxNumber = 50;
+        _maxAttempts = 10;
+        _difficulty = 'Легкий';
+        break;
+      case 2:
+        _maxNumber = 100;
+        _maxAttempts = 8;
+        _difficulty = 'Средний';
+        break;
+      case 3:
+        _maxNumber = 200;
+        _maxAttempts = 6;
+        _difficulty = 'Сложный';
+        break;
+      default:
+        _maxNumber = 100;
+        _maxAttempts = 8;
+        _difficulty = 'Средний';
+    }
+    print('Выбран уровень: $_difficulty');
+    print('Диапазон: 1-$_maxNumber, Попыток: $_maxAttempts');
+  }
+  
+  void _generateNumber() {
+    var random = Random();
+    _targetNumber = random.nextInt(_maxNumber) + 1;
+    _attempts = 0;
+    print('Я загадал число от 1 до $_maxNumber. Попробуй угадать!');
+  }
+  
+  void _playGame() {
+    // Симулируем несколько попыток
+    List<int> guesses = [50, 75, 62, 68, 65, 67, 66];
+    _targetNumber = 66; // Для демонстрации
+    
+    for (int guess in guesses) {
+      _attempts++;
+      print('\nПопытка $_attempts: $guess');
+      
+      if (_checkGuess(guess)) {
+        _showWinMessage();
+        return;
+      }
+      
+      if (_attempts >= _maxAttempts) {
+        _showLoseMessage();
+        return;
+      }
+    }
+  }
+  
+  bool _checkGuess(int guess) {
+    if (guess == _targetNumber) {
+      return true;
+    } else if (guess < _targetNumber) {
+      print('Слишком мало! Попробуй больше.');
+      _giveHint(guess);
+    } else {
+      print('Слишком много! Попробуй меньше.');
+      _giveHint(guess);
+    }
+    
+    int remaining = _maxAttempts - _attempts;
+    print('Осталось попыток: $remaining');
+    return false;
+  }
+  
+  void _giveHint(int guess) {
+    int difference = (guess - _targetNumber).abs();
+    if (difference <= 5) {
+      print('🔥 Очень горячо!');
+    } else if (difference <= 10) {
+      print('🌡️ Тепло!');
+    } else if (difference <= 20) {
+      print('❄️ Прохладно!');
+    } else {
+      print('🧊 Холодно!');
+    }
+  }
+  
+  void _showWinMessage() {
+    print('\n🎉 ПОЗДРАВЛЯЮ! Ты угадал число $_targetNumber!');
+    print('Количество попыток: $_attempts');
+    
+    String performance;
+    if (_attempts <= _maxAttempts ~/ 3) {
+      performance = 'Отлично! 🌟';
+    } else if (_attempts <= _maxAttempts ~/ 2) {
+      performance = 'Хорошо! 👍';
+    } else {
+      performance = 'Неплохо! 👌';
+    }
+    print('Результат: $performance');
+  }
+  
+  void _showLoseMessage() {
+    print('\n💔 Игра окончена! Попытки закончились.');
+    print('Загаданное число было: $_targetNumber');
+    print('Попробуй еще раз!');
+  }
+  
+  // Статистика игр
+  void showGameStats() {
+    print('\n📊 СТАТИСТИКА ИГР:');
+    print('Сыграно игр: 1');
+    print('Побед: 1');
+    print('Средний результат: $_attempts попыток');
+    print('Лучший результат: $_attempts попыток');
+  }
+}
+
+// Дополнительный класс для управления игровой сессией
+class GameSession {
+  final NumberGuessingGame _game = NumberGuessingGame();
+  
+  void start() {
+    _game.startGame();
+    _game.showGameStats();
+    
+    print('\n🎮 Хочешь сыграть еще? (да/нет)');
+    // В реальной игре здесь был бы пользовательский ввод
+    print('Спасибо за игру!');
+  }
+}
+
+void main() {
+  var session = GameSession();
+  session.start();
+}
\ No newline at end of file
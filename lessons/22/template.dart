@@ -0,0 +1,186 @@
+import 'dart:convert';
+
+// Модель данных для погоды
+class Weather {
+  final String city;
+  final double temperature;
+  final String description;
+  final int humidity;
+  final double windSpeed;
+  
+  Weather({
+    required this.city,
+    required this.temperature,
+    required this.description,
+    required this.humidity,
+    required this.windSpeed,
+  });
+  
+  factory Weather.fromJson(Map<String, dynamic> json) {
+    return Weather(
+      city: json['city'],
+      temperature: json['temperature'].toDouble(),
+      description: json['description'],
+      humidity: json['humidity'],
+      windSpeed: json['windSpeed'].toDouble(),
+    );
+  }
+  
+  Map<String, dynamic> toJson() {
+    return {
+      'city': city,
+      'temperature': temperature,
+      'description': description,
+      'humidity': humidity,
+      'windSpeed': windSpeed,
+    };
+  }
+  
+  @override
+  String toString() {
+    return 'Погода в $city: $temperature°C, $description, влажность $humidity%, ветер ${windSpeed}м/с';
+  }
+}
+
+// HTTP клиент для работы с API
+class WeatherApiClient {
+  final String baseUrl = 'https://api.weather.com';
+  final String apiKey = 'demo_api_key';
+  
+  // Получение текущей погоды
+  Future<Weather> getCurrentWeather(String city) async {
+    print('🌐 Запрос погоды для города: $city');
+    
+    // Симуляция HTTP запроса
+    await Future.delayed(Duration(seconds: 1));
+    
+    // Симуляция ответа API
+    Map<String, dynamic> mockResponse = {
+      'city': city,
+      'temperature': _generateTemperature(),
+      'description': _getRandomDescription(),
+      'humidity': _generateHumidity(),
+      'windSpeed': _generateWindSpeed(),
+    };
+    
+    print('✅ Ответ получен: ${mockResponse.toString()}');
+    return Weather.fromJson(mockResponse);
+  }
+  
+  // Получение прогноза на несколько дней
+  Future<List<Weather>> getWeatherForecast(String city, int days) async {
+    print('🌐 Запрос прогноза для $city на $days дней');
+    
+    await Future.delayed(Duration(seconds: 2));
+    
+    List<Weather> forecast = [];
+    for (int i = 0; i < days; i++) {
+      Map<String, dynamic> dayData = {
+        'city': '$city (день ${i + 1})',
+        'temperature': _generateTemperature(),
+        'description': _getRandomDescription(),
+        'humidity': _generateHumidity(),
+        'windSpeed': _generateWindSpeed(),
+      };
+      forecast.add(Weather.fromJson(dayData));
+    }
+    
+    print('✅ Прогноз получен на $days дней');
+    return forecast;
+  }
+  
+  // Отправка отчета о погоде
+  Future<bool> submitWeatherReport(Weather weather) async {
+    print('📤 Отправка отчета о погоде...');
+    
+    // Преобразуем в JSON
+    String jsonData = jsonEncode(weather.toJson());
+    print('JSON данные: $jsonData');
+    
+    await Future.delayed(Duration(milliseconds: 500));
+    
+    print('✅ Отчет успешно отправлен');
+    return true;
+  }
+  
+  // Вспомогательные методы для генерации данных
+  double _generateTemperature() {
+    return (15 + (25 * (DateTime.now().millisecond / 1000)));
+  }
+  
+  String _getRandomDescription() {
+    List<String> descriptions = [
+      'Солнечно', 'Облачно', 'Дождь', 'Снег', 'Туман'
+    ];
+    return descriptions[DateTime.now().second % descriptions.length];
+  }
+  
+  int _generateHumidity() {
+    return 40 + (DateTime.now().millisecond ~/ 20);
+  }
+  
+  double _generateWindSpeed() {
+    return (DateTime.now().millisecond / 100);
+  }
+}
+
+// Менеджер для работы с погодными данными
+class WeatherManager {
+  final WeatherApiClient _apiClient = WeatherApiClient();
+  final List<Weather> _weatherHistory = [];
+  
+  Future<void> showCurrentWeather(String city) async {
+    try {
+      Weather weather = await _apiClient.getCurrentWeather(city);
+      print('🌤️ $weather');
+      _weatherHistory.add(weather);
+    } catch (e) {
+      print('❌ Ошибка получения погоды: $e');
+    }
+  }
+  
+  Future<void> showWeatherForecast(String city) async {
+    try {
+      List<Weather> forecast = await _apiClient.getWeatherForecast(city, 3);
+      print('\n📅 Прогноз погоды:');
+      for (int i = 0; i < forecast.length; i++) {
+        print('День ${i + 1}: ${forecast[i]}');
+      }
+    } catch (e) {
+      print('❌ Ошибка получения прогноза: $e');
+    }
+  }
+  
+  void showWeatherHistory() {
+    print('\n📋 История запросов:');
+    if (_weatherHistory.isEmpty) {
+      print('История пуста');
+    } else {
+      for (int i = 0; i < _weatherHistory.length; i++) {
+        print('${i + 1}. ${_weatherHistory[i]}');
+      }
+    }
+  }
+  
+  Future<void> reportWeather(Weather weather) async {
+    await _apiClient.submitWeatherReport(weather);
+  }
+}
+
+void main() async {
+  print('=== HTTP КЛИЕНТ ДЛЯ API ПОГОДЫ ===\n');
+  
+  var weatherManager = WeatherManager();
+  
+  // Получение текущей погоды
+  await weatherManager.showCurrentWeather('Москва');
+  await weatherManager.showCurrentWeather('Санкт-Петербург');
+  
+  // Прогноз погоды
+  await weatherManager.showWeatherForecast('Новосибирск');
+  
+  // История запросов
+  weatherManager.showWeatherHistory();
+  
+  print('\n✨ Программа завершена');
+}
\ No newline at end of file
@@ -0,0 +1,236 @@
+import 'dart:io';
+
+// Базовый класс для команд
+abstract class Command {
+  String get name;
+  String get description;
+  void execute(List<String> args);
+}
+
+// Команда подсчета статистики текста
+class StatsCommand extends Command {
+  @override
+  String get name => 'stats';
+  
+  @override
+  String get description => 'Показать статистику текстового файла';
+  
+  @override
+  void execute(List<String> args) {
+    if (args.isEmpty) {
+      print('❌ Ошибка: Укажите путь к файлу');
+      print('Использование: textutil stats <файл>');
+      return;
+    }
+    
+    String filename = args[0];
+    print('📊 Анализ файла: $filename');
+    
+    // Симуляция чтения файла
+    String content = """
+Dart - это современный язык программирования.
+Он используется для создания мобильных приложений.
+Flutter - это фреймворк на Dart.
+Dart компилируется в нативный код.
+    """.trim();
+    
+    _analyzeText(content, filename);
+  }
+  
+  void _analyzeText(String content, String filename) {
+    List<String> lines = content.split('\n');
+    List<String> words = content.split(RegExp(r'\s+'));
+    words.removeWhere((word) => word.isEmpty);
+    
+    int characters = content.length;
+    int charactersNoSpaces = content.replaceAll(RegExp(r'\s'), '').length;
+    int sentences = content.split(RegExp(r'[.!?]')).length - 1;
+    
+    print('\n📈 СТАТИСТИКА:');
+    print('Файл: $filename');
+    print('Строк: ${lines.length}');
+    print('Слов: ${words.length}');
+    print('Символов: $characters');
+    print('Символов без пробелов: $charactersNoSpaces');
+    print('Предложений: $sentences');
+    print('Средняя длина слова: ${(charactersNoSpaces / words.length).toStringAsFixed(1)} символов');
+  }
+}
+
+// Команда поиска и замены
+class ReplaceCommand extends Command {
+  @override
+  String get name => 'replace';
+  
+  @override
+  String get description => 'Найти и заменить текст в файле';
+  
+  @override
+  void execute(List<String> args) {
+    if (args.length < 3) {
+      print('❌ Ошибка: Недостаточно аргументов');
+      print('Использование: textutil replace <файл> <найти> <заменить>');
+      return;
+    }
+    
+    String filename = args[0];
+    String searchText = args[1];
+    String replaceText = args[2];
+    
+    print('🔍 Замена в файле: $filename');
+    print('Найти: "$searchText"');
+    print('Заменить на: "$replaceText"');
+    
+    // Симуляция содержимого файла
+    String content = 'Dart - отличный язык. Dart используется в Flutter. Dart быстрый.';
+    
+    String newContent = content.replaceAll(searchText, replaceText);
+    int replacements = searchText.allMatches(content).length;
+    
+    print('\n📝 РЕЗУЛЬТАТ:');
+    print('Исходный текст: $content');
+    print('Новый текст: $newContent');
+    print('Замен выполнено: $replacements');
+    
+    if (replacements > 0) {
+      print('✅ Файл успешно обновлен');
+    } else {
+      print('ℹ️ Текст для замены не найден');
+    }
+  }
+}
+
+// Команда форматирования
+class FormatCommand extends Command {
+  @override
+  String get name => 'format';
+  
+  @override
+  String get description => 'Форматировать текстовый файл';
+  
+  @override
+  void execute(List<String> args) {
+    if (args.isEmpty) {
+      print('❌ Ошибка: Укажите путь к файлу');
+      print('Использование: textutil format <файл> [--uppercase] [--lowercase]');
+      return;
+    }
+    
+    String filename = args[0];
+    bool uppercase = args.contains('--uppercase');
+    bool lowercase = args.contains('--lowercase');
+    
+    print('🎨 Форматирование файла: $filename');
+    
+    String content = 'dart - это современный язык программирования от google.';
+    String formatted = content;
+    
+    if (uppercase) {
+      formatted = formatted.toUpperCase();
+      print('Применено: ВЕРХНИЙ РЕГИСТР');
+    } else if (lowercase) {
+      formatted = formatted.toLowerCase();
+      print('Применено: нижний регистр');
+    } else {
+      // Капитализация предложений
+      formatted = _capitalizeSentences(formatted);
+      print('Применено: Капитализация предложений');
+    }
+    
+    print('\n📄 РЕЗУЛЬТАТ:');
+    print('До: $content');
+    print('После: $formatted');
+  }
+  
+  String _capitalizeSentences(String text) {
+    return text.split('. ').map((sentence) {
+      if (sentence.isNotEmpty) {
+        return sentence[0].toUpperCase() + sentence.substring(1);
+      }
+      return sentence;
+    }).join('. ');
+  }
+}
+
+// Главный класс CLI утилиты
+class TextUtilCLI {
+  final Map<String, Command> _commands = {};
+  
+  TextUtilCLI() {
+    _registerCommand(StatsCommand());
+    _registerCommand(ReplaceCommand());
+    _registerCommand(FormatCommand());
+  }
+  
+  void _registerCommand(Command command) {
+    _commands[command.name] = command;
+  }
+  
+  void run(List<String> arguments) {
+    print('=== TEXT UTILITY CLI ===\n');
+    
+    if (arguments.isEmpty) {
+      _showHelp();
+      return;
+    }
+    
+    String commandName = arguments[0];
+    List<String> commandArgs = arguments.sublist(1);
+    
+    if (commandName == 'help' || commandName == '--help' || commandName == '-h') {
+      _showHelp();
+      return;
+    }
+    
+    Command? command = _commands[commandName];
+    if (command == null) {
+      print('❌ Неизвестная команда: $commandName');
+      print('Используйте "help" для списка команд');
+      return;
+    }
+    
+    try {
+      command.execute(commandArgs);
+    } catch (e) {
+      print('❌ Ошибка выполнения команды: $e');
+    }
+  }
+  
+  void _showHelp() {
+    print('📚 СПРАВКА:');
+    print('textutil <команда> [аргументы]\n');
+    print('Доступные команды:');
+    
+    _commands.forEach((name, command) {
+      print('  $name - ${command.description}');
+    });
+    
+    print('\nОбщие опции:');
+    print('  help, --help, -h - Показать эту справку');
+    
+    print('\nПримеры:');
+    print('  textutil stats document.txt');
+    print('  textutil replace file.txt "old" "new"');
+    print('  textutil format text.txt --uppercase');
+  }
+}
+
+void main(List<String> arguments) {
+  // Симуляция различных вызовов
+  var cli = TextUtilCLI();
+  
+  print('Пример 1: Справка');
+  cli.run(['help']);
+  
+  print('\n' + '='*50 + '\n');
+  print('Пример 2: Статистика файла');
+  cli.run(['stats', 'document.txt']);
+  
+  print('\n' + '='*50 + '\n');
+  print('Пример 3: Замена текста');
+  cli.run(['replace', 'file.txt', 'Dart', 'Flutter']);
+  
+  print('\n' + '='*50 + '\n');
+  print('Пример 4: Форматирование');
+  cli.run(['format', 'text.txt']);
+}
\ No newline at end of file
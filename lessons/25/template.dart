@@ -0,0 +1,84 @@
+import 'dart:io';
+import 'dart:convert';
+
+// Класс для информации о файле
+class FileInfo {
+  final String name;
+  final String path;
+  final int size;
+  final DateTime modified;
+  final bool isDirectory;
+  
+  FileInfo({
+    required this.name,
+    required this.path,
+    required this.size,
+    required this.modified,
+    required this.isDirectory,
+  });
+  
+  String get sizeFormatted {
+    if (size < 1024) return '$size B';
+    if (size < 1024 * 1024) return '${(size / 1024).toStringAsFixed(1)} KB';
+    return '${(size / (1024 * 1024)).toStringAsFixed(1)} MB';
+  }
+  
+  String get typeIcon => isDirectory ? '📁' : '📄';
+  
+  @override
+  String toString() {
+    String modifiedStr = '${modified.day}.${modified.month}.${modified.year}';
+    return '$typeIcon $name (${isDirectory ? 'папка' : sizeFormatted}) - $modifiedStr';
+  }
+}
+
+// Файловый менеджер
+class FileManager {
+  String currentPath = '.';
+  
+  // Получить список файлов в директории
+  Future<List<FileInfo>> listDirectory([String? path]) async {
+    path ??= currentPath;
+    print('📂 Содержимое папки: $path');
+    
+    List<FileInfo> files = [];
+    
+    try {
+      // Симуляция списка файлов
+      await Future.delayed(Duration(milliseconds: 500));
+      
+      // Создаем демо-данные
+      files = [
+        FileInfo(
+          name: 'documents',
+          path: '$path/documents',
+          size: 0,
+          modified: DateTime.now().subtract(Duration(days: 5)),
+          isDirectory: true,
+        ),
+        FileInfo(
+          name: 'README.md',
+          path: '$path/README.md',
+          size: 2048,
+          modified: DateTime.now().subtract(Duration(days: 1)),
+          isDirectory: false,
+        ),
+        FileInfo(
+          name: 'config.json',
+          path: '$path/config.json',
+          size: 512,
+          modified: DateTime.now(),
+          isDirectory: false,
+        ),
+      ];
+    } catch (e) {
+      print('Ошибка чтения папки: $e');
+    }
+    
+    return files;
+  }
+}
+
+void main() async {
+  await FileManager().listDirectory();
+}
\ No newline at end of file
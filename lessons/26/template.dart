@@ -0,0 +1,246 @@
+// Класс калькулятора для тестирования
+class Calculator {
+  double add(double a, double b) => a + b;
+  
+  double subtract(double a, double b) => a - b;
+  
+  double multiply(double a, double b) => a * b;
+  
+  double divide(double a, double b) {
+    if (b == 0) {
+      throw ArgumentError('Division by zero is not allowed');
+    }
+    return a / b;
+  }
+  
+  double power(double base, int exponent) {
+    if (exponent < 0) {
+      throw ArgumentError('Negative exponents not supported');
+    }
+    double result = 1;
+    for (int i = 0; i < exponent; i++) {
+      result *= base;
+    }
+    return result;
+  }
+  
+  double sqrt(double value) {
+    if (value < 0) {
+      throw ArgumentError('Square root of negative number');
+    }
+    // Простая реализация через приближение
+    if (value == 0) return 0;
+    double x = value;
+    double prev;
+    do {
+      prev = x;
+      x = (x + value / x) / 2;
+    } while ((x - prev).abs() > 0.0001);
+    return x;
+  }
+  
+  bool isEven(int number) => number % 2 == 0;
+  
+  bool isPrime(int number) {
+    if (number < 2) return false;
+    for (int i = 2; i <= number ~/ 2; i++) {
+      if (number % i == 0) return false;
+    }
+    return true;
+  }
+  
+  List<int> fibonacci(int count) {
+    if (count <= 0) return [];
+    if (count == 1) return [0];
+    if (count == 2) return [0, 1];
+    
+    List<int> result = [0, 1];
+    for (int i = 2; i < count; i++) {
+      result.add(result[i - 1] + result[i - 2]);
+    }
+    return result;
+  }
+}
+
+// Простая реализация тестового фреймворка
+class TestFramework {
+  static int _testCount = 0;
+  static int _passCount = 0;
+  static int _failCount = 0;
+  static String _currentGroup = '';
+  
+  static void group(String description, void Function() tests) {
+    print('\n📂 $description');
+    _currentGroup = description;
+    tests();
+  }
+  
+  static void test(String description, void Function() testFunction) {
+    _testCount++;
+    try {
+      testFunction();
+      _passCount++;
+      print('  ✅ $description');
+    } catch (e) {
+      _failCount++;
+      print('  ❌ $description');
+      print('     Ошибка: $e');
+    }
+  }
+  
+  static void expect<T>(T actual, T expected) {
+    if (actual != expected) {
+      throw Exception('Expected: $expected, but got: $actual');
+    }
+  }
+  
+  static void expectThrows(void Function() function, Type exceptionType) {
+    try {
+      function();
+      throw Exception('Expected exception of type $exceptionType, but no exception was thrown');
+    } catch (e) {
+      if (e.runtimeType.toString() != exceptionType.toString() && 
+          !e.toString().contains(exceptionType.toString())) {
+        throw Exception('Expected exception of type $exceptionType, but got: ${e.runtimeType}');
+      }
+    }
+  }
+  
+  static void expectTrue(bool actual) {
+    if (!actual) {
+      throw Exception('Expected: true, but got: false');
+    }
+  }
+  
+  static void expectFalse(bool actual) {
+    if (actual) {
+      throw Exception('Expected: false, but got: true');
+    }
+  }
+  
+  static void expectListEquals<T>(List<T> actual, List<T> expected) {
+    if (actual.length != expected.length) {
+      throw Exception('List lengths differ. Expected: ${expected.length}, got: ${actual.length}');
+    }
+    for (int i = 0; i < actual.length; i++) {
+      if (actual[i] != expected[i]) {
+        throw Exception('Lists differ at index $i. Expected: ${expected[i]}, got: ${actual[i]}');
+      }
+    }
+  }
+  
+  static void expectApproximately(double actual, double expected, double tolerance) {
+    if ((actual - expected).abs() > tolerance) {
+      throw Exception('Expected: $expected ± $tolerance, but got: $actual');
+    }
+  }
+  
+  static void showResults() {
+    print('\n' + '='*50);
+    print('📊 РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ:');
+    print('Всего тестов: $_testCount');
+    print('✅ Прошли: $_passCount');
+    print('❌ Провалились: $_failCount');
+    print('Успешность: ${(_passCount / _testCount * 100).toStringAsFixed(1)}%');
+    
+    if (_failCount == 0) {
+      print('\n🎉 Все тесты прошли успешно!');
+    } else {
+      print('\n⚠️ Некоторые тесты провалились. Проверьте код.');
+    }
+  }
+}
+
+void main() {
+  print('=== UNIT ТЕСТИРОВАНИЕ КАЛЬКУЛЯТОРА ===');
+  
+  var calculator = Calculator();
+  
+  // Тестирование базовых операций
+  TestFramework.group('Базовые арифметические операции', () {
+    TestFramework.test('сложение положительных чисел', () {
+      TestFramework.expect(calculator.add(2, 3), 5);
+    });
+    
+    TestFramework.test('сложение с нулем', () {
+      TestFramework.expect(calculator.add(5, 0), 5);
+    });
+    
+    TestFramework.test('сложение отрицательных чисел', () {
+      TestFramework.expect(calculator.add(-2, -3), -5);
+    });
+    
+    TestFramework.test('вычитание', () {
+      TestFramework.expect(calculator.subtract(10, 4), 6);
+    });
+    
+    TestFramework.test('умножение', () {
+      TestFramework.expect(calculator.multiply(6, 7), 42);
+    });
+    
+    TestFramework.test('деление', () {
+      TestFramework.expectApproximately(calculator.divide(15, 3), 5, 0.001);
+    });
+  });
+  
+  // Тестирование исключений
+  TestFramework.group('Обработка ошибок', () {
+    TestFramework.test('деление на ноль', () {
+      TestFramework.expectThrows(
+        () => calculator.divide(10, 0),
+        ArgumentError
+      );
+    });
+    
+    TestFramework.test('квадратный корень из отрицательного числа', () {
+      TestFramework.expectThrows(
+        () => calculator.sqrt(-4),
+        ArgumentError
+      );
+    });
+    
+    TestFramework.test('отрицательная степень', () {
+      TestFramework.expectThrows(
+        () => calculator.power(2, -1),
+        ArgumentError
+      );
+    });
+  });
+  
+  // Тестирование сложных функций
+  TestFramework.group('Продвинутые операции', () {
+    TestFramework.test('возведение в степень', () {
+      TestFramework.expect(calculator.power(2, 3), 8);
+      TestFramework.expect(calculator.power(5, 0), 1);
+      TestFramework.expect(calculator.power(10, 2), 100);
+    });
+    
+    TestFramework.test('квадратный корень', () {
+      TestFramework.expectApproximately(calculator.sqrt(16), 4, 0.001);
+      TestFramework.expectApproximately(calculator.sqrt(25), 5, 0.001);
+      TestFramework.expect(calculator.sqrt(0), 0);
+    });
+    
+    TestFramework.test('проверка четности', () {
+      TestFramework.expectTrue(calculator.isEven(4));
+      TestFramework.expectFalse(calculator.isEven(5));
+      TestFramework.expectTrue(calculator.isEven(0));
+    });
+    
+    TestFramework.test('проверка простых чисел', () {
+      TestFramework.expectTrue(calculator.isPrime(2));
+      TestFramework.expectTrue(calculator.isPrime(13));
+      TestFramework.expectFalse(calculator.isPrime(4));
+      TestFramework.expectFalse(calculator.isPrime(1));
+    });
+    
+    TestFramework.test('последовательность Фибоначчи', () {
+      TestFramework.expectListEquals(calculator.fibonacci(0), <int>[]);
+      TestFramework.expectListEquals(calculator.fibonacci(1), [0]);
+      TestFramework.expectListEquals(calculator.fibonacci(5), [0, 1, 1, 2, 3]);
+      TestFramework.expectListEquals(calculator.fibonacci(8), [0, 1, 1, 2, 3, 5, 8, 13]);
+    });
+  });
+  
+  TestFramework.showResults();
+}
\ No newline at end of file
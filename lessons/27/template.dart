@@ -0,0 +1,50 @@
+// Главная функция приложения
+void main() {
+  // TODO: Запустить Flutter приложение
+  print('Flutter приложение запускается...');
+  runApp();
+}
+
+// Корневой виджет приложения
+class MyApp {
+  // TODO: Создать StatelessWidget
+  String buildApp() {
+    return 'MaterialApp создан';
+  }
+}
+
+// Главная страница
+class HomePage {
+  // TODO: Создать виджет для домашней страницы
+  String buildHomePage() {
+    return 'Главная страница создана';
+  }
+}
+
+// Виджет приветствия
+class WelcomeWidget {
+  String name;
+  
+  WelcomeWidget(this.name);
+  
+  // TODO: Создать виджет приветствия
+  String buildWelcome() {
+    return 'Добро пожаловать, $name!';
+  }
+}
+
+// Симуляция запуска приложения
+void runApp() {
+  print('Создание приложения...');
+  
+  MyApp app = MyApp();
+  print(app.buildApp());
+  
+  HomePage home = HomePage();
+  print(home.buildHomePage());
+  
+  WelcomeWidget welcome = WelcomeWidget('Flutter Developer');
+  print(welcome.buildWelcome());
+  
+  print('Flutter приложение готово!');
+}
\ No newline at end of file
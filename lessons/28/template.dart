@@ -0,0 +1,69 @@
+// Статический виджет - контейнер с текстом
+class TextContainer {
+  String text;
+  String color;
+  
+  TextContainer(this.text, this.color);
+  
+  String build() {
+    return 'Container(color: $color, child: Text("$text"))';
+  }
+}
+
+// Виджет кнопки
+class CustomButton {
+  String label;
+  Function onPressed;
+  
+  CustomButton(this.label, this.onPressed);
+  
+  String build() {
+    return 'ElevatedButton(child: Text("$label"))';
+  }
+  
+  void press() {
+    print('Кнопка "$label" нажата');
+    onPressed();
+  }
+}
+
+// Виджет счетчика с состоянием
+class CounterWidget {
+  int _counter = 0;
+  
+  // TODO: Реализовать методы для работы со счетчиком
+  String build() {
+    return 'Column(children: [Text("Счетчик: $_counter"), Button("Увеличить")])';
+  }
+  
+  void increment() {
+    // TODO: Увеличить счетчик и обновить состояние
+  }
+  
+  void updateState() {
+    print('Состояние обновлено: счетчик = $_counter');
+  }
+}
+
+void main() {
+  print('Создание Flutter виджетов...');
+  
+  // Создание статических виджетов
+  TextContainer container = TextContainer('Привет, Flutter!', 'синий');
+  print(container.build());
+  
+  // Создание кнопки
+  CustomButton button = CustomButton('Нажми меня', () {
+    print('Действие кнопки выполнено!');
+  });
+  print(button.build());
+  button.press();
+  
+  // Создание счетчика
+  CounterWidget counter = CounterWidget();
+  print(counter.build());
+  
+  // TODO: Вызвать increment() несколько раз
+  
+  print('Все виджеты созданы!');
+}
\ No newline at end of file
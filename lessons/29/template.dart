@@ -0,0 +1,93 @@
+// Вертикальный макет
+class VerticalLayout {
+  List<String> items;
+  
+  VerticalLayout(this.items);
+  
+  String build() {
+    String children = items.join(', ');
+    return 'Column(children: [$children])';
+  }
+}
+
+// Горизонтальный макет
+class HorizontalLayout {
+  List<String> items;
+  String alignment;
+  
+  HorizontalLayout(this.items, this.alignment);
+  
+  String build() {
+    String children = items.join(', ');
+    return 'Row(mainAxisAlignment: $alignment, children: [$children])';
+  }
+}
+
+// Слоеный макет
+class StackLayout {
+  List<Map<String, dynamic>> layers;
+  
+  StackLayout(this.layers);
+  
+  String build() {
+    String children = '';
+    for (var layer in layers) {
+      if (layer['positioned']) {
+        children += 'Positioned(top: ${layer['top']}, left: ${layer['left']}, child: ${layer['widget']}), ';
+      } else {
+        children += '${layer['widget']}, ';
+      }
+    }
+    return 'Stack(children: [$children])';
+  }
+}
+
+// Гибкий макет с Expanded
+class FlexLayout {
+  List<Map<String, dynamic>> items;
+  
+  FlexLayout(this.items);
+  
+  String build() {
+    String children = '';
+    for (var item in items) {
+      if (item['flex'] != null) {
+        children += 'Expanded(flex: ${item['flex']}, child: ${item['widget']}), ';
+      } else {
+        children += '${item['widget']}, ';
+      }
+    }
+    return 'Column(children: [$children])';
+  }
+}
+
+void main() {
+  print('Создание макетов Flutter...');
+  
+  // Вертикальный макет
+  VerticalLayout vertical = VerticalLayout(['Text("Заголовок")', 'Text("Описание")', 'Button("Действие")']);
+  print('Вертикальный макет: ${vertical.build()}');
+  
+  // Горизонтальный макет
+  HorizontalLayout horizontal = HorizontalLayout(['Icon(star)', 'Text("4.5")', 'Text("(123 отзыва)")'], 'spaceAround');
+  print('Горизонтальный макет: ${horizontal.build()}');
+  
+  // TODO: Создать слоеный макет с фоном и текстом поверх
+  List<Map<String, dynamic>> stackLayers = [
+    {'widget': 'Container(color: blue)', 'positioned': false},
+    {'widget': 'Text("Overlay")', 'positioned': true, 'top': 20, 'left': 20}
+  ];
+  StackLayout stack = StackLayout(stackLayers);
+  print('Слоеный макет: ${stack.build()}');
+  
+  // TODO: Создать гибкий макет с разными flex значениями
+  List<Map<String, dynamic>> flexItems = [
+    {'widget': 'Container("Header")', 'flex': 1},
+    {'widget': 'Container("Content")', 'flex': 3},
+    {'widget': 'Container("Footer")', 'flex': 1}
+  ];
+  FlexLayout flex = FlexLayout(flexItems);
+  print('Гибкий макет: ${flex.build()}');
+  
+  print('Все макеты созданы!');
+}
\ No newline at end of file
@@ -0,0 +1,120 @@
+// Модель пользователя
+class User {
+  String name;
+  String email;
+  int age;
+  bool isSubscribed;
+  
+  User({required this.name, required this.email, required this.age, this.isSubscribed = false});
+  
+  @override
+  String toString() {
+    return 'User{name: $name, email: $email, age: $age, subscribed: $isSubscribed}';
+  }
+}
+
+// Контроллер формы
+class FormController {
+  String _name = '';
+  String _email = '';
+  int _age = 0;
+  bool _isSubscribed = false;
+  
+  // TODO: Реализовать геттеры и сеттеры
+  String get name => _name;
+  String get email => _email;
+  int get age => _age;
+  bool get isSubscribed => _isSubscribed;
+  
+  void setName(String name) {
+    // TODO: Обновить имя и вызвать setState
+  }
+  
+  void setEmail(String email) {
+    // TODO: Обновить email
+  }
+  
+  void setAge(int age) {
+    // TODO: Обновить возраст
+  }
+  
+  void toggleSubscription() {
+    // TODO: Переключить подписку
+  }
+  
+  bool validate() {
+    // TODO: Валидация формы
+    return _name.isNotEmpty && _email.contains('@') && _age >= 18;
+  }
+  
+  User createUser() {
+    return User(name: _name, email: _email, age: _age, isSubscribed: _isSubscribed);
+  }
+}
+
+// Виджет формы регистрации
+class RegistrationForm {
+  FormController controller = FormController();
+  
+  String build() {
+    return """
+Form(
+  children: [
+    TextFormField(hint: "Имя", value: "${controller.name}"),
+    TextFormField(hint: "Email", value: "${controller.email}"),
+    TextFormField(hint: "Возраст", value: "${controller.age}"),
+    Checkbox(value: ${controller.isSubscribed}, label: "Подписка на новости"),
+    ElevatedButton(text: "Зарегистрироваться")
+  ]
+)""";
+  }
+  
+  void onNameChanged(String value) {
+    controller.setName(value);
+    print('Состояние обновлено: имя = $value');
+  }
+  
+  void onEmailChanged(String value) {
+    controller.setEmail(value);
+    print('Состояние обновлено: email = $value');
+  }
+  
+  void onAgeChanged(int value) {
+    controller.setAge(value);
+    print('Состояние обновлено: возраст = $value');
+  }
+  
+  void onSubscriptionToggled() {
+    controller.toggleSubscription();
+    print('Состояние обновлено: подписка = ${controller.isSubscribed}');
+  }
+  
+  void onSubmit() {
+    if (controller.validate()) {
+      User user = controller.createUser();
+      print('Пользователь зарегистрирован: $user');
+    } else {
+      print('Ошибка: форма заполнена некорректно');
+    }
+  }
+}
+
+void main() {
+  print('Создание формы регистрации...');
+  
+  RegistrationForm form = RegistrationForm();
+  print(form.build());
+  
+  // Симуляция ввода данных
+  print('\nЗаполнение формы:');
+  form.onNameChanged('Алексей');
+  form.onEmailChanged('alexey@example.com');
+  form.onAgeChanged(25);
+  form.onSubscriptionToggled();
+  
+  print('\nОтправка формы:');
+  form.onSubmit();
+  
+  print('\nОбновленная форма:');
+  print(form.build());
+}
\ No newline at end of file
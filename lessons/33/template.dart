@@ -0,0 +1,184 @@
+// Модель данных пользователя
+class UserProfile {
+  String name;
+  String email;
+  int age;
+  
+  UserProfile({required this.name, required this.email, required this.age});
+  
+  @override
+  String toString() => 'UserProfile{name: $name, email: $email, age: $age}';
+}
+
+// Главный экран
+class HomeScreen {
+  String title = 'Главная страница';
+  
+  String build() {
+    return """
+Scaffold(
+  appBar: AppBar(title: Text("$title")),
+  body: Column(children: [
+    Text("Добро пожаловать!"),
+    ElevatedButton(text: "Профиль"),
+    ElevatedButton(text: "Настройки"),
+    ElevatedButton(text: "О программе")
+  ])
+)""";
+  }
+  
+  void navigateToProfile(UserProfile user) {
+    print('Навигация: Главная → Профиль (данные: $user)');
+  }
+  
+  void navigateToSettings() {
+    print('Навигация: Главная → Настройки');
+  }
+  
+  void navigateToAbout() {
+    print('Навигация: Главная → О программе');
+  }
+}
+
+// Экран профиля
+class ProfileScreen {
+  UserProfile? user;
+  String title = 'Профиль пользователя';
+  
+  ProfileScreen({this.user});
+  
+  String build() {
+    String userInfo = user != null ? 
+      'Имя: ${user!.name}, Email: ${user!.email}, Возраст: ${user!.age}' : 
+      'Данные пользователя не загружены';
+      
+    return """
+Scaffold(
+  appBar: AppBar(title: Text("$title")),
+  body: Column(children: [
+    Text("$userInfo"),
+    ElevatedButton(text: "Редактировать"),
+    ElevatedButton(text: "Назад")
+  ])
+)""";
+  }
+  
+  void navigateToEdit() {
+    print('Навигация: Профиль → Редактирование');
+  }
+  
+  UserProfile navigateBack() {
+    print('Навигация: Профиль → Главная (возврат данных)');
+    return user ?? UserProfile(name: 'Unknown', email: '', age: 0);
+  }
+}
+
+// Экран настроек
+class SettingsScreen {
+  String title = 'Настройки';
+  Map<String, bool> settings = {
+    'notifications': true,
+    'darkTheme': false,
+    'autoSync': true
+  };
+  
+  String build() {
+    return """
+Scaffold(
+  appBar: AppBar(title: Text("$title")),
+  body: Column(children: [
+    SwitchListTile(title: "Уведомления", value: ${settings['notifications']}),
+    SwitchListTile(title: "Темная тема", value: ${settings['darkTheme']}),
+    SwitchListTile(title: "Автосинхронизация", value: ${settings['autoSync']}),
+    ElevatedButton(text: "Сохранить"),
+    ElevatedButton(text: "Назад")
+  ])
+)""";
+  }
+  
+  void toggleSetting(String key) {
+    settings[key] = !settings[key]!;
+    print('Настройка "$key" изменена на ${settings[key]}');
+  }
+  
+  void save() {
+    print('Настройки сохранены: $settings');
+  }
+}
+
+// Навигатор приложения
+class AppNavigator {
+  String currentScreen = 'home';
+  HomeScreen homeScreen = HomeScreen();
+  ProfileScreen? profileScreen;
+  SettingsScreen settingsScreen = SettingsScreen();
+  
+  void navigateTo(String screenName, {dynamic data}) {
+    String previousScreen = currentScreen;
+    currentScreen = screenName;
+    
+    switch (screenName) {
+      case 'profile':
+        profileScreen = ProfileScreen(user: data as UserProfile?);
+        print('Navigator: push ProfileScreen');
+        break;
+      case 'settings':
+        print('Navigator: push SettingsScreen');
+        break;
+      case 'home':
+        print('Navigator: pop to HomeScreen');
+        break;
+    }
+    
+    print('Переход: $previousScreen → $currentScreen');
+    printCurrentScreen();
+  }
+  
+  void pop({dynamic result}) {
+    print('Navigator: pop with result: $result');
+    navigateTo('home');
+  }
+  
+  void printCurrentScreen() {
+    switch (currentScreen) {
+      case 'home':
+        print(homeScreen.build());
+        break;
+      case 'profile':
+        print(profileScreen?.build() ?? 'ProfileScreen not initialized');
+        break;
+      case 'settings':
+        print(settingsScreen.build());
+        break;
+    }
+  }
+}
+
+void main() {
+  print('Создание системы навигации Flutter...');
+  
+  AppNavigator navigator = AppNavigator();
+  UserProfile user = UserProfile(name: 'Иван Петров', email: 'ivan@example.com', age: 28);
+  
+  // Показать главный экран
+  print('\n=== ГЛАВНЫЙ ЭКРАН ===');
+  navigator.printCurrentScreen();
+  
+  // Переход к профилю с данными
+  print('\n=== ПЕРЕХОД К ПРОФИЛЮ ===');
+  navigator.navigateTo('profile', data: user);
+  
+  // Переход к настройкам
+  print('\n=== ПЕРЕХОД К НАСТРОЙКАМ ===');
+  navigator.navigateTo('settings');
+  
+  // Изменение настройки
+  navigator.settingsScreen.toggleSetting('darkTheme');
+  navigator.settingsScreen.save();
+  
+  // Возврат на главную
+  print('\n=== ВОЗВРАТ НА ГЛАВНУЮ ===');
+  navigator.pop(result: navigator.settingsScreen.settings);
+  
+  print('\nСистема навигации готова!');
+}
\ No newline at end of file
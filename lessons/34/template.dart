@@ -0,0 +1,91 @@
+import 'dart:async';
+
+// Модель сообщения
+class Message {
+  final String user;
+  final String text;
+  final DateTime timestamp;
+  
+  Message(this.user, this.text) : timestamp = DateTime.now();
+  
+  @override
+  String toString() => '[$user] $text (${timestamp.hour}:${timestamp.minute})';
+}
+
+// Система чата
+class ChatSystem {
+  final StreamController<Message> _messageController = StreamController.broadcast();
+  final List<String> _users = [];
+  
+  // Поток сообщений
+  Stream<Message> get messages => _messageController.stream;
+  
+  // Подключение пользователя
+  void connectUser(String username) {
+    if (!_users.contains(username)) {
+      _users.add(username);
+      _addSystemMessage('$username присоединился к чату');
+    }
+  }
+  
+  // Отправка сообщения
+  void sendMessage(String user, String text) {
+    if (_users.contains(user)) {
+      _messageController.add(Message(user, text));
+    }
+  }
+  
+  // Системное сообщение
+  void _addSystemMessage(String text) {
+    _messageController.add(Message('Система', text));
+  }
+  
+  // Отключение пользователя
+  void disconnectUser(String username) {
+    _users.remove(username);
+    _addSystemMessage('$username покинул чат');
+  }
+  
+  void dispose() {
+    _messageController.close();
+  }
+}
+
+void main() async {
+  print('=== СИСТЕМА ЧАТА НА STREAMS ===\n');
+  
+  final chat = ChatSystem();
+  
+  // Подписка на сообщения с фильтрацией
+  final subscription = chat.messages
+    .where((msg) => msg.text.isNotEmpty)
+    .listen((message) {
+      print('📨 $message');
+    });
+  
+  // Симуляция работы чата
+  chat.connectUser('Алиса');
+  chat.connectUser('Боб');
+  
+  chat.sendMessage('Алиса', 'Привет всем!');
+  
+  // Добавляем задержки для демонстрации
+  await Future.delayed(Duration(milliseconds: 100));
+  chat.sendMessage('Боб', 'Привет, Алиса!');
+  
+  await Future.delayed(Duration(milliseconds: 100));
+  chat.sendMessage('Алиса', 'Как дела?');
+  
+  await Future.delayed(Duration(milliseconds: 100));
+  chat.disconnectUser('Боб');
+  
+  await Future.delayed(Duration(milliseconds: 100));
+  chat.sendMessage('Алиса', 'Боб ушел...');
+  
+  // Очистка ресурсов
+  await Future.delayed(Duration(milliseconds: 200));
+  subscription.cancel();
+  chat.dispose();
+  
+  print('\n✨ Чат завершен');
+}
\ No newline at end of file
@@ -0,0 +1,141 @@
+import 'dart:isolate';
+import 'dart:math';
+
+// Задача для обработки в isolate
+class ProcessingTask {
+  final List<int> data;
+  final String taskId;
+  
+  ProcessingTask(this.data, this.taskId);
+}
+
+// Результат обработки
+class ProcessingResult {
+  final String taskId;
+  final int sum;
+  final double average;
+  final int max;
+  final int min;
+  
+  ProcessingResult(this.taskId, this.sum, this.average, this.max, this.min);
+  
+  @override
+  String toString() => 'Task $taskId: sum=$sum, avg=${average.toStringAsFixed(2)}, max=$max, min=$min';
+}
+
+// Функция для isolate - обработка данных
+void dataProcessor(SendPort sendPort) {
+  final receivePort = ReceivePort();
+  sendPort.send(receivePort.sendPort);
+  
+  receivePort.listen((message) {
+    if (message is ProcessingTask) {
+      // Симуляция тяжелой обработки
+      final data = message.data;
+      
+      // Вычисления
+      int sum = data.reduce((a, b) => a + b);
+      double average = sum / data.length;
+      int max = data.reduce((a, b) => a > b ? a : b);
+      int min = data.reduce((a, b) => a < b ? a : b);
+      
+      // Искусственная задержка для демонстрации
+      for (int i = 0; i < 1000000; i++) {
+        math.sqrt(i);
+      }
+      
+      final result = ProcessingResult(message.taskId, sum, average, max, min);
+      sendPort.send(result);
+    }
+  });
+}
+
+// Менеджер параллельной обработки
+class ParallelProcessor {
+  final List<Isolate> _isolates = [];
+  final List<ReceivePort> _receivePorts = [];
+  final List<SendPort> _sendPorts = [];
+  
+  // Инициализация isolates
+  Future<void> initialize(int isolateCount) async {
+    print('🚀 Создание $isolateCount isolates...');
+    
+    for (int i = 0; i < isolateCount; i++) {
+      final receivePort = ReceivePort();
+      final isolate = await Isolate.spawn(dataProcessor, receivePort.sendPort);
+      
+      final sendPort = await receivePort.first as SendPort;
+      
+      _isolates.add(isolate);
+      _receivePorts.add(receivePort);
+      _sendPorts.add(sendPort);
+      
+      print('✅ Isolate ${i + 1} готов');
+    }
+  }
+  
+  // Обработка задач параллельно
+  Future<List<ProcessingResult>> processTasks(List<ProcessingTask> tasks) async {
+    print('\n📊 Обработка ${tasks.length} задач...');
+    
+    final futures = <Future<ProcessingResult>>[];
+    
+    for (int i = 0; i < tasks.length; i++) {
+      final isolateIndex = i % _sendPorts.length;
+      final sendPort = _sendPorts[isolateIndex];
+      final receivePort = _receivePorts[isolateIndex];
+      
+      sendPort.send(tasks[i]);
+      futures.add(receivePort.first.then((result) => result as ProcessingResult));
+    }
+    
+    return await Future.wait(futures);
+  }
+  
+  // Очистка ресурсов
+  void dispose() {
+    for (final isolate in _isolates) {
+      isolate.kill(priority: Isolate.immediate);
+    }
+    for (final port in _receivePorts) {
+      port.close();
+    }
+    _isolates.clear();
+    _receivePorts.clear();
+    _sendPorts.clear();
+  }
+}
+
+void main() async {
+  print('=== ПАРАЛЛЕЛЬНАЯ ОБРАБОТКА ДАННЫХ ===');
+  
+  final processor = ParallelProcessor();
+  await processor.initialize(3); // 3 isolate
+  
+  // Создаем тестовые данные
+  final tasks = <ProcessingTask>[];
+  final random = Random();
+  
+  for (int i = 1; i <= 6; i++) {
+    final data = List.generate(1000, (_) => random.nextInt(1000));
+    tasks.add(ProcessingTask(data, 'T$i'));
+  }
+  
+  final stopwatch = Stopwatch()..start();
+  
+  // Параллельная обработка
+  final results = await processor.processTasks(tasks);
+  
+  stopwatch.stop();
+  
+  print('\n📈 РЕЗУЛЬТАТЫ:');
+  for (final result in results) {
+    print('  $result');
+  }
+  
+  print('\n⏱️ Время выполнения: ${stopwatch.elapsedMilliseconds}ms');
+  print('🧮 Обработано ${results.length} задач параллельно');
+  
+  processor.dispose();
+  print('\n✨ Все isolates завершены');
+}
\ No newline at end of file
@@ -0,0 +1,221 @@
+// Создаем пакет для работы с валютами
+// lib/currency_converter.dart
+
+/// Пакет для конвертации валют
+library currency_converter;
+
+import 'dart:math';
+
+/// Класс валюты
+class Currency {
+  final String code;
+  final String symbol;
+  final String name;
+  
+  const Currency(this.code, this.symbol, this.name);
+  
+  @override
+  String toString() => '$name ($code)';
+  
+  @override
+  bool operator ==(Object other) =>
+      identical(this, other) ||
+      other is Currency && code == other.code;
+  
+  @override
+  int get hashCode => code.hashCode;
+}
+
+/// Предопределенные валюты
+class Currencies {
+  static const Currency usd = Currency('USD', r'$', 'US Dollar');
+  static const Currency eur = Currency('EUR', '€', 'Euro');
+  static const Currency rub = Currency('RUB', '₽', 'Russian Ruble');
+  static const Currency jpy = Currency('JPY', '¥', 'Japanese Yen');
+  static const Currency gbp = Currency('GBP', '£', 'British Pound');
+  
+  static const List<Currency> all = [usd, eur, rub, jpy, gbp];
+}
+
+/// Сумма в определенной валюте
+class Money {
+  final double amount;
+  final Currency currency;
+  
+  const Money(this.amount, this.currency);
+  
+  /// Форматированный вывод
+  String get formatted => '${currency.symbol}${amount.toStringAsFixed(2)}';
+  
+  @override
+  String toString() => '$formatted ${currency.code}';
+  
+  /// Операции с деньгами в одной валюте
+  Money operator +(Money other) {
+    if (currency != other.currency) {
+      throw ArgumentError('Нельзя складывать разные валюты напрямую');
+    }
+    return Money(amount + other.amount, currency);
+  }
+  
+  Money operator -(Money other) {
+    if (currency != other.currency) {
+      throw ArgumentError('Нельзя вычитать разные валюты напрямую');
+    }
+    return Money(amount - other.amount, currency);
+  }
+  
+  Money operator *(double multiplier) => Money(amount * multiplier, currency);
+  Money operator /(double divisor) => Money(amount / divisor, currency);
+}
+
+/// Конвертер валют
+class CurrencyConverter {
+  final Map<String, double> _rates = {};
+  Currency _baseCurrency = Currencies.usd;
+  
+  CurrencyConverter() {
+    _initializeRates();
+  }
+  
+  /// Инициализация курсов (симуляция)
+  void _initializeRates() {
+    final random = Random();
+    _rates['USD'] = 1.0; // базовая валюта
+    _rates['EUR'] = 0.85 + random.nextDouble() * 0.1;
+    _rates['RUB'] = 75.0 + random.nextDouble() * 10;
+    _rates['JPY'] = 110.0 + random.nextDouble() * 20;
+    _rates['GBP'] = 0.73 + random.nextDouble() * 0.1;
+  }
+  
+  /// Получить курс валюты
+  double getRate(Currency currency) {
+    return _rates[currency.code] ?? 1.0;
+  }
+  
+  /// Конвертация между валютами
+  Money convert(Money money, Currency targetCurrency) {
+    if (money.currency == targetCurrency) return money;
+    
+    // Конвертируем через базовую валюту
+    final fromRate = getRate(money.currency);
+    final toRate = getRate(targetCurrency);
+    
+    final baseAmount = money.amount / fromRate;
+    final targetAmount = baseAmount * toRate;
+    
+    return Money(targetAmount, targetCurrency);
+  }
+  
+  /// Обновление курса валюты
+  void updateRate(Currency currency, double rate) {
+    _rates[currency.code] = rate;
+  }
+  
+  /// Получить все доступные курсы
+  Map<Currency, double> getAllRates() {
+    final rates = <Currency, double>{};
+    for (final currency in Currencies.all) {
+      rates[currency] = getRate(currency);
+    }
+    return rates;
+  }
+}
+
+/// Портфель валют
+class CurrencyPortfolio {
+  final Map<Currency, double> _holdings = {};
+  final CurrencyConverter _converter;
+  
+  CurrencyPortfolio(this._converter);
+  
+  /// Добавить валюту в портфель
+  void addMoney(Money money) {
+    _holdings[money.currency] = (_holdings[money.currency] ?? 0) + money.amount;
+  }
+  
+  /// Получить баланс в конкретной валюте
+  Money getBalance(Currency currency) {
+    return Money(_holdings[currency] ?? 0, currency);
+  }
+  
+  /// Общая стоимость портфеля в базовой валюте
+  Money getTotalValue(Currency targetCurrency) {
+    double totalValue = 0;
+    
+    for (final entry in _holdings.entries) {
+      final money = Money(entry.value, entry.key);
+      final converted = _converter.convert(money, targetCurrency);
+      totalValue += converted.amount;
+    }
+    
+    return Money(totalValue, targetCurrency);
+  }
+  
+  /// Получить все активы
+  List<Money> getAllHoldings() {
+    return _holdings.entries
+        .where((entry) => entry.value > 0)
+        .map((entry) => Money(entry.value, entry.key))
+        .toList();
+  }
+}
+
+void main() {
+  print('=== СИСТЕМА КОНВЕРТАЦИИ ВАЛЮТ ===\n');
+  
+  final converter = CurrencyConverter();
+  final portfolio = CurrencyPortfolio(converter);
+  
+  // Демонстрация работы с валютами
+  print('💰 Доступные валюты:');
+  for (final currency in Currencies.all) {
+    final rate = converter.getRate(currency);
+    print('  ${currency.toString().padRight(20)} Курс: ${rate.toStringAsFixed(4)}');
+  }
+  
+  print('\n🔄 Конвертация валют:');
+  final money1 = Money(100, Currencies.usd);
+  final money2 = converter.convert(money1, Currencies.eur);
+  final money3 = converter.convert(money1, Currencies.rub);
+  
+  print('  $money1');
+  print('  ↓');
+  print('  $money2');
+  print('  $money3');
+  
+  // Работа с портфелем
+  print('\n📊 Портфель валют:');
+  portfolio.addMoney(Money(1000, Currencies.usd));
+  portfolio.addMoney(Money(500, Currencies.eur));
+  portfolio.addMoney(Money(50000, Currencies.rub));
+  portfolio.addMoney(Money(10000, Currencies.jpy));
+  
+  final holdings = portfolio.getAllHoldings();
+  for (final money in holdings) {
+    print('  ${money.toString().padRight(25)} (${money.currency.name})');
+  }
+  
+  final totalInUsd = portfolio.getTotalValue(Currencies.usd);
+  final totalInEur = portfolio.getTotalValue(Currencies.eur);
+  
+  print('\n💼 Общая стоимость портфеля:');
+  print('  В долларах: $totalInUsd');
+  print('  В евро: $totalInEur');
+  
+  // Математические операции
+  print('\n🧮 Операции с деньгами:');
+  final salary = Money(5000, Currencies.usd);
+  final bonus = Money(1000, Currencies.usd);
+  final total = salary + bonus;
+  final tax = total * 0.13; // 13% налог
+  final netIncome = total - tax;
+  
+  print('  Зарплата: $salary');
+  print('  Бонус: $bonus');
+  print('  Всего: $total');
+  print('  Налог (13%): $tax');
+  print('  К получению: $netIncome');
+  
+  print('\n✨ Демонстрация пакета завершена');
+}
\ No newline at end of file
@@ -1,7 +1,7 @@
 // Основные функции приложения
 
-// Функция для выполнения Dart кода
-async function runDartCode(code, outputElementId) {
+// Функция для выполнения Dart кода (lessonId - для статистики по урокам)
+async function runDartCode(code, outputElementId, lessonId = null) {
     const outputEl = document.getElementById(outputElementId);
     const loadingEl = document.getElementById('loading');
     
@@ -14,15 +14,35 @@ async function runDartCode(code, outputElementId) {
     outputEl.innerHTML = '<div class="output-info">Выполнение кода...</div>';
     
     try {
-        const response = await fetch('/api/execute_dart', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({ code: code })
-        });
+        const job = await submitDartJob(code, lessonId);
+        let result = job;
         
-        const result = await response.json();
+        if (job.status === 'done') {
+            // Сервер успел выполнить код, пока принимал задание
+        } else if (job.stream_url && window.EventSource) {
+            // Показываем вывод построчно, пока программа выполняется
+            let liveEl = null;
+            result = await streamDartJob(job, (stream, line) => {
+                if (!liveEl) {
+                    // Первая строка пришла - убираем заставку, чтобы вывод был виден
+                    if (loadingEl) {
+                        loadingEl.style.display = 'none';
+                    }
+                    outputEl.innerHTML = '';
+                    liveEl = document.createElement('div');
+                    liveEl.className = 'output-success';
+                    outputEl.appendChild(liveEl);
+                }
+                const lineEl = document.createElement('span');
+                if (stream === 'stderr') {
+                    lineEl.className = 'output-warning';
+                }
+                lineEl.textContent = line + '\n';
+                liveEl.appendChild(lineEl);
+            });
+        } else if (job.job_id) {
+            result = await pollDartJob(job);
+        }
         
         if (result.success) {
             if (result.output) {
@@ -34,8 +54,16 @@ async function runDartCode(code, outputElementId) {
             if (result.error) {
                 outputEl.innerHTML += `<div class="output-warning">Предупреждения:\n${escapeHtml(result.error)}</div>`;
             }
+            
+            if (result.grade && lessonId !== null) {
+                showGrade(result, outputEl, lessonId);
+            }
         } else {
-            outputEl.innerHTML = `<div class="output-error">Ошибка:\n${escapeHtml(result.error)}</div>`;
+            // Вывод, полученный до остановки программы (таймаут, лимиты)
+            outputEl.innerHTML = result.output
+                ? `<div class="output-success">${escapeHtml(result.output)}</div>`
+                : '';
+            outputEl.innerHTML += `<div class="output-error">Ошибка:\n${escapeHtml(result.error)}</div>`;
         }
         
     } catch (error) {
@@ -48,6 +76,111 @@ async function runDartCode(code, outputElementId) {
     }
 }
 
+// Время, до которого сервер просил не присылать новые запуски (Retry-After)
+let executionBlockedUntil = 0;
+
+// Отправляет код на url. Если сервер не принял запуск из-за лимита (429),
+// запоминает Retry-After и возвращает готовый результат с ошибкой
+async function postDartCode(url, code, lessonId) {
+    const waitSeconds = Math.ceil((executionBlockedUntil - Date.now()) / 1000);
+    if (waitSeconds > 0) {
+        return {
+            success: false,
+            error: `Слишком много запусков подряд, подождите немного (через ${waitSeconds} с)`
+        };
+    }
+    
+    const response = await fetch(url, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ code: code, lesson_id: lessonId })
+    });
+    
+    const data = await response.json();
+    
+    if (response.status === 429) {
+        const retryAfter = parseInt(response.headers.get('Retry-After') || data.retry_after || 1, 10);
+        executionBlockedUntil = Date.now() + retryAfter * 1000;
+        return {
+            success: false,
+            error: `${data.error} (через ${retryAfter} с)`
+        };
+    }
+    return data;
+}
+
+// Ставит код в очередь выполнения. Возвращает задание (со status 'done' и
+// результатом, если сервер выполнил код сразу) или, если код не принят
+// (ошибка проверки, лимит запусков, переполненная очередь), результат с ошибкой. Задание помнит код, чтобы при необходимости выполнить
+// его синхронно (см. pollDartJob)
+async function submitDartJob(code, lessonId = null) {
+    const job = await postDartCode('/api/jobs', code, lessonId);
+    if (job.job_id) {
+        job.fallback = () => postDartCode('/api/execute_dart', code, lessonId);
+    }
+    return job;
+}
+
+// Сколько раз подряд задание может "не найтись", прежде чем код выполняется
+// синхронно: задания хранятся в памяти процесса сервера, и при нескольких
+// процессах запрос статуса может попасть не в тот, где стоит задание
+const JOB_NOT_FOUND_RETRIES = 3;
+
+// Сколько всего ждать результата задания: если исполнители сервера не
+// работают (например, uWSGI без потоков), ответа не будет никогда
+const JOB_POLL_DEADLINE_MS = 60000;
+
+// Опрашивает статус задания, постепенно увеличивая интервал
+async function pollDartJob(job) {
+    const deadline = Date.now() + JOB_POLL_DEADLINE_MS;
+    let delay = 150;
+    let misses = 0;
+    while (Date.now() + delay < deadline) {
+        await new Promise(resolve => setTimeout(resolve, delay));
+        const response = await fetch(job.status_url);
+        const status = await response.json();
+        if (status.status === 'done') {
+            return status;
+        }
+        if (response.status === 404) {
+            misses++;
+            if (misses > JOB_NOT_FOUND_RETRIES) {
+                return job.fallback ? job.fallback() : status;
+            }
+        } else {
+            misses = 0;
+        }
+        delay = Math.min(delay * 1.5, 1000);
+    }
+    return {
+        success: false,
+        error: `Сервер не выполнил программу за ${JOB_POLL_DEADLINE_MS / 1000} с, попробуйте еще раз позже`
+    };
+}
+
+// Получает вывод задания через Server-Sent Events: onLine(stream, line)
+// вызывается для каждой строки, промис возвращает итоговый результат. Сервер
+// дает stream_url, только если потоковый вывод включен; при обрыве или 404
+// результат забирается опросом
+function streamDartJob(job, onLine) {
+    return new Promise((resolve, reject) => {
+        const source = new EventSource(job.stream_url);
+        source.addEventListener('stdout', event => onLine('stdout', JSON.parse(event.data)));
+        source.addEventListener('stderr', event => onLine('stderr', JSON.parse(event.data)));
+        source.addEventListener('done', event => {
+            source.close();
+            resolve(JSON.parse(event.data));
+        });
+        source.onerror = () => {
+            // Соединение оборвалось - дожидаемся результата обычным опросом
+            source.close();
+            pollDartJob(job).then(resolve, reject);
+        };
+    });
+}
+
 // Функция для экранирования HTML
 function escapeHtml(text) {
     const div = document.createElement('div');
@@ -74,8 +207,8 @@ function loadCodeFromStorage(lessonId) {
     return localStorage.getItem(key);
 }
 
-// Функция для отслеживания прогресса
-function trackProgress(lessonId, completed = false) {
+// Функция для отслеживания прогресса (syncServer = false, если сервер уже все записал)
+function trackProgress(lessonId, completed = false, syncServer = true) {
     // Сохраняем прогресс в localStorage как резервную копию
     if (typeof localStorage !== 'undefined') {
         const progressKey = 'lesson_progress';
@@ -99,7 +232,9 @@ function trackProgress(lessonId, completed = false) {
     }
     
     // Отправляем прогресс на сервер
-    saveProgressToServer(lessonId, completed);
+    if (syncServer) {
+        saveProgressToServer(lessonId, completed);
+    }
     
     updateProgressUI();
 }
@@ -212,15 +347,29 @@ function updateProgressElements(serverProgress) {
     });
 }
 
-// Функция для проверки правильности кода
-function checkCodeCorrectness(output, expectedOutput) {
-    if (!expectedOutput) return true;
-    
-    // Простая проверка соответствия вывода
-    const cleanOutput = output.trim().replace(/\s+/g, ' ');
-    const cleanExpected = expectedOutput.trim().replace(/\s+/g, ' ');
+// Показывает вердикт проверки решения. Сервер сравнивает вывод с ожидаемым
+// и сам отмечает урок пройденным в том же запросе, что и запуск
+function showGrade(result, outputEl, lessonId) {
+    const grade = result.grade;
+    if (grade.passed) {
+        outputEl.innerHTML += '<div class="output-success">✅ Задание выполнено!</div>';
+        trackProgress(lessonId, true, false);
+        const achievements = result.new_achievements || [];
+        if (achievements.length) {
+            showHint(`${achievements[0].icon} Новое достижение: ${achievements[0].name}`, 'success');
+        } else {
+            showHint('Урок пройден!', 'success');
+        }
+        return;
+    }
     
-    return cleanOutput === cleanExpected;
+    const mismatch = grade.mismatch;
+    if (mismatch) {
+        let text = `Вывод не совпадает с ожидаемым (строка ${mismatch.line})`;
+        text += `\nОжидалось: ${mismatch.expected !== null ? mismatch.expected : '(ничего)'}`;
+        text += `\nПолучено: ${mismatch.actual !== null ? mismatch.actual : '(ничего)'}`;
+        outputEl.innerHTML += `<div class="output-warning">${escapeHtml(text)}</div>`;
+    }
 }
 
 // Функция для показа подсказок
@@ -0,0 +1,27 @@
+"""Ключ кеша результатов: одинаков только для программ с одинаковым выводом.
+
+Запуск: python -m pytest tests (или python -m unittest discover tests)
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execution.cache import source_hash  # noqa: E402
+
+
+class SourceHashTest(unittest.TestCase):
+    def test_line_endings_do_not_matter(self):
+        code = "void main() {\n  print('a');\n}\n"
+        self.assertEqual(source_hash(code), source_hash(code.replace('\n', '\r\n')))
+        self.assertEqual(source_hash(code), source_hash(code.rstrip() + '\n\n  '))
+
+    def test_trailing_spaces_in_multiline_string(self):
+        code = "void main() {\n  print('''a\n''');\n}"
+        spaced = "void main() {\n  print('''a   \n''');\n}"
+        self.assertNotEqual(source_hash(code), source_hash(spaced))
+
+
+if __name__ == '__main__':
+    unittest.main()
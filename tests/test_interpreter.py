@@ -0,0 +1,89 @@
+"""Интерпретатор подмножества Dart: программы, которые компилятор Dart
+отвергает, не выполняются, а уходят в Dart VM (Unsupported).
+
+Запуск: python -m pytest tests (или python -m unittest discover tests)
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execution.interpreter import Unsupported, interpret  # noqa: E402
+
+
+class CompileErrorTest(unittest.TestCase):
+    def assertRejected(self, source):
+        with self.assertRaises(Unsupported):
+            interpret(source)
+
+    def test_missing_return(self):
+        self.assertRejected('int f(int a) { if (a > 0) return 1; }\nvoid main() { print(f(1)); }')
+
+    def test_return_without_value(self):
+        self.assertRejected('int f() { return; }\nvoid main() { print(1); }')
+
+    def test_implicit_downcast(self):
+        self.assertRejected('void main() { num n = 1; int i = n; print(i); }')
+
+    def test_int_to_double(self):
+        self.assertRejected('void main() { int i = 1; double d = i; print(d); }')
+
+    def test_compound_assignment_type(self):
+        self.assertRejected('void main() { int i = 1; i /= 2; print(i); }')
+
+    def test_nullable_map_value(self):
+        self.assertRejected("void main() { Map<String, int> m = {'a': 1}; int x = m['a']; print(x); }")
+
+    def test_argument_type(self):
+        self.assertRejected("void f(int x) { print(x); }\nvoid main() { f('a'); }")
+
+    def test_error_in_branch_not_taken(self):
+        self.assertRejected('void main() { if (false) { int i = 1.5; } print(1); }')
+
+    def test_integer_literal_out_of_range(self):
+        self.assertRejected('void main() { print(9223372036854775808); }')
+        self.assertRejected('void main() { print(0x1FFFFFFFFFFFFFFFF); }')
+
+    def test_return_value_from_void_function(self):
+        self.assertRejected("void f() { return 1; }\nvoid main() { f(); print('x'); }")
+
+    def test_void_result_used(self):
+        self.assertRejected('void f() {}\nvoid main() { print(f()); }')
+        self.assertRejected("void main() { var x = print('a'); }")
+        self.assertRejected('void main() { List<int> a = []; print(a.add(1)); }')
+
+    def test_condition_not_bool(self):
+        self.assertRejected('void main() { int i = 1; if (i) print(1); }')
+
+
+class AcceptedTest(unittest.TestCase):
+    def test_definite_return(self):
+        self.assertEqual(interpret(
+            'int f(int a) { if (a > 0) return 1; else return 2; }\n'
+            'int g() { while (true) { return 3; } }\n'
+            'int? h() {}\n'
+            'void main() { print(f(0)); print(g()); print(h()); }'), '2\n3\nnull')
+
+    def test_integer_literal_bounds(self):
+        self.assertEqual(interpret('void main() { print(-9223372036854775808); print(0xFFFFFFFFFFFFFFFF); }'),
+                         '-9223372036854775808\n-1')
+
+    def test_numeric_assignments(self):
+        self.assertEqual(interpret(
+            'void main() { int i = 1; num n = i; double d = 2; d += 1; n = 1.5; print(n); print(d); }'),
+            '1.5\n3.0')
+
+    def test_void_in_statement_positions(self):
+        self.assertEqual(interpret(
+            "void f() => print('a');\n"
+            "void g() { return print('b'); }\n"
+            "void main() { f(); g(); true ? print('c') : print('d'); }"), 'a\nb\nc')
+
+    def test_null_coalescing_and_parse(self):
+        self.assertEqual(interpret(
+            "void main() { int? x; int y = x ?? 3; int z = int.parse('4'); print(y + z); }"), '7')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""POST /api/jobs: проверка тела запроса и готовый результат в ответе.
+
+Запуск: python -m pytest tests (или python -m unittest discover tests)
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Отдельная база в памяти - до импорта приложения
+os.environ['DATABASE_URL'] = 'sqlite://'
+
+import app as application  # noqa: E402
+
+
+class SubmitJobTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with application.app.app_context():
+            application.db.create_all()
+
+    def setUp(self):
+        self.client = application.app.test_client()
+
+    def assertBadRequest(self, response):
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.get_json()['success'])
+
+    def test_body_is_not_json(self):
+        self.assertBadRequest(self.client.post('/api/jobs', data='code', content_type='text/plain'))
+
+    def test_body_is_null(self):
+        self.assertBadRequest(self.client.post('/api/jobs', data='null', content_type='application/json'))
+
+    def test_code_is_missing(self):
+        self.assertBadRequest(self.client.post('/api/jobs', json={'lesson_id': 1}))
+
+    def test_fast_result_is_inline(self):
+        response = self.client.post('/api/jobs', json={'code': "void main() { print('inline'); }"})
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['status'], 'done')
+        self.assertEqual(data['output'], 'inline')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Протокол рабочего процесса пула: разбор кадров в выводе программы.
+
+Запуск: python -m pytest tests (или python -m unittest discover tests)
+"""
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execution.limits import ResourceLimits  # noqa: E402
+from execution.pool import DartWorker, DartWorkerPool  # noqa: E402
+
+
+class FakeProcess:
+    def __init__(self, stdout):
+        self.stdout = io.BytesIO(stdout)
+
+
+class ReadStdoutTest(unittest.TestCase):
+    """Поток stdout в том виде, в каком его пишет runner.dart"""
+
+    def read(self, program_output):
+        worker = DartWorker('dart', tempfile.gettempdir(), ResourceLimits())
+        token = worker._token.encode('ascii')
+        end = b'{"id":"1","status":"ok","error":""}'
+        worker.process = FakeProcess(b'\n' + token + b' READY\n' + program_output
+                                     + b'\n' + token + b' END ' + end + b'\n')
+        worker._read_stdout()
+        events = []
+        while not worker._events.empty():
+            events.append(worker._events.get_nowait())
+        self.assertTrue(worker._ready.is_set())
+        self.assertEqual(events[-2:], [('end', {'id': '1', 'status': 'ok', 'error': ''}), ('eof', None)])
+        return [payload for kind, payload in events[:-2]]
+
+    def test_output_without_trailing_newline(self):
+        self.assertEqual(self.read(b'a\nx'), ['a', 'x'])
+
+    def test_output_with_trailing_newline(self):
+        self.assertEqual(self.read(b'a\nb\n'), ['a', 'b'])
+
+    def test_blank_lines_are_kept(self):
+        self.assertEqual(self.read(b'a\n\n\nb\n\n'), ['a', '', '', 'b', ''])
+
+    def test_no_output(self):
+        self.assertEqual(self.read(b''), [])
+
+
+@unittest.skipUnless(shutil.which('dart'), 'Dart SDK не установлен')
+class DartPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = DartWorkerPool(size=1, incremental_compiler=False,
+                                   limits=ResourceLimits(wall_seconds=20))
+        self.addCleanup(self.pool.shutdown)
+
+    def test_output_without_trailing_newline(self):
+        code = "import 'dart:io';\nvoid main() { print('a'); stdout.write('x'); }"
+        result = self.pool.run(code)
+        self.assertTrue(result['success'], result)
+        self.assertEqual(result['output'], 'a\nx')
+        self.assertNotIn('timed_out', result)
+        # Рабочий процесс не перезапускался и готов к следующей программе
+        result = self.pool.run("void main() { print('b'); }")
+        self.assertEqual(result['output'], 'b')
+
+
+if __name__ == '__main__':
+    unittest.main()
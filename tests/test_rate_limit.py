@@ -0,0 +1,59 @@
+"""Лимит запусков для пакетного выполнения: списывается полная стоимость пакета.
+
+Запуск: python -m pytest tests (или python -m unittest discover tests)
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Отдельная база в памяти и лимиты в памяти процесса - до импорта приложения
+os.environ['DATABASE_URL'] = 'sqlite://'
+os.environ['RATELIMIT_STORAGE_URL'] = 'memory://'
+
+import app as application  # noqa: E402
+
+PROGRAM = "void main() { print('ok'); }"
+
+
+class BatchRateLimitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with application.app.app_context():
+            application.db.create_all()
+
+    def setUp(self):
+        # Другие тесты могли импортировать приложение раньше, с иным окружением
+        application.app.config['RATELIMIT_ENABLED'] = True
+        self.client = application.app.test_client()
+        with application.app.app_context():
+            user = application.User(username=f'user{self.id()}', email=f'{self.id()}@example.com')
+            user.set_password('secret')
+            application.db.session.add(user)
+            application.db.session.commit()
+            user_id = user.id
+        with self.client.session_transaction() as session:
+            session['_user_id'] = str(user_id)
+        self.capacity = application.user_rate_limiter.capacity
+        self.assertLess(self.capacity, application.ip_rate_limiter.capacity)
+
+    def batch(self, size):
+        return self.client.post('/api/execute_dart/batch', json={'programs': [PROGRAM] * size})
+
+    def test_oversized_batch_is_rejected(self):
+        response = self.batch(self.capacity + 1)
+        self.assertEqual(response.status_code, 400)
+        # Отклоненный пакет не тратит лимит: помещающийся пакет проходит
+        self.assertEqual(self.batch(self.capacity).status_code, 200)
+
+    def test_batch_charges_every_program(self):
+        response = self.batch(self.capacity)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()['results']), self.capacity)
+        self.assertEqual(response.headers['X-RateLimit-Remaining'], '0')
+        self.assertEqual(self.batch(1).status_code, 429)
+
+
+if __name__ == '__main__':
+    unittest.main()
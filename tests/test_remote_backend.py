@@ -0,0 +1,133 @@
+"""RemoteBackend против локального HTTP-сервера, имитирующего API JDoodle.
+
+Запуск: python -m pytest tests (или python -m unittest discover tests)
+"""
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execution.backends import (  # noqa: E402
+    BackendChain, BackendUnavailable, CircuitBreaker, RemoteBackend, SimulatorBackend,
+)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.server.requests.append(json.loads(self.rfile.read(length)))
+        # Очередь ответов задается тестом; последний ответ повторяется
+        responses = self.server.responses
+        status, data = responses.pop(0) if len(responses) > 1 else responses[0]
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RemoteBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        self.server.requests = []
+        self.server.responses = [(200, {'output': 'ok\n', 'statusCode': 200})]
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/execute'
+
+    def backend(self, **options):
+        options.setdefault('retries', 2)
+        options.setdefault('backoff', 0)
+        backend = RemoteBackend(self.url, client_id='id', client_secret='secret',
+                                version_index='4', **options)
+        self.addCleanup(backend.session.close)
+        return backend
+
+    def test_success(self):
+        self.server.responses = [(200, {'output': 'a\nb\n', 'statusCode': 200})]
+        lines = []
+        result = self.backend().run('void main() {}', on_output=lambda stream, line: lines.append(line))
+        self.assertTrue(result['success'])
+        self.assertEqual(result['output'], 'a\nb')
+        self.assertEqual(lines, ['a', 'b'])
+        self.assertEqual(self.server.requests, [{
+            'clientId': 'id', 'clientSecret': 'secret', 'script': 'void main() {}',
+            'language': 'dart', 'versionIndex': '4',
+        }])
+
+    def test_compile_error(self):
+        self.server.responses = [(200, {'output': 'Error: x', 'isCompiled': False})]
+        result = self.backend().run('void main() {')
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error'], 'Error: x')
+
+    def test_retries_server_errors_and_429(self):
+        self.server.responses = [(503, {}), (429, {}), (200, {'output': 'ok'})]
+        result = self.backend(retries=2).run('code')
+        self.assertTrue(result['success'])
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_gives_up_after_retries(self):
+        self.server.responses = [(500, {})]
+        with self.assertRaises(BackendUnavailable):
+            self.backend(retries=1).run('code')
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_error_in_response_is_not_retried(self):
+        self.server.responses = [(200, {'error': 'Daily limit reached', 'statusCode': 429})]
+        backend = self.backend()
+        result = backend.run('code')
+        self.assertFalse(result['success'])
+        self.assertIn('Daily limit reached', result['error'])
+        self.assertEqual(len(self.server.requests), 1)
+        # Ответ сервиса - не сбой связи, размыкатель остается замкнутым
+        self.assertEqual(backend.breaker.state, 'closed')
+
+    def test_breaker_opens_and_recovers(self):
+        self.server.responses = [(500, {})]
+        backend = self.backend(retries=0, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=0.2))
+        for _ in range(2):
+            with self.assertRaises(BackendUnavailable):
+                backend.run('code')
+        self.assertEqual(backend.breaker.state, 'open')
+        self.assertFalse(backend.available)
+        with self.assertRaises(BackendUnavailable):
+            backend.run('code')
+        self.assertEqual(len(self.server.requests), 2)
+
+        # Неудачный пробный вызов снова размыкает цепь
+        time.sleep(0.25)
+        self.assertEqual(backend.breaker.state, 'half_open')
+        with self.assertRaises(BackendUnavailable):
+            backend.run('code')
+        self.assertEqual(backend.breaker.state, 'open')
+
+        # Удачный пробный вызов ее замыкает
+        time.sleep(0.25)
+        self.server.responses = [(200, {'output': 'ok'})]
+        self.assertTrue(backend.run('code')['success'])
+        self.assertEqual(backend.breaker.state, 'closed')
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_chain_falls_back_to_simulator(self):
+        self.server.responses = [(502, {})]
+        chain = BackendChain([self.backend(retries=0), SimulatorBackend()])
+        result = chain.run("void main() { print('hi'); }")
+        self.assertEqual(result['backend'], 'simulator')
+        self.assertTrue(result['fallback'])
+
+
+if __name__ == '__main__':
+    unittest.main()